@@ -0,0 +1,304 @@
+"""Benchmarks for macos_releases.
+
+Run all benchmarks with `python bench_macos_releases.py`, or name one
+or more of them (without the `bench_` prefix) on the command line."""
+
+import collections
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import plistlib
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import macos_releases
+
+
+class _DictOS:
+    """The original, unslotted release record, for comparison."""
+
+    def __init__(self, product, name, version, build, darwin=None, kernel=None, date=None):
+        self.product = product
+        self.name = name
+        self.version = version
+        self.build = build
+        self.darwin = darwin
+        self.kernel = kernel
+        self.date = date
+
+
+def _allocation(cls, fields, copies):
+    """Return (bytes, seconds) per instance to construct copies of fields."""
+    start = time.perf_counter()
+    records = [cls(*f) for _ in range(copies) for f in fields]
+    elapsed = time.perf_counter() - start
+    del records
+
+    tracemalloc.start()
+    records = [cls(*f) for _ in range(copies) for f in fields]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(records), elapsed / len(records)
+
+
+def bench_record():
+    """Memory and construction cost of OS records versus the original class."""
+    fields = [r._fields() for r in macos_releases._BUILDS]
+    copies = 200
+    for label, cls in (("dict", _DictOS), ("slots", macos_releases.OS)):
+        per_record, elapsed = _allocation(cls, fields, copies)
+        print(f"record/{label}: {per_record:.0f} bytes/instance, {elapsed * 1e9:.0f} ns/instance")
+
+
+def _latency(function, repeat):
+    """Return mean seconds per call of function."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def bench_host_version():
+    """Latency of reading SystemVersion.plist versus running sw_vers."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "SystemVersion.plist")
+        if os.path.exists(macos_releases.SYSTEM_VERSION_PLIST):
+            path = macos_releases.SYSTEM_VERSION_PLIST
+        else:
+            with open(path, "wb") as f:
+                plistlib.dump({"ProductName": "macOS", "ProductVersion": "13.6.4", "ProductBuildVersion": "22G513"}, f)
+
+        plist = _latency(lambda: macos_releases._read_system_version(path), 2000)
+        popen = _latency(macos_releases._read_sw_vers, 50)
+    print(f"host_version/plist: {plist * 1e6:.1f} us/call")
+    print(f"host_version/popen: {popen * 1e6:.1f} us/call")
+
+
+def bench_lookup_many():
+    """Rows per second for lookup_many() versus a loop over lookup()."""
+    releases = macos_releases._BUILDS
+    # Skewed towards recent releases, as fleet inventories are.
+    rows = [(r.build, r.darwin, r.kernel) for r in releases[-40:]] * 2400 + \
+           [(r.build, r.darwin, r.kernel) for r in releases[:-40]] * 10
+
+    def naive():
+        return [macos_releases.lookup(**{k: v for k, v in zip(("build", "darwin", "kernel"), row) if v is not None})
+                for row in rows]
+
+    for label, function in (("lookup", naive), ("lookup_many", lambda: macos_releases.lookup_many(rows))):
+        elapsed = _latency(function, 3)
+        print(f"lookup_many/{label}: {len(rows) / elapsed:,.0f} rows/s")
+
+
+def bench_histogram():
+    """Hosts per second counted by ReleaseHistogram versus lookup() per host into a Counter."""
+    releases = macos_releases._BUILDS
+    rows = [(r.build, r.darwin, r.kernel) for r in releases[-40:]] * 25000 + \
+           [(r.build, r.darwin, r.kernel) for r in releases[:-40]] * 100
+
+    def naive():
+        counts = collections.Counter()
+        for row in rows:
+            for r in macos_releases.lookup(**{k: v for k, v in zip(("build", "darwin", "kernel"), row) if v is not None}):
+                counts[r.name, r.version] += 1
+        return counts
+
+    def histogram():
+        return macos_releases.ReleaseHistogram(rows).counts("name", "version")
+
+    for label, function in (("lookup", naive), ("histogram", histogram)):
+        tracemalloc.start()
+        elapsed = _latency(function, 1)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"histogram/{label}: {len(rows) / elapsed:,.0f} hosts/s, {peak / 1024:.0f} KiB peak")
+
+
+def bench_columnar():
+    """Rows per second mapping 10^6 (darwin, build) pairs to releases, per-row lookup() versus columnar."""
+    try:
+        import numpy
+    except ImportError:
+        print("columnar: skipped, NumPy is not installed")
+        return
+
+    releases = macos_releases._BUILDS
+    rows = [(r.darwin, r.build) for r in releases[-40:]] * 24000 + [(r.darwin, r.build) for r in releases[:-40]] * 20
+    rows = rows[:10 ** 6]
+    darwins = numpy.array([d for d, _ in rows])
+    builds = numpy.array([b for _, b in rows])
+    columns = macos_releases.columnar_table()
+
+    def per_row():
+        return [macos_releases.lookup(darwin=d, build=b) for d, b in rows]
+
+    codes = columns.encode("darwin", darwins), columns.encode("build", builds)
+    for label, function in (("lookup", per_row),
+                            ("strings", lambda: columns.match_rows(darwin=darwins, build=builds)),
+                            ("codes", lambda: columns.match_rows(darwin=codes[0], build=codes[1]))):
+        elapsed = _latency(function, 1)
+        print(f"columnar/{label}: {len(rows) / elapsed:,.0f} rows/s")
+
+
+def bench_arrow():
+    """Rows per second resolving 10^6 Darwin versions, per-row getMacOSRelease() versus resolve_column()."""
+    try:
+        import pyarrow
+    except ImportError:
+        print("arrow: skipped, pyarrow is not installed")
+        return
+
+    releases = macos_releases._BUILDS
+    darwins = ([r.darwin for r in releases[-40:]] * 25000)[:10 ** 6]
+    column = pyarrow.array(darwins).dictionary_encode()
+
+    def per_row():
+        return [macos_releases.getMacOSRelease(d) for d in darwins]
+
+    for label, function in (("loop", per_row), ("resolve_column", lambda: macos_releases.resolve_column(column))):
+        elapsed = _latency(function, 1)
+        print(f"arrow/{label}: {len(darwins) / elapsed:,.0f} rows/s")
+
+
+def bench_uname():
+    """Strings per second for parse_uname_version(), and resolve_uname_versions() with repeats."""
+    template = "Darwin Kernel Version {}: {}; root:{}/RELEASE_ARM64_T{}"
+    dated = [r for r in macos_releases._BUILDS if r.kernel]
+    versions = [template.format(r.darwin, r.date, r.kernel, 6000 + i % 2000)
+                for i, r in enumerate(dated * 3000)]
+    parse = _latency(lambda: [macos_releases.parse_uname_version(v) for v in versions], 3)
+    versions[::100] = ["garbage"] * len(versions[::100])
+    resolve = _latency(lambda: list(macos_releases.resolve_uname_versions(versions)), 3)
+    print(f"uname/parse: {len(versions) / parse:,.0f} strings/s")
+    print(f"uname/resolve: {len(versions) / resolve:,.0f} strings/s")
+
+
+def bench_threads():
+    """Lookups per second from a ThreadPoolExecutor, scaling from 1 to N threads."""
+    builds = [r.build for r in macos_releases._BUILDS]
+    per_task = 20000
+    # At least four threads, to show contention even on small machines.
+    limit = max(os.cpu_count() or 1, 4)
+    counts = [1]
+    while counts[-1] < limit:
+        counts.append(min(counts[-1] * 2, limit))
+
+    def task(offset):
+        lookup = macos_releases.lookup
+        for i in range(per_task):
+            lookup(build=builds[(offset + i) % len(builds)])
+
+    gil = "disabled" if getattr(sys, "_is_gil_enabled", lambda: True)() is False else "enabled"
+    for count in counts:
+        with concurrent.futures.ThreadPoolExecutor(count) as pool:
+            start = time.perf_counter()
+            list(pool.map(task, range(0, count * 4 * 97, 97)))
+            elapsed = time.perf_counter() - start
+        print(f"threads/{count}: {count * 4 * per_task / elapsed:,.0f} lookups/s (GIL {gil})")
+
+
+def bench_server():
+    """Requests per second from keep-alive clients of a local ReleaseServer."""
+    import asyncio
+
+    builds = [r.build for r in macos_releases._BUILDS]
+    clients, per_client = 16, 500
+
+    async def client(address, offset, headers):
+        reader, writer = await asyncio.open_connection(*address)
+        for i in range(per_client):
+            build = builds[(offset + i) % len(builds)]
+            writer.write(f"GET /lookup?build={build} HTTP/1.1\r\nHost: localhost\r\n{headers}\r\n".encode())
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+            await reader.readexactly(length)
+        writer.close()
+
+    async def run():
+        server = await macos_releases.ReleaseServer().start(port=0)
+        async with server:
+            address = server.sockets[0].getsockname()[:2]
+            etag = f'If-None-Match: "{macos_releases.dataset_version()}"\r\n'
+            for label, headers in (("cold", ""), ("cached", ""), ("not_modified", etag)):
+                start = time.perf_counter()
+                await asyncio.gather(*(client(address, i * 31, headers) for i in range(clients)))
+                elapsed = time.perf_counter() - start
+                print(f"server/{label}: {clients * per_client / elapsed:,.0f} requests/s")
+
+    asyncio.run(run())
+
+
+def bench_supplement():
+    """Time to publish supplementary releases, updating warm indexes versus rebuilding them."""
+    releases = [{"product": "macOS", "name": "Sequoia", "version": f"15.{i}", "build": f"24A{100 + i}",
+                 "darwin": "24.0.0"} for i in range(10)]
+
+    def warm():
+        macos_releases.lookup(build="22G513")
+        macos_releases.lookup(build=macos_releases.Prefix("22G"))
+        macos_releases.lookup_range("version", "13", "14")
+        macos_releases.latest_release(1.7e9)
+        macos_releases.getMacOSRelease("22.6.0")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "extra.json")
+        with open(path, "w") as f:
+            json.dump(releases, f)
+
+        repeat = 50
+        incremental = rebuild = 0
+        for _ in range(repeat):
+            macos_releases.load_supplement(None)
+            warm()
+            start = time.perf_counter()
+            macos_releases.load_supplement(path)
+            incremental += time.perf_counter() - start
+
+            builds = macos_releases._builds()
+            start = time.perf_counter()
+            macos_releases._SNAPSHOT = macos_releases._Snapshot(builds)
+            warm()
+            rebuild += time.perf_counter() - start
+        macos_releases.load_supplement(None)
+
+    print(f"supplement/incremental: {incremental / repeat * 1e3:.2f} ms/reload, including validation")
+    print(f"supplement/rebuild: {rebuild / repeat * 1e3:.2f} ms/reload, excluding validation")
+
+
+def _worker_startup(name):
+    """Return (seconds, max RSS in KiB) to load the table and answer a lookup."""
+    start = time.perf_counter()
+    if name:
+        macos_releases.attach_table(name)
+    macos_releases.lookup(build="22G513")
+    return time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def bench_shared_table():
+    """Per-worker table startup time and RSS, attaching to shared memory versus loading."""
+    block = macos_releases.share_table()
+    try:
+        for label, name in (("load", None), ("attach", block.name)):
+            context = multiprocessing.get_context("spawn")
+            with concurrent.futures.ProcessPoolExecutor(4, mp_context=context) as pool:
+                results = list(pool.map(_worker_startup, [name] * 4))
+            elapsed = sum(r[0] for r in results) / len(results)
+            rss = sum(r[1] for r in results) / len(results)
+            print(f"shared_table/{label}: {elapsed * 1e3:.2f} ms/worker, {rss / 1024:.1f} MiB max RSS")
+    finally:
+        block.close()
+        block.unlink()
+
+
+def main(argv):
+    names = argv or [name[6:] for name in globals() if name.startswith("bench_")]
+    for name in names:
+        globals()["bench_" + name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
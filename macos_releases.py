@@ -21,27 +21,113 @@
 
 __all__ = ["OS",
            "lookup",
+           "In",
+           "Prefix",
+           "Not",
+           "lookup_many",
+           "ReleaseHistogram",
+           "ColumnarTable",
+           "columnar_table",
+           "to_arrow",
+           "to_pandas",
+           "resolve_column",
+           "LookupCache",
+           "CacheInfo",
+           "cached_lookup",
+           "lookup_range",
+           "search_prefix",
+           "NearestRelease",
+           "resolve_nearest",
+           "version_key",
+           "build_key",
+           "latest_release",
+           "lookup_dates",
            "get_host_os",
-           "getMacOSRelease"]
-
-import datetime
-import email.utils
+           "get_host_os_async",
+           "clear_host_os_cache",
+           "getMacOSRelease",
+           "UnameVersion",
+           "UnameResolution",
+           "parse_uname_version",
+           "resolve_uname_versions",
+           "validate_table",
+           "compile_table",
+           "share_table",
+           "attach_table",
+           "load_supplement",
+           "SupplementWatcher",
+           "watch_supplement",
+           "sortable_key",
+           "ExportCounts",
+           "export_sqlite",
+           "SQLiteBackend",
+           "dataset_version",
+           "ReleaseServer",
+           "serve"]
+
+import bisect
+import collections
+import functools
+import itertools
+import math
 import os
-from typing import Optional, Sequence
+import re
+import struct
+import sys
+import threading
+from typing import TYPE_CHECKING, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# The release table and the modules below load on first use, to keep
+# importing this module cheap; see _snapshot().
+if TYPE_CHECKING:
+    import datetime
+
+
+_ATTRIBUTES = ("product", "name", "version", "build", "darwin", "kernel", "date")
 
 
 class OS:
-    """ """
+    """An immutable release record.
+
+    Instances compare equal when all their attributes are equal, and
+    can be used as dictionary keys or set members."""
+
+    __slots__ = _ATTRIBUTES
 
     def __init__(self, product: str, name: str, version: str, build: str, darwin: str = None, kernel: str = None, date: str = None):
         """(Internal) Constructor."""
-        self.product = product
-        self.name = name
-        self.version = version
-        self.build = build
-        self.darwin = darwin
-        self.kernel = kernel
-        self.date = date
+        setter = object.__setattr__
+        setter(self, "product", product)
+        setter(self, "name", name)
+        setter(self, "version", version)
+        setter(self, "build", build)
+        setter(self, "darwin", darwin)
+        setter(self, "kernel", kernel)
+        setter(self, "date", date)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Cannot set attribute [{key}] of immutable OS instance")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"Cannot delete attribute [{key}] of immutable OS instance")
+
+    def _fields(self) -> tuple:
+        """(Internal) Return attribute values as a tuple."""
+        return (self.product, self.name, self.version, self.build, self.darwin, self.kernel, self.date)
+
+    def __eq__(self, other):
+        if other.__class__ is not OS:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self):
+        return hash(self._fields())
+
+    def __reduce__(self):
+        return (OS, self._fields())
+
+    def __repr__(self):
+        return "OS(" + ", ".join(repr(value) for value in self._fields()) + ")"
 
     @property
     def full_name(self) -> str:
@@ -49,605 +135,1899 @@ class OS:
         return f"{self.product} {self.name} {self.version}"
 
     @property
-    def datetime(self) -> Optional[datetime.datetime]:
+    def datetime(self) -> Optional["datetime.datetime"]:
         """Return the kernel build date as a datetime, or None."""
-        try:
-            return email.utils.parsedate_to_datetime(self.date)
-        except:
-            return None
+        return _parse_date(self.date)[0]
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        """Return the kernel build date as seconds since the epoch, or None."""
+        return _parse_date(self.date)[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_date(date: Optional[str]) -> (Optional["datetime.datetime"], Optional[float]):
+    """(Internal) Return datetime and epoch timestamp for a kernel build date, or Nones.
+
+    Dates are shared by several releases, so parsing is cached."""
+    import email.utils
+
+    if date is None:
+        return None, None
+    try:
+        when = email.utils.parsedate_to_datetime(date)
+    except (TypeError, ValueError):
+        return None, None
+    return when, when.timestamp()
+
+
+# Guards lazy construction of the release table and everything derived
+# from it, so each is built exactly once, and replacement of the table.
+# Readers don't take the lock: snapshots are immutable (tuples, and dicts
+# never changed once assigned), and are only published once complete.
+_LOAD_LOCK = threading.RLock()
+
+# The current release table snapshot, and the built-in one it extends
+# with any supplementary releases; see _snapshot() and load_supplement().
+_SNAPSHOT = None
+_BASE_SNAPSHOT = None
+
+# Location of the host's software version property list, as read by sw_vers.
+SYSTEM_VERSION_PLIST = "/System/Library/CoreServices/SystemVersion.plist"
+
+# Fields of a uname(3) version string; see parse_uname_version().
+_UNAME_VERSION = re.compile(r"(.*?): (.*?); [^:]*:([^/]*)/(.*)$")
+
+# Memoized result of get_host_os(), and the lock serialising its detection.
+_HOST_OS = None
+_HOST_OS_LOCK = threading.Lock()
+
+# Pre-release stages, ordered before the release itself; see version_key().
+_PRERELEASE = re.compile(r"(DP|Beta|B|RC)\s*(\d*)$", re.IGNORECASE)
+_STAGES = {"dp": 0, "beta": 1, "b": 1, "rc": 2}
+_RELEASE = 3
+
+# Build number structure; see build_key().
+_BUILD = re.compile(r"(\d+)([A-Z])(\d+)([a-z]*)$")
+
+
+# Compiled release table; see compile_table().
+ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "macos_releases.dat")
+
+_ARTIFACT_HEADER = struct.Struct("=8sIIIIIII")
+_ARTIFACT_MAGIC = b"MACOSREL"
+_ARTIFACT_VERSION = 1
+_BYTE_ORDER_MARK = 0x01020304
 
 
 # Sources
 #  Wikipedia
 #  betawiki.net
 
-_BUILDS = [
-    # Pre-releases
-    OS("Mac OS X", "Beaker",  "10.0 DP1", "Beaker1N5", "1.0", "xnu-24.6.obj~2", "Fri Apr 30 23:26:14 PDT 1999"), # v521
-    OS("Mac OS X", "Beaker",  "10.0 DP1", "Beaker1P2", "1.0", "xnu-25.1.obj~5", "Wed May 19 01:31:37 PDT 1999"),
-    OS("Mac OS X", "Beaker",  "10.0 DP2", "???", "1.0", "xnu-44.obj~1", "Mon Oct 25 23:31:09 PDT 1999"),
-    OS("Mac OS X", "Bunsen",  "10.0 DP3", "???", "1.0"),
-    OS("Mac OS X", "Gonzo",   "10.0 DP4", "???", "1.1"),
-    OS("Mac OS X", "Cheetah", "10.0 Beta", "1H39", "1.2.1"),
-    OS("Mac OS X", "Cheetah", "10.0 Beta", "2E14", "1.2.1"),
-
-    # Cheetah
-    OS("Mac OS X", "Cheetah", "10.0",   "4K78", "1.3"),  # RTM
-    OS("Mac OS X", "Cheetah", "10.0",   "1P2",  "1.3"),  # Server Beta
-    OS("Mac OS X", "Cheetah", "10.0",   "1W2",  "1.3"),  # Server Beta
-    OS("Mac OS X", "Cheetah", "10.0.1", "4L5",  "1.3.1"),
-    OS("Mac OS X", "Cheetah", "10.0.1", "4L7",  "1.3.1"),
-    OS("Mac OS X", "Cheetah", "10.0.1", "4L8",  "1.3.1"),
-    OS("Mac OS X", "Cheetah", "10.0.1", "4L13", "1.3.1"),
-    OS("Mac OS X", "Cheetah", "10.0.2", "4P12", "1.3.1"),
-    OS("Mac OS X", "Cheetah", "10.0.3", "4P13", "1.3.1"),
-    OS("Mac OS X", "Cheetah", "10.0.3", "4M23", "1.3.1"),
-    OS("Mac OS X", "Cheetah", "10.0.4", "2G7",  "1.3.1"),
-    OS("Mac OS X", "Cheetah", "10.0.4", "4Q12", "1.3.1"),
-    OS("Mac OS X", "Cheetah", "10.0.4", "4R14", "1.3.1"), # PowerMac G4
-    OS("Mac OS X", "Cheetah", "10.0.4", "4R15", "1.3.1"), # iMac
-    OS("Mac OS X", "Cheetah", "10.0.4", "4S10", "1.3.1"), # PowerMac G4
-
-    # Puma
-    OS("Mac OS X", "Puma", "10.1", "5G64", "1.4.1"),
-    OS("Mac OS X", "Puma", "10.1.1", "5M28", "5.1"),
-    OS("Mac OS X", "Puma", "10.1.2", "5P48", "5.2"),
-    OS("Mac OS X", "Puma", "10.1.3", "5Q45", "5.3"),
-    OS("Mac OS X", "Puma", "10.1.4", "5Q125", "5.4"),
-    OS("Mac OS X", "Puma", "10.1.5", "5S60", "5.5"),
-
-    # Jaguar
-    OS("Mac OS X", "Jaguar", "10.2", "6C115", "6.0"),
-    OS("Mac OS X", "Jaguar", "10.2", "6C115a", "6.0"),
-    OS("Mac OS X", "Jaguar", "10.2.1", "6D52", "6.1"),
-    OS("Mac OS X", "Jaguar", "10.2.2", "6F21", "6.2"),
-    OS("Mac OS X", "Jaguar", "10.2.3", "6G30", "6.3"),
-    OS("Mac OS X", "Jaguar", "10.2.3", "6G37", "6.3"),
-    OS("Mac OS X", "Jaguar", "10.2.3", "6G50", "6.3"),
-    OS("Mac OS X", "Jaguar", "10.2.4", "6I32", "6.4"),
-    OS("Mac OS X", "Jaguar", "10.2.5", "6L29", "6.5"),
-    OS("Mac OS X", "Jaguar", "10.2.6", "6L60", "6.6"),
-    OS("Mac OS X", "Jaguar", "10.2.7", "6R65", "6.7"),
-    OS("Mac OS X", "Jaguar", "10.2.8", "6R73", "6.8"),
-    OS("Mac OS X", "Jaguar", "10.2.8", "6S90", "6.8"),
-
-    # Panther
-    OS("Mac OS X", "Panther", "10.3", "7B85", "7.0"),
-    OS("Mac OS X", "Panther", "10.3", "7B86", "7.0"),
-    OS("Mac OS X", "Panther", "10.3.1", "7C107", "7.1"),
-    OS("Mac OS X", "Panther", "10.3.2", "7D24", "7.2"),
-    OS("Mac OS X", "Panther", "10.3.2", "7D28", "7.2"),
-    OS("Mac OS X", "Panther", "10.3.3", "7F44", "7.3"),
-    OS("Mac OS X", "Panther", "10.3.4", "7H63", "7.4"),
-    OS("Mac OS X", "Panther", "10.3.5", "7M34", "7.5"),
-    OS("Mac OS X", "Panther", "10.3.6", "7R28", "7.6"),
-    OS("Mac OS X", "Panther", "10.3.7", "7S215", "7.7"),
-    OS("Mac OS X", "Panther", "10.3.8", "7U16", "7.8"),
-    OS("Mac OS X", "Panther", "10.3.9", "7W98", "7.9"),
-
-    # Tiger
-    OS("Mac OS X", "Tiger", "10.4", "8A428", "8.0"),
-    OS("Mac OS X", "Tiger", "10.4", "8A432", "8.0"),
-    OS("Mac OS X", "Tiger", "10.4.1", "8B15", "8.1"),
-    OS("Mac OS X", "Tiger", "10.4.1", "8B17", "8.1"),
-    OS("Mac OS X", "Tiger", "10.4.2", "8C46", "8.2"),
-    OS("Mac OS X", "Tiger", "10.4.2", "8C47", "8.2"),
-    OS("Mac OS X", "Tiger", "10.4.2", "8E102", "8.2"),
-    OS("Mac OS X", "Tiger", "10.4.2", "8E45", "8.2"),
-    OS("Mac OS X", "Tiger", "10.4.2", "8E90", "8.2"),
-    OS("Mac OS X", "Tiger", "10.4.3", "8F46", "8.3"),
-    OS("Mac OS X", "Tiger", "10.4.4", "8G32", "8.4"),
-    OS("Mac OS X", "Tiger", "10.4.4", "8G1165", "8.4"),
-    OS("Mac OS X", "Tiger", "10.4.5", "8H14", "8.5"),
-    OS("Mac OS X", "Tiger", "10.4.5", "8H1454", "8.5"),
-    OS("Mac OS X", "Tiger", "10.4.6", "8I127", "8.6"),
-    OS("Mac OS X", "Tiger", "10.4.6", "8I1119", "8.6"),
-    OS("Mac OS X", "Tiger", "10.4.7", "8J135", "8.7"),
-    OS("Mac OS X", "Tiger", "10.4.7", "8J2135a", "8.7"),
-    OS("Mac OS X", "Tiger", "10.4.7", "8J1079", "8.7"),
-    OS("Mac OS X", "Tiger", "10.4.7", "8J5107", "8.7"),
-    OS("Mac OS X", "Tiger", "10.4.8", "8L127", "8.8"),
-    OS("Mac OS X", "Tiger", "10.4.8", "8L2127", "8.8"),
-    OS("Mac OS X", "Tiger", "10.4.9", "8P135", "8.9"),
-    OS("Mac OS X", "Tiger", "10.4.9", "8P2137", "8.9"),
-    OS("Mac OS X", "Tiger", "10.4.10", "8R218", "8.10"),
-    OS("Mac OS X", "Tiger", "10.4.10", "8R2218", "8.10"),
-    OS("Mac OS X", "Tiger", "10.4.10", "8R2232", "8.10"),
-    OS("Mac OS X", "Tiger", "10.4.11", "8S165", "8.11"),
-    OS("Mac OS X", "Tiger", "10.4.11", "8S2167", "8.11"),
-
-    # Leopard
-    OS("Mac OS X", "Leopard", "10.5", "9A581", "9.0"),
-    OS("Mac OS X", "Leopard", "10.5.1", "9B18", "9.1"),
-    OS("Mac OS X", "Leopard", "10.5.1", "9B2117", "9.1.1"),
-    OS("Mac OS X", "Leopard", "10.5.2", "9C31", "9.2"),
-    OS("Mac OS X", "Leopard", "10.5.2", "9C7010", "9.2"),
-    OS("Mac OS X", "Leopard", "10.5.3", "9D34", "9.3"),
-    OS("Mac OS X", "Leopard", "10.5.4", "9E17", "9.4"),
-    OS("Mac OS X", "Leopard", "10.5.5", "9F33", "9.5"),
-    OS("Mac OS X", "Leopard", "10.5.6", "9G55", "9.6"),
-    OS("Mac OS X", "Leopard", "10.5.6", "9G66", "9.6"),
-    OS("Mac OS X", "Leopard", "10.5.6", "9G71", "9.6"),
-    OS("Mac OS X", "Leopard", "10.5.7", "9J61", "9.7"),
-    OS("Mac OS X", "Leopard", "10.5.8", "9L30", "9.8"),
-    OS("Mac OS X", "Leopard", "10.5.8", "9L34", "9.8"),
-
-    # Snow Leopard
-    OS("Mac OS X", "Snow Leopard", "10.6", "10A432", "10.0"),
-    OS("Mac OS X", "Snow Leopard", "10.6", "10A433", "10.0"),
-    OS("Mac OS X", "Snow Leopard", "10.6.1", "10B504", "10.1"),
-    OS("Mac OS X", "Snow Leopard", "10.6.2", "10C540", "10.2"),
-    OS("Mac OS X", "Snow Leopard", "10.6.3", "10D573", "10.3"),
-    OS("Mac OS X", "Snow Leopard", "10.6.3", "10D575", "10.3"),
-    OS("Mac OS X", "Snow Leopard", "10.6.3", "10D578", "10.3"),
-    OS("Mac OS X", "Snow Leopard", "10.6.4", "10F569", "10.4"),
-    OS("Mac OS X", "Snow Leopard", "10.6.5", "10H574", "10.5"),
-    OS("Mac OS X", "Snow Leopard", "10.6.6", "10J567", "10.6"),
-    OS("Mac OS X", "Snow Leopard", "10.6.7", "10J869", "10.7"),
-    OS("Mac OS X", "Snow Leopard", "10.6.7", "10J3250", "10.7"),
-    OS("Mac OS X", "Snow Leopard", "10.6.7", "10J4138", "10.7"),
-    OS("Mac OS X", "Snow Leopard", "10.6.8", "10K540", "10.8"),
-    OS("Mac OS X", "Snow Leopard", "10.6.8", "10K549", "10.8"),
-
-    # Lion
-    OS("Mac OS X", "Lion", "10.7", "11A511", "11.0"),
-    OS("Mac OS X", "Lion", "10.7", "11A511s", "11.0"),
-    OS("Mac OS X", "Lion", "10.7", "11A2061", "11.0.2"),
-    OS("Mac OS X", "Lion", "10.7", "11A2063", "11.0.2"),
-    OS("Mac OS X", "Lion", "10.7.1", "11B26", "11.1.0"),
-    OS("Mac OS X", "Lion", "10.7.1", "11B2118", "11.1.0"),
-    OS("Mac OS X", "Lion", "10.7.2", "11C74", "11.2"),
-    OS("Mac OS X", "Lion", "10.7.3", "11D50", "11.3"),
-    OS("Mac OS X", "Lion", "10.7.4", "11E53", "11.4"),
-    OS("Mac OS X", "Lion", "10.7.5", "11G56", "11.4.2"),
-    OS("Mac OS X", "Lion", "10.7.5", "11G63", "11.4.2"),
-
-    # Mountain Lion
-    OS("OS X", "Mountain Lion", "10.8", "12A269", "12.0"),
-    OS("OS X", "Mountain Lion", "10.8.1", "12B19", "12.1"),
-    OS("OS X", "Mountain Lion", "10.8.2", "12C54", "12.2"),
-    OS("OS X", "Mountain Lion", "10.8.2", "12C60", "12.2"),
-    OS("OS X", "Mountain Lion", "10.8.2", "12C2034", "12.2"),
-    OS("OS X", "Mountain Lion", "10.8.2", "12C3104", "12.2"),
-    OS("OS X", "Mountain Lion", "10.8.3", "12D78", "12.3"),
-    OS("OS X", "Mountain Lion", "10.8.4", "12E55", "12.4"),
-    OS("OS X", "Mountain Lion", "10.8.4", "12E3067", "12.4"),
-    OS("OS X", "Mountain Lion", "10.8.4", "12E4022", "12.4"),
-    OS("OS X", "Mountain Lion", "10.8.5", "12F37", "12.5"),
-    OS("OS X", "Mountain Lion", "10.8.5", "12F45", "12.5"),  # FIXME: build 12F45 has both 12.5 and 12.6 Darwin?
-    OS("OS X", "Mountain Lion", "10.8.5", "12F2501", "12.6"),
-    OS("OS X", "Mountain Lion", "10.8.5", "12F2518", "12.6"),
-    OS("OS X", "Mountain Lion", "10.8.5", "12F2542", "12.6"),
-    OS("OS X", "Mountain Lion", "10.8.5", "12F2560", "12.6"),
-
-    # Mavericks
-    OS("OS X", "Mavericks", "10.9", "13A603", "13.0"),
-    OS("OS X", "Mavericks", "10.9.1", "13B42", "13.0"),
-    OS("OS X", "Mavericks", "10.9.2", "13C64", "13.1"),
-    OS("OS X", "Mavericks", "10.9.2", "13C1021", "13.1"),
-    OS("OS X", "Mavericks", "10.9.3", "13D65", "13.2"),
-    OS("OS X", "Mavericks", "10.9.4", "13E28", "13.3"),
-    OS("OS X", "Mavericks", "10.9.5", "13F34", "13.4"),
-    OS("OS X", "Mavericks", "10.9.5", "13F1066", "13.4"),
-    OS("OS X", "Mavericks", "10.9.5", "13F1077", "13.4"),
-    OS("OS X", "Mavericks", "10.9.5", "13F1096", "13.4"),
-    OS("OS X", "Mavericks", "10.9.5", "13F1112", "13.4"),
-    OS("OS X", "Mavericks", "10.9.5", "13F1134", "13.4"),
-    OS("OS X", "Mavericks", "10.9.5", "13F1507", "13.4"),
-    OS("OS X", "Mavericks", "10.9.5", "13F1603", "13.4"),
-    OS("OS X", "Mavericks", "10.9.5", "13F1712", "13.4"),
-    OS("OS X", "Mavericks", "10.9.5", "13F1808", "13.4"),
-    OS("OS X", "Mavericks", "10.9.5", "13F1911", "13.4"),
-
-    # Yosemite
-    OS("OS X", "Yosemite", "10.10", "14A389", "14.0"),
-    OS("OS X", "Yosemite", "10.10.1", "14B25", "14.0"),
-    OS("OS X", "Yosemite", "10.10.2", "14C109", "14.1"),
-    OS("OS X", "Yosemite", "10.10.2", "14C1510", "14.1"),
-    OS("OS X", "Yosemite", "10.10.2", "14C2043", "14.1"),
-    OS("OS X", "Yosemite", "10.10.2", "14C1514", "14.1"),
-    OS("OS X", "Yosemite", "10.10.2", "14C2513", "14.1"),
-    OS("OS X", "Yosemite", "10.10.3", "14D131", "14.3"),
-    OS("OS X", "Yosemite", "10.10.3", "14D136", "14.3"),
-    OS("OS X", "Yosemite", "10.10.4", "14E46", "14.4"),
-    OS("OS X", "Yosemite", "10.10.5", "14F27", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F1021", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F1505", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F1509", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F1605", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F1713", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F1808", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F1909", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F1912", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F2009", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F2109", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F2315", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F2411", "14.5"),
-    OS("OS X", "Yosemite", "10.10.5", "14F2511", "14.5"),
-
-    # El Capitan
-    OS("OS X", "El Capitan", "10.11", "15A284", "15.0.0"),
-    OS("OS X", "El Capitan", "10.11.1", "15B42", "15.0.0"),
-    OS("OS X", "El Capitan", "10.11.2", "15C50", "15.2.0"),
-    OS("OS X", "El Capitan", "10.11.3", "15D21", "15.3.0"),
-    OS("OS X", "El Capitan", "10.11.4", "15E65", "15.4.0"),
-    OS("OS X", "El Capitan", "10.11.5", "15F34", "15.5.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G31", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G1004", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G1011", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G1108", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G1212", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G1217", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G1421", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G1510", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G1611", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G17023", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G18013", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G19009", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G20015", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G21013", "15.6.0"),
-    OS("OS X", "El Capitan", "10.11.6", "15G22010", "15.6.0"),
-
-    # Sierra
-    OS("macOS", "Sierra", "10.12", "16A323", "16.0.0"),
-    OS("macOS", "Sierra", "10.12.1", "16B2555", "16.1.0"),
-    OS("macOS", "Sierra", "10.12.1", "16B2657", "16.1.0"),
-    OS("macOS", "Sierra", "10.12.2", "16C67", "16.3.0"),
-    OS("macOS", "Sierra", "10.12.2", "16C68", "16.3.0"),
-    OS("macOS", "Sierra", "10.12.3", "16D32", "16.4.0"),
-    OS("macOS", "Sierra", "10.12.4", "16E195", "16.5.0"),
-    OS("macOS", "Sierra", "10.12.5", "16F73", "16.6.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G29", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1036", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1114", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1212", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1314", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1408", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1510", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1618", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1710", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1815", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1917", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G1918", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G2016", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G2127", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G2128", "16.7.0"),
-    OS("macOS", "Sierra", "10.12.6", "16G2136", "16.7.0"),
-
-    # High Sierra
-    OS("macOS", "High Sierra", "10.13", "17A365", "17.0.0"),
-    OS("macOS", "High Sierra", "10.13", "17A405", "17.0.0"),
-    OS("macOS", "High Sierra", "10.13.1", "17B48", "17.2.0"),
-    OS("macOS", "High Sierra", "10.13.1", "17B1002", "17.2.0"),
-    OS("macOS", "High Sierra", "10.13.1", "17B1003", "17.2.0"),
-    OS("macOS", "High Sierra", "10.13.2", "17C88", "17.3.0"),
-    OS("macOS", "High Sierra", "10.13.2", "17C89", "17.3.0"),
-    OS("macOS", "High Sierra", "10.13.2", "17C205", "17.3.0"),
-    OS("macOS", "High Sierra", "10.13.2", "17C2205", "17.3.0"),
-    OS("macOS", "High Sierra", "10.13.3", "17D47", "17.4.0"),
-    OS("macOS", "High Sierra", "10.13.3", "17D2047", "17.4.0"),
-    OS("macOS", "High Sierra", "10.13.3", "17D102", "17.4.0"),
-    OS("macOS", "High Sierra", "10.13.3", "17D2102", "17.4.0"),
-    OS("macOS", "High Sierra", "10.13.4", "17E199", "17.5.0"),
-    OS("macOS", "High Sierra", "10.13.4", "17E202", "17.5.0"),
-    OS("macOS", "High Sierra", "10.13.5", "17F77", "17.6.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G65", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G2208", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G2307", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G3025", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G4015", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G5019", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G6029", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G6030", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G7024", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G8029", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G8030", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G8037", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G9016", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G10021", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G11023", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G12034", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G13033", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G13035", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G14019", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G14033", "17.7.0"),
-    OS("macOS", "High Sierra", "10.13.6", "17G14042", "17.7.0"),
-
-    # Mojave
-    OS("macOS", "Mojave", "10.14", "18A391", "18.0.0"),
-    OS("macOS", "Mojave", "10.14.1", "18B75", "18.2.0"),
-    OS("macOS", "Mojave", "10.14.1", "18B2107", "18.2.0"),
-    OS("macOS", "Mojave", "10.14.1", "18B3094", "18.2.0"),
-    OS("macOS", "Mojave", "10.14.2", "18C54", "18.2.0"),
-    OS("macOS", "Mojave", "10.14.3", "18D42", "18.2.0"),
-    OS("macOS", "Mojave", "10.14.3", "18D43", "18.2.0"),
-    OS("macOS", "Mojave", "10.14.3", "18D109", "18.2.0"),
-    OS("macOS", "Mojave", "10.14.4", "18E226", "18.5.0"),
-    OS("macOS", "Mojave", "10.14.4", "18E227", "18.5.0"),
-    OS("macOS", "Mojave", "10.14.5", "18F132", "18.6.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G84", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G87", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G95", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G103", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G1012", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G2022", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G3020", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G4032", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G5033", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G6020", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G6032", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G7016", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G8012", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G8022", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G9028", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G9216", "18.7.0"),
-    OS("macOS", "Mojave", "10.14.6", "18G9323", "18.7.0"),
-
-    # Catalina
-    OS("macOS", "Catalina", "10.15", "19A583", "19.0.0"),
-    OS("macOS", "Catalina", "10.15", "19A602", "19.0.0"),
-    OS("macOS", "Catalina", "10.15", "19A603", "19.0.0"),
-    OS("macOS", "Catalina", "10.15.1", "19B88", "19.0.0"),
-    OS("macOS", "Catalina", "10.15.2", "19C57", "19.2.0"),
-    OS("macOS", "Catalina", "10.15.2", "19C58", "19.2.0"),
-    OS("macOS", "Catalina", "10.15.3", "19D76", "19.3.0"),
-    OS("macOS", "Catalina", "10.15.4", "19E266", "19.4.0"),
-    OS("macOS", "Catalina", "10.15.4", "19E287", "19.4.0"),
-    OS("macOS", "Catalina", "10.15.5", "19F96", "19.5.0"),
-    OS("macOS", "Catalina", "10.15.5", "19F101", "19.5.0"),
-    OS("macOS", "Catalina", "10.15.6", "19G73", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.6", "19G2021", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H2", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H4", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H15", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H114", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H512", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H524", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1030", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1217", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1323", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1417", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1419", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1519", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1615", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1713", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1715", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1824", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H1922", "19.6.0"),
-    OS("macOS", "Catalina", "10.15.7", "19H2026", "19.6.0"),
-
-    # Big Sur
-    OS("macOS", "Big Sur", "10.16 Beta", "20A2261g", "20.0.0"),  # DTK prototype; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A4299v", "20.0.0"),  # Dev beta 1; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5299w", "20.0.0"),  # DTK/SDK/Xcode beta 1; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A4300b", "20.0.0"),  # Dev beta 2; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5323l", "20.0.0"),  # Dev beta 3; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5343i", "20.0.0"),  # Dev beta 4; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5343j", "20.0.0"),  # Public Beta 1; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5354i", "20.0.0"),  # Dev Beta 5/Public Beta 2; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5364e", "20.0.0"),  # Dev Beta 6/Public Beta 3; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5374f", "20.0.0"),  # DTK/SDK/Xcode beta 7; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5374g", "20.0.0"),  # Dev Beta 7; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5374i", "20.0.0"),  # Dev Beta 8/Public Beta 4; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5384c", "20.0.0"),  # Dev Beta 9/Public Beta 5; Darwin unknown
-    OS("macOS", "Big Sur", "10.16 Beta", "20A5395g", "20.0.0"),  # Dev Beta 10/Public Beta 6; Darwin unknown
-    OS("macOS", "Big Sur", "11.0",       "20A2411",  "20.1.0"),  # RTM
-    OS("macOS", "Big Sur", "11.0.1",     "20B5012d", "20.1.0"),  # Beta 1
-    OS("macOS", "Big Sur", "11.0.1",     "20B5022a", "20.1.0"),  # Beta 2 / Release candidate
-    OS("macOS", "Big Sur", "11.0.1",     "20B28",    "20.1.0"),  # Release Candidate 2
-    OS("macOS", "Big Sur", "11.0.1",     "20B29",    "20.1.0"),  # RTM
-    OS("macOS", "Big Sur", "11.0.1",     "20B50",    "20.1.0"),  # Revised update
-    OS("macOS", "Big Sur", "11.1",       "20C69",    "20.2.0"),
-    OS("macOS", "Big Sur", "11.2",       "20D64",    "20.3.0"),
-    OS("macOS", "Big Sur", "11.2.1",     "20D74",    "20.3.0"),
-    OS("macOS", "Big Sur", "11.2.1",     "20D75",    "20.3.0"),
-    OS("macOS", "Big Sur", "11.2.2",     "20D80",    "20.3.0"),
-    OS("macOS", "Big Sur", "11.2.3",     "20D91",    "20.3.0"),
-    OS("macOS", "Big Sur", "11.3",       "20E232",  "20.4.0"),
-    OS("macOS", "Big Sur", "11.3.1",     "20E241",  "20.4.0"),
-    OS("macOS", "Big Sur", "11.4",       "20F71",   "20.5.0"),
-    OS("macOS", "Big Sur", "11.5",       "20G71",   "20.6.0"),
-    OS("macOS", "Big Sur", "11.5.1",     "20G80",   "20.6.0"),
-    OS("macOS", "Big Sur", "11.5.2",     "20G95",   "20.6.0"),
-    OS("macOS", "Big Sur", "11.6",       "20G165",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.6.1",     "20G224",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.6.2",     "20G314",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.6.3",     "20G415",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.6.4",     "20G417",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.6.5",     "20G527",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.6.6",     "20G624",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.6.7",     "20G630",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.6.8",     "20G730",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.7",       "20G817",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.1 RC3", "20G916",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.1",     "20G918",  "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.2",     "20G1020", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.3",     "20G1116", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.4",     "20G1120", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.5 RC",  "20G1205", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.5 RC3", "20G1215", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.5 RC4", "20G1220", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.5",     "20G1225", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.6 RC",  "20G1329", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.6",     "20G1331", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.7 RC3", "20G1338", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.7 RC4", "20G1342", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.7",     "20G1345", "20.6.0"),  # RC5 has same versions
-    OS("macOS", "Big Sur", "11.7.8 RC2", "20G1407", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.9 RC3", "20G1413", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.8",     "20G1351", "20.6.0"),  # check version
-    OS("macOS", "Big Sur", "11.7.9 RC3", "20G1413", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.9 RC4", "20G1416", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.9 RC5", "20G1424", "20.6.0"),
-    OS("macOS", "Big Sur", "11.7.9",     "20G1426", "20.6.0", "xnu-7195.141.49.702.12~1", "Thu Jul  6 22:12:47 PDT 2023"),
-    OS("macOS", "Big Sur", "11.7.10",    "20G1427", "20.6.0", "xnu-7195.141.49.702.12~1", "Thu Jul  6 22:12:47 PDT 2023"),
-
-    # Monterey
-    OS("macOS", "Monterey", "12.0", "21A344", "21.0.1"),
-    OS("macOS", "Monterey", "21.0.1", "21A559", "21.1.0"),
-    OS("macOS", "Monterey", "12.1", "21C52", "21.2.0"),
-    OS("macOS", "Monterey", "12.2", "21D49", "21.3.0"),
-    OS("macOS", "Monterey", "12.2.1", "21D62", "21.3.0"),
-    OS("macOS", "Monterey", "12.3", "21E230", "21.4.0"),
-    OS("macOS", "Monterey", "12.3.1", "21E258", "21.4.0"),
-    OS("macOS", "Monterey", "12.4", "21F79", "21.5.0"),
-    OS("macOS", "Monterey", "12.4", "21F2081", "21.5.0"),
-    OS("macOS", "Monterey", "12.4", "21F2092", "21.5.0"),
-    OS("macOS", "Monterey", "12.5", "21G72", "21.6.0"),
-    OS("macOS", "Monterey", "12.5.1", "21G83", "21.6.0"),
-    OS("macOS", "Monterey", "12.6", "21G115", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.1", "21G217", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.2", "21G320", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.3", "21G419", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.4 RC", "21G506", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.4 RC3", "21G516", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.4 RC4", "21G521", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.4", "21G526", "21.6.0"),  # also RC5
-    OS("macOS", "Monterey", "12.6.5 RC", "21G630", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.5", "21G531", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.6 RC2", "21G633", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.6 RC3", "21G639", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.6 RC4", "21G644", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.6", "21G646", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.7 RC2", "21G708", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.8 RC3", "21G713", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.7", "21G651", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.8 RC4", "21G716", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.8 RC5", "21G724", "21.6.0"),
-    OS("macOS", "Monterey", "12.6.8", "21G725", "21.6.0"), # also RC6
-    OS("macOS", "Monterey", "12.6.9", "21G726", "21.6.0"),
-    OS("macOS", "Monterey", "12.7 RC", "21G808", "21.6.0"),
-    OS("macOS", "Monterey", "12.7 RC2", "21G813", "21.6.0"),
-    OS("macOS", "Monterey", "12.7 RC3", "21G814", "21.6.0"),
-    OS("macOS", "Monterey", "12.7",       "21G816",  "21.6.0"),
-    OS("macOS", "Monterey", "12.7.1 RC",  "21G913",  "21.6.0"),
-    OS("macOS", "Monterey", "12.7.1 RC2", "21G918",  "21.6.0"),
-    OS("macOS", "Monterey", "12.7.1",     "21G920",  "21.6.0"),
-    OS("macOS", "Monterey", "12.7.2 RC",  "21G1925", "21.6.0"),
-    OS("macOS", "Monterey", "12.7.2 RC2", "21G1965", "21.6.0"),
-    OS("macOS", "Monterey", "12.7.2 RC3", "21G1967", "21.6.0"),
-    OS("macOS", "Monterey", "12.7.2 RC4", "21G1971", "21.6.0"),
-    OS("macOS", "Monterey", "12.7.2",     "21G1974", "21.6.0"), # also RC5
-    OS("macOS", "Monterey", "12.7.3 RC",  "21H1006", "21.6.0"),
-    OS("macOS", "Monterey", "12.7.3 RC2", "21H1009", "21.6.0"),
-    OS("macOS", "Monterey", "12.7.3 RC3", "21H1013", "21.6.0"),
-    OS("macOS", "Monterey", "12.7.3",     "21H1015", "21.6.0"), # also RC4
-    OS("macOS", "Monterey", "12.7.4 RC",  "21H1105", "21.6.0"),
-    OS("macOS", "Monterey", "12.7.4 RC2", "21H1111", "21.6.0"),
-
-    # Ventura
-    OS("macOS", "Ventura", "13.0",       "22A380",     "22.1.0", "xnu-8792.41.9~2", "Sun Oct 9 20:15:52 PDT 2022"),
-    OS("macOS", "Ventura", "13.0",       "22A8380",    "22.1.0", "xnu-8792.41.9~2", "Sun Oct 9 20:15:52 PDT 2022"),
-    OS("macOS", "Ventura", "13.0.1",     "22A400",     "22.1.0", "xnu-8792.41.9~2", "Sun Oct 9 20:15:52 PDT 2022"),
-    OS("macOS", "Ventura", "13.1",       "22C65",      "22.2.0", "xnu-8792.61.2~4", "Fri Nov 11 02:06:26 PST 2022"),
-    OS("macOS", "Ventura", "13.2",       "22D49",      "22.3.0", "xnu-8792.81.2~2", "Thu Jan 5 20:53:49 PST 2023"),
-    OS("macOS", "Ventura", "13.2.1",     "22D68",      "22.3.0", "xnu-8792.81.3~2", "Mon Jan 30 20:38:43 PST 2023"),
-    OS("macOS", "Ventura", "13.3",       "22E252",     "22.4.0", "xnu-8796.101.5~3", "Mon Mar 6 20:59:28 PST 2023"),
-    OS("macOS", "Ventura", "13.3.1",     "22E261",     "22.4.0", "xnu-8796.101.5~3", "Mon Mar 6 20:59:28 PST 2023"),
-    OS("macOS", "Ventura", "13.3.1 (a)", "22E772610a", "22.4.0", "xnu-8796.101.5~3", "Mon Mar 6 20:59:28 PST 2023"),
-    OS("macOS", "Ventura", "13.4",       "22F66",      "22.5.0", "xnu-8796.121.2~5", "Mon Apr 24 20:52:43 PDT 2023"),
-    OS("macOS", "Ventura", "13.4.1",     "22F82",      "22.5.0", "xnu-8796.121.3~7", "Thu Jun 8 22:22:22 PDT 2023"),
-    OS("macOS", "Ventura", "13.4.1 (a)", "22F770820b", "22.5.0", "xnu-8796.121.3~7", "Thu Jun 8 22:22:22 PDT 2023"),
-    OS("macOS", "Ventura", "13.4.1 (c)", "22F770820d", "22.5.0", "xnu-8796.121.3~7", "Thu Jun 8 22:22:22 PDT 2023"),
-    OS("macOS", "Ventura", "13.5",       "22G74",      "22.6.0", "xnu-8796.141.3~6", "Wed Jul 5 22:21:56 PDT 2023"),
-    OS("macOS", "Ventura", "13.5.1",     "22G90",      "22.6.0", "xnu-8796.141.3~6", "Wed Jul 5 22:21:56 PDT 2023"),
-    OS("macOS", "Ventura", "13.5.2",     "22G91",      "22.6.0", "xnu-8796.141.3~6", "Wed Jul 5 22:21:56 PDT 2023"),
-    OS("macOS", "Ventura", "13.6",       "22G120",     "22.6.0", "xnu-8796.141.3.700.8~1", "Fri Sep 15 13:39:52 PDT 2023"),
-    OS("macOS", "Ventura", "13.6.1",     "22G313",     "22.6.0", "xnu-8796.141.3.701.17~4", "Wed Oct 4 21:25:26 PDT 2023"),
-    OS("macOS", "Ventura", "13.6.2",     "22G320",     "22.6.0", "xnu-8796.141.3.701.17~6", "Thu Nov 2 07:43:57 PDT 2023"),
-    OS("macOS", "Ventura", "13.6.3",     "22G436",     "22.6.0", "xnu-8796.141.3.702.9~2", "Tue Nov 7 21:48:06 PST 2023"),
-    OS("macOS", "Ventura", "13.6.4",     "22G513",     "22.6.0", "xnu-8796.141.3.703.2~2", "Sun Dec 17 22:18:09 PST 2023"),
-
-    # Sonoma
-    OS("macOS", "Sonoma", "14.0 B1",  "23A5257q", "23.0.0"),
-    OS("macOS", "Sonoma", "14.0 B2",  "23A5276g", "23.0.0"),
-    OS("macOS", "Sonoma", "14.0 B3",  "23A5286g", "23.0.0"),
-    OS("macOS", "Sonoma", "14.0 B3",  "23A5286i", "23.0.0"),
-    OS("macOS", "Sonoma", "14.0 B4",  "23A5301g", "23.0.0"),
-    OS("macOS", "Sonoma", "14.0 B4",  "23A5301h", "23.0.0"),
-    OS("macOS", "Sonoma", "14.0 B5",  "23A5312d", "23.0.0"),
-    OS("macOS", "Sonoma", "14.0 B6",  "23A5328b", "23.0.0"),
-    OS("macOS", "Sonoma", "14.0 B7",  "23A5337a", "23.0.0"),
-    OS("macOS", "Sonoma", "14.0 RC",  "23A339",   "23.0.0"),
-    OS("macOS", "Sonoma", "14.0 RC2", "23A344",   "23.0.0"),
-    OS("macOS", "Sonoma", "14.0",     "23A344",   "23.0.0", "xnu-10002.1.13~1", "Fri Sep 15 14:41:34 PDT 2023"),
-    OS("macOS", "Sonoma", "14.1",     "23B74",    "23.1.0", "xnu-10002.41.9~6", "Mon Oct 9 21:27:27 PDT 2023"),
-    OS("macOS", "Sonoma", "14.1.1",   "23B81",    "23.1.0", "xnu-10002.41.9~6", "Mon Oct 9 21:26:29 PDT 2023"),
-    OS("macOS", "Sonoma", "14.1.1",   "23B2082",  "23.1.0", "xnu-10002.41.9~6", "Mon Oct 9 21:26:29 PDT 2023"),
-    OS("macOS", "Sonoma", "14.1.2",   "23B92",    "23.1.0", "xnu-10002.41.9~6", "Mon Oct 9 21:27:27 PDT 2023"),
-    OS("macOS", "Sonoma", "14.1.2",   "23B2091",  "23.1.0", "xnu-10002.41.9~6", "Mon Oct 9 21:27:27 PDT 2023"),
-    OS("macOS", "Sonoma", "14.2",     "23C64",    "23.2.0", "xnu-10002.61.3~2", "Wed Nov 15 21:54:10 PST 2023"),
-    OS("macOS", "Sonoma", "14.2.1",   "23C71",    "23.2.0", "xnu-10002.61.3~2", "Wed Nov 15 21:54:10 PST 2023"),
-    OS("macOS", "Sonoma", "14.3",     "23D56",    "23.3.0", "xnu-10002.81.5~7", "Wed Dec 20 21:30:27 PST 2023"),
-    OS("macOS", "Sonoma", "14.3.1",   "23D60",    "23.3.0", "xnu-10002.81.5~7", "Wed Dec 20 21:28:58 PST 2023"),
-]
+def _load_builds() -> List[OS]:
+    """(Internal) Construct the release table."""
+    return [
+        # Pre-releases
+        OS("Mac OS X", "Beaker",  "10.0 DP1", "Beaker1N5", "1.0", "xnu-24.6.obj~2", "Fri Apr 30 23:26:14 PDT 1999"), # v521
+        OS("Mac OS X", "Beaker",  "10.0 DP1", "Beaker1P2", "1.0", "xnu-25.1.obj~5", "Wed May 19 01:31:37 PDT 1999"),
+        OS("Mac OS X", "Beaker",  "10.0 DP2", "???", "1.0", "xnu-44.obj~1", "Mon Oct 25 23:31:09 PDT 1999"),
+        OS("Mac OS X", "Bunsen",  "10.0 DP3", "???", "1.0"),
+        OS("Mac OS X", "Gonzo",   "10.0 DP4", "???", "1.1"),
+        OS("Mac OS X", "Cheetah", "10.0 Beta", "1H39", "1.2.1"),
+        OS("Mac OS X", "Cheetah", "10.0 Beta", "2E14", "1.2.1"),
+
+        # Cheetah
+        OS("Mac OS X", "Cheetah", "10.0",   "4K78", "1.3"),  # RTM
+        OS("Mac OS X", "Cheetah", "10.0",   "1P2",  "1.3"),  # Server Beta
+        OS("Mac OS X", "Cheetah", "10.0",   "1W2",  "1.3"),  # Server Beta
+        OS("Mac OS X", "Cheetah", "10.0.1", "4L5",  "1.3.1"),
+        OS("Mac OS X", "Cheetah", "10.0.1", "4L7",  "1.3.1"),
+        OS("Mac OS X", "Cheetah", "10.0.1", "4L8",  "1.3.1"),
+        OS("Mac OS X", "Cheetah", "10.0.1", "4L13", "1.3.1"),
+        OS("Mac OS X", "Cheetah", "10.0.2", "4P12", "1.3.1"),
+        OS("Mac OS X", "Cheetah", "10.0.3", "4P13", "1.3.1"),
+        OS("Mac OS X", "Cheetah", "10.0.3", "4M23", "1.3.1"),
+        OS("Mac OS X", "Cheetah", "10.0.4", "2G7",  "1.3.1"),
+        OS("Mac OS X", "Cheetah", "10.0.4", "4Q12", "1.3.1"),
+        OS("Mac OS X", "Cheetah", "10.0.4", "4R14", "1.3.1"), # PowerMac G4
+        OS("Mac OS X", "Cheetah", "10.0.4", "4R15", "1.3.1"), # iMac
+        OS("Mac OS X", "Cheetah", "10.0.4", "4S10", "1.3.1"), # PowerMac G4
+
+        # Puma
+        OS("Mac OS X", "Puma", "10.1", "5G64", "1.4.1"),
+        OS("Mac OS X", "Puma", "10.1.1", "5M28", "5.1"),
+        OS("Mac OS X", "Puma", "10.1.2", "5P48", "5.2"),
+        OS("Mac OS X", "Puma", "10.1.3", "5Q45", "5.3"),
+        OS("Mac OS X", "Puma", "10.1.4", "5Q125", "5.4"),
+        OS("Mac OS X", "Puma", "10.1.5", "5S60", "5.5"),
+
+        # Jaguar
+        OS("Mac OS X", "Jaguar", "10.2", "6C115", "6.0"),
+        OS("Mac OS X", "Jaguar", "10.2", "6C115a", "6.0"),
+        OS("Mac OS X", "Jaguar", "10.2.1", "6D52", "6.1"),
+        OS("Mac OS X", "Jaguar", "10.2.2", "6F21", "6.2"),
+        OS("Mac OS X", "Jaguar", "10.2.3", "6G30", "6.3"),
+        OS("Mac OS X", "Jaguar", "10.2.3", "6G37", "6.3"),
+        OS("Mac OS X", "Jaguar", "10.2.3", "6G50", "6.3"),
+        OS("Mac OS X", "Jaguar", "10.2.4", "6I32", "6.4"),
+        OS("Mac OS X", "Jaguar", "10.2.5", "6L29", "6.5"),
+        OS("Mac OS X", "Jaguar", "10.2.6", "6L60", "6.6"),
+        OS("Mac OS X", "Jaguar", "10.2.7", "6R65", "6.7"),
+        OS("Mac OS X", "Jaguar", "10.2.8", "6R73", "6.8"),
+        OS("Mac OS X", "Jaguar", "10.2.8", "6S90", "6.8"),
+
+        # Panther
+        OS("Mac OS X", "Panther", "10.3", "7B85", "7.0"),
+        OS("Mac OS X", "Panther", "10.3", "7B86", "7.0"),
+        OS("Mac OS X", "Panther", "10.3.1", "7C107", "7.1"),
+        OS("Mac OS X", "Panther", "10.3.2", "7D24", "7.2"),
+        OS("Mac OS X", "Panther", "10.3.2", "7D28", "7.2"),
+        OS("Mac OS X", "Panther", "10.3.3", "7F44", "7.3"),
+        OS("Mac OS X", "Panther", "10.3.4", "7H63", "7.4"),
+        OS("Mac OS X", "Panther", "10.3.5", "7M34", "7.5"),
+        OS("Mac OS X", "Panther", "10.3.6", "7R28", "7.6"),
+        OS("Mac OS X", "Panther", "10.3.7", "7S215", "7.7"),
+        OS("Mac OS X", "Panther", "10.3.8", "7U16", "7.8"),
+        OS("Mac OS X", "Panther", "10.3.9", "7W98", "7.9"),
+
+        # Tiger
+        OS("Mac OS X", "Tiger", "10.4", "8A428", "8.0"),
+        OS("Mac OS X", "Tiger", "10.4", "8A432", "8.0"),
+        OS("Mac OS X", "Tiger", "10.4.1", "8B15", "8.1"),
+        OS("Mac OS X", "Tiger", "10.4.1", "8B17", "8.1"),
+        OS("Mac OS X", "Tiger", "10.4.2", "8C46", "8.2"),
+        OS("Mac OS X", "Tiger", "10.4.2", "8C47", "8.2"),
+        OS("Mac OS X", "Tiger", "10.4.2", "8E102", "8.2"),
+        OS("Mac OS X", "Tiger", "10.4.2", "8E45", "8.2"),
+        OS("Mac OS X", "Tiger", "10.4.2", "8E90", "8.2"),
+        OS("Mac OS X", "Tiger", "10.4.3", "8F46", "8.3"),
+        OS("Mac OS X", "Tiger", "10.4.4", "8G32", "8.4"),
+        OS("Mac OS X", "Tiger", "10.4.4", "8G1165", "8.4"),
+        OS("Mac OS X", "Tiger", "10.4.5", "8H14", "8.5"),
+        OS("Mac OS X", "Tiger", "10.4.5", "8H1454", "8.5"),
+        OS("Mac OS X", "Tiger", "10.4.6", "8I127", "8.6"),
+        OS("Mac OS X", "Tiger", "10.4.6", "8I1119", "8.6"),
+        OS("Mac OS X", "Tiger", "10.4.7", "8J135", "8.7"),
+        OS("Mac OS X", "Tiger", "10.4.7", "8J2135a", "8.7"),
+        OS("Mac OS X", "Tiger", "10.4.7", "8J1079", "8.7"),
+        OS("Mac OS X", "Tiger", "10.4.7", "8J5107", "8.7"),
+        OS("Mac OS X", "Tiger", "10.4.8", "8L127", "8.8"),
+        OS("Mac OS X", "Tiger", "10.4.8", "8L2127", "8.8"),
+        OS("Mac OS X", "Tiger", "10.4.9", "8P135", "8.9"),
+        OS("Mac OS X", "Tiger", "10.4.9", "8P2137", "8.9"),
+        OS("Mac OS X", "Tiger", "10.4.10", "8R218", "8.10"),
+        OS("Mac OS X", "Tiger", "10.4.10", "8R2218", "8.10"),
+        OS("Mac OS X", "Tiger", "10.4.10", "8R2232", "8.10"),
+        OS("Mac OS X", "Tiger", "10.4.11", "8S165", "8.11"),
+        OS("Mac OS X", "Tiger", "10.4.11", "8S2167", "8.11"),
+
+        # Leopard
+        OS("Mac OS X", "Leopard", "10.5", "9A581", "9.0"),
+        OS("Mac OS X", "Leopard", "10.5.1", "9B18", "9.1"),
+        OS("Mac OS X", "Leopard", "10.5.1", "9B2117", "9.1.1"),
+        OS("Mac OS X", "Leopard", "10.5.2", "9C31", "9.2"),
+        OS("Mac OS X", "Leopard", "10.5.2", "9C7010", "9.2"),
+        OS("Mac OS X", "Leopard", "10.5.3", "9D34", "9.3"),
+        OS("Mac OS X", "Leopard", "10.5.4", "9E17", "9.4"),
+        OS("Mac OS X", "Leopard", "10.5.5", "9F33", "9.5"),
+        OS("Mac OS X", "Leopard", "10.5.6", "9G55", "9.6"),
+        OS("Mac OS X", "Leopard", "10.5.6", "9G66", "9.6"),
+        OS("Mac OS X", "Leopard", "10.5.6", "9G71", "9.6"),
+        OS("Mac OS X", "Leopard", "10.5.7", "9J61", "9.7"),
+        OS("Mac OS X", "Leopard", "10.5.8", "9L30", "9.8"),
+        OS("Mac OS X", "Leopard", "10.5.8", "9L34", "9.8"),
+
+        # Snow Leopard
+        OS("Mac OS X", "Snow Leopard", "10.6", "10A432", "10.0"),
+        OS("Mac OS X", "Snow Leopard", "10.6", "10A433", "10.0"),
+        OS("Mac OS X", "Snow Leopard", "10.6.1", "10B504", "10.1"),
+        OS("Mac OS X", "Snow Leopard", "10.6.2", "10C540", "10.2"),
+        OS("Mac OS X", "Snow Leopard", "10.6.3", "10D573", "10.3"),
+        OS("Mac OS X", "Snow Leopard", "10.6.3", "10D575", "10.3"),
+        OS("Mac OS X", "Snow Leopard", "10.6.3", "10D578", "10.3"),
+        OS("Mac OS X", "Snow Leopard", "10.6.4", "10F569", "10.4"),
+        OS("Mac OS X", "Snow Leopard", "10.6.5", "10H574", "10.5"),
+        OS("Mac OS X", "Snow Leopard", "10.6.6", "10J567", "10.6"),
+        OS("Mac OS X", "Snow Leopard", "10.6.7", "10J869", "10.7"),
+        OS("Mac OS X", "Snow Leopard", "10.6.7", "10J3250", "10.7"),
+        OS("Mac OS X", "Snow Leopard", "10.6.7", "10J4138", "10.7"),
+        OS("Mac OS X", "Snow Leopard", "10.6.8", "10K540", "10.8"),
+        OS("Mac OS X", "Snow Leopard", "10.6.8", "10K549", "10.8"),
+
+        # Lion
+        OS("Mac OS X", "Lion", "10.7", "11A511", "11.0"),
+        OS("Mac OS X", "Lion", "10.7", "11A511s", "11.0"),
+        OS("Mac OS X", "Lion", "10.7", "11A2061", "11.0.2"),
+        OS("Mac OS X", "Lion", "10.7", "11A2063", "11.0.2"),
+        OS("Mac OS X", "Lion", "10.7.1", "11B26", "11.1.0"),
+        OS("Mac OS X", "Lion", "10.7.1", "11B2118", "11.1.0"),
+        OS("Mac OS X", "Lion", "10.7.2", "11C74", "11.2"),
+        OS("Mac OS X", "Lion", "10.7.3", "11D50", "11.3"),
+        OS("Mac OS X", "Lion", "10.7.4", "11E53", "11.4"),
+        OS("Mac OS X", "Lion", "10.7.5", "11G56", "11.4.2"),
+        OS("Mac OS X", "Lion", "10.7.5", "11G63", "11.4.2"),
+
+        # Mountain Lion
+        OS("OS X", "Mountain Lion", "10.8", "12A269", "12.0"),
+        OS("OS X", "Mountain Lion", "10.8.1", "12B19", "12.1"),
+        OS("OS X", "Mountain Lion", "10.8.2", "12C54", "12.2"),
+        OS("OS X", "Mountain Lion", "10.8.2", "12C60", "12.2"),
+        OS("OS X", "Mountain Lion", "10.8.2", "12C2034", "12.2"),
+        OS("OS X", "Mountain Lion", "10.8.2", "12C3104", "12.2"),
+        OS("OS X", "Mountain Lion", "10.8.3", "12D78", "12.3"),
+        OS("OS X", "Mountain Lion", "10.8.4", "12E55", "12.4"),
+        OS("OS X", "Mountain Lion", "10.8.4", "12E3067", "12.4"),
+        OS("OS X", "Mountain Lion", "10.8.4", "12E4022", "12.4"),
+        OS("OS X", "Mountain Lion", "10.8.5", "12F37", "12.5"),
+        OS("OS X", "Mountain Lion", "10.8.5", "12F45", "12.5"),  # FIXME: build 12F45 has both 12.5 and 12.6 Darwin?
+        OS("OS X", "Mountain Lion", "10.8.5", "12F2501", "12.6"),
+        OS("OS X", "Mountain Lion", "10.8.5", "12F2518", "12.6"),
+        OS("OS X", "Mountain Lion", "10.8.5", "12F2542", "12.6"),
+        OS("OS X", "Mountain Lion", "10.8.5", "12F2560", "12.6"),
+
+        # Mavericks
+        OS("OS X", "Mavericks", "10.9", "13A603", "13.0"),
+        OS("OS X", "Mavericks", "10.9.1", "13B42", "13.0"),
+        OS("OS X", "Mavericks", "10.9.2", "13C64", "13.1"),
+        OS("OS X", "Mavericks", "10.9.2", "13C1021", "13.1"),
+        OS("OS X", "Mavericks", "10.9.3", "13D65", "13.2"),
+        OS("OS X", "Mavericks", "10.9.4", "13E28", "13.3"),
+        OS("OS X", "Mavericks", "10.9.5", "13F34", "13.4"),
+        OS("OS X", "Mavericks", "10.9.5", "13F1066", "13.4"),
+        OS("OS X", "Mavericks", "10.9.5", "13F1077", "13.4"),
+        OS("OS X", "Mavericks", "10.9.5", "13F1096", "13.4"),
+        OS("OS X", "Mavericks", "10.9.5", "13F1112", "13.4"),
+        OS("OS X", "Mavericks", "10.9.5", "13F1134", "13.4"),
+        OS("OS X", "Mavericks", "10.9.5", "13F1507", "13.4"),
+        OS("OS X", "Mavericks", "10.9.5", "13F1603", "13.4"),
+        OS("OS X", "Mavericks", "10.9.5", "13F1712", "13.4"),
+        OS("OS X", "Mavericks", "10.9.5", "13F1808", "13.4"),
+        OS("OS X", "Mavericks", "10.9.5", "13F1911", "13.4"),
+
+        # Yosemite
+        OS("OS X", "Yosemite", "10.10", "14A389", "14.0"),
+        OS("OS X", "Yosemite", "10.10.1", "14B25", "14.0"),
+        OS("OS X", "Yosemite", "10.10.2", "14C109", "14.1"),
+        OS("OS X", "Yosemite", "10.10.2", "14C1510", "14.1"),
+        OS("OS X", "Yosemite", "10.10.2", "14C2043", "14.1"),
+        OS("OS X", "Yosemite", "10.10.2", "14C1514", "14.1"),
+        OS("OS X", "Yosemite", "10.10.2", "14C2513", "14.1"),
+        OS("OS X", "Yosemite", "10.10.3", "14D131", "14.3"),
+        OS("OS X", "Yosemite", "10.10.3", "14D136", "14.3"),
+        OS("OS X", "Yosemite", "10.10.4", "14E46", "14.4"),
+        OS("OS X", "Yosemite", "10.10.5", "14F27", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F1021", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F1505", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F1509", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F1605", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F1713", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F1808", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F1909", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F1912", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F2009", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F2109", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F2315", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F2411", "14.5"),
+        OS("OS X", "Yosemite", "10.10.5", "14F2511", "14.5"),
+
+        # El Capitan
+        OS("OS X", "El Capitan", "10.11", "15A284", "15.0.0"),
+        OS("OS X", "El Capitan", "10.11.1", "15B42", "15.0.0"),
+        OS("OS X", "El Capitan", "10.11.2", "15C50", "15.2.0"),
+        OS("OS X", "El Capitan", "10.11.3", "15D21", "15.3.0"),
+        OS("OS X", "El Capitan", "10.11.4", "15E65", "15.4.0"),
+        OS("OS X", "El Capitan", "10.11.5", "15F34", "15.5.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G31", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G1004", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G1011", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G1108", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G1212", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G1217", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G1421", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G1510", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G1611", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G17023", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G18013", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G19009", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G20015", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G21013", "15.6.0"),
+        OS("OS X", "El Capitan", "10.11.6", "15G22010", "15.6.0"),
+
+        # Sierra
+        OS("macOS", "Sierra", "10.12", "16A323", "16.0.0"),
+        OS("macOS", "Sierra", "10.12.1", "16B2555", "16.1.0"),
+        OS("macOS", "Sierra", "10.12.1", "16B2657", "16.1.0"),
+        OS("macOS", "Sierra", "10.12.2", "16C67", "16.3.0"),
+        OS("macOS", "Sierra", "10.12.2", "16C68", "16.3.0"),
+        OS("macOS", "Sierra", "10.12.3", "16D32", "16.4.0"),
+        OS("macOS", "Sierra", "10.12.4", "16E195", "16.5.0"),
+        OS("macOS", "Sierra", "10.12.5", "16F73", "16.6.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G29", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1036", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1114", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1212", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1314", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1408", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1510", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1618", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1710", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1815", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1917", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G1918", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G2016", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G2127", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G2128", "16.7.0"),
+        OS("macOS", "Sierra", "10.12.6", "16G2136", "16.7.0"),
+
+        # High Sierra
+        OS("macOS", "High Sierra", "10.13", "17A365", "17.0.0"),
+        OS("macOS", "High Sierra", "10.13", "17A405", "17.0.0"),
+        OS("macOS", "High Sierra", "10.13.1", "17B48", "17.2.0"),
+        OS("macOS", "High Sierra", "10.13.1", "17B1002", "17.2.0"),
+        OS("macOS", "High Sierra", "10.13.1", "17B1003", "17.2.0"),
+        OS("macOS", "High Sierra", "10.13.2", "17C88", "17.3.0"),
+        OS("macOS", "High Sierra", "10.13.2", "17C89", "17.3.0"),
+        OS("macOS", "High Sierra", "10.13.2", "17C205", "17.3.0"),
+        OS("macOS", "High Sierra", "10.13.2", "17C2205", "17.3.0"),
+        OS("macOS", "High Sierra", "10.13.3", "17D47", "17.4.0"),
+        OS("macOS", "High Sierra", "10.13.3", "17D2047", "17.4.0"),
+        OS("macOS", "High Sierra", "10.13.3", "17D102", "17.4.0"),
+        OS("macOS", "High Sierra", "10.13.3", "17D2102", "17.4.0"),
+        OS("macOS", "High Sierra", "10.13.4", "17E199", "17.5.0"),
+        OS("macOS", "High Sierra", "10.13.4", "17E202", "17.5.0"),
+        OS("macOS", "High Sierra", "10.13.5", "17F77", "17.6.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G65", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G2208", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G2307", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G3025", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G4015", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G5019", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G6029", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G6030", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G7024", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G8029", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G8030", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G8037", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G9016", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G10021", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G11023", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G12034", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G13033", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G13035", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G14019", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G14033", "17.7.0"),
+        OS("macOS", "High Sierra", "10.13.6", "17G14042", "17.7.0"),
+
+        # Mojave
+        OS("macOS", "Mojave", "10.14", "18A391", "18.0.0"),
+        OS("macOS", "Mojave", "10.14.1", "18B75", "18.2.0"),
+        OS("macOS", "Mojave", "10.14.1", "18B2107", "18.2.0"),
+        OS("macOS", "Mojave", "10.14.1", "18B3094", "18.2.0"),
+        OS("macOS", "Mojave", "10.14.2", "18C54", "18.2.0"),
+        OS("macOS", "Mojave", "10.14.3", "18D42", "18.2.0"),
+        OS("macOS", "Mojave", "10.14.3", "18D43", "18.2.0"),
+        OS("macOS", "Mojave", "10.14.3", "18D109", "18.2.0"),
+        OS("macOS", "Mojave", "10.14.4", "18E226", "18.5.0"),
+        OS("macOS", "Mojave", "10.14.4", "18E227", "18.5.0"),
+        OS("macOS", "Mojave", "10.14.5", "18F132", "18.6.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G84", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G87", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G95", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G103", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G1012", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G2022", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G3020", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G4032", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G5033", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G6020", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G6032", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G7016", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G8012", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G8022", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G9028", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G9216", "18.7.0"),
+        OS("macOS", "Mojave", "10.14.6", "18G9323", "18.7.0"),
+
+        # Catalina
+        OS("macOS", "Catalina", "10.15", "19A583", "19.0.0"),
+        OS("macOS", "Catalina", "10.15", "19A602", "19.0.0"),
+        OS("macOS", "Catalina", "10.15", "19A603", "19.0.0"),
+        OS("macOS", "Catalina", "10.15.1", "19B88", "19.0.0"),
+        OS("macOS", "Catalina", "10.15.2", "19C57", "19.2.0"),
+        OS("macOS", "Catalina", "10.15.2", "19C58", "19.2.0"),
+        OS("macOS", "Catalina", "10.15.3", "19D76", "19.3.0"),
+        OS("macOS", "Catalina", "10.15.4", "19E266", "19.4.0"),
+        OS("macOS", "Catalina", "10.15.4", "19E287", "19.4.0"),
+        OS("macOS", "Catalina", "10.15.5", "19F96", "19.5.0"),
+        OS("macOS", "Catalina", "10.15.5", "19F101", "19.5.0"),
+        OS("macOS", "Catalina", "10.15.6", "19G73", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.6", "19G2021", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H2", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H4", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H15", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H114", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H512", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H524", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1030", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1217", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1323", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1417", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1419", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1519", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1615", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1713", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1715", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1824", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H1922", "19.6.0"),
+        OS("macOS", "Catalina", "10.15.7", "19H2026", "19.6.0"),
+
+        # Big Sur
+        OS("macOS", "Big Sur", "10.16 Beta", "20A2261g", "20.0.0"),  # DTK prototype; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A4299v", "20.0.0"),  # Dev beta 1; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5299w", "20.0.0"),  # DTK/SDK/Xcode beta 1; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A4300b", "20.0.0"),  # Dev beta 2; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5323l", "20.0.0"),  # Dev beta 3; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5343i", "20.0.0"),  # Dev beta 4; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5343j", "20.0.0"),  # Public Beta 1; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5354i", "20.0.0"),  # Dev Beta 5/Public Beta 2; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5364e", "20.0.0"),  # Dev Beta 6/Public Beta 3; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5374f", "20.0.0"),  # DTK/SDK/Xcode beta 7; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5374g", "20.0.0"),  # Dev Beta 7; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5374i", "20.0.0"),  # Dev Beta 8/Public Beta 4; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5384c", "20.0.0"),  # Dev Beta 9/Public Beta 5; Darwin unknown
+        OS("macOS", "Big Sur", "10.16 Beta", "20A5395g", "20.0.0"),  # Dev Beta 10/Public Beta 6; Darwin unknown
+        OS("macOS", "Big Sur", "11.0",       "20A2411",  "20.1.0"),  # RTM
+        OS("macOS", "Big Sur", "11.0.1",     "20B5012d", "20.1.0"),  # Beta 1
+        OS("macOS", "Big Sur", "11.0.1",     "20B5022a", "20.1.0"),  # Beta 2 / Release candidate
+        OS("macOS", "Big Sur", "11.0.1",     "20B28",    "20.1.0"),  # Release Candidate 2
+        OS("macOS", "Big Sur", "11.0.1",     "20B29",    "20.1.0"),  # RTM
+        OS("macOS", "Big Sur", "11.0.1",     "20B50",    "20.1.0"),  # Revised update
+        OS("macOS", "Big Sur", "11.1",       "20C69",    "20.2.0"),
+        OS("macOS", "Big Sur", "11.2",       "20D64",    "20.3.0"),
+        OS("macOS", "Big Sur", "11.2.1",     "20D74",    "20.3.0"),
+        OS("macOS", "Big Sur", "11.2.1",     "20D75",    "20.3.0"),
+        OS("macOS", "Big Sur", "11.2.2",     "20D80",    "20.3.0"),
+        OS("macOS", "Big Sur", "11.2.3",     "20D91",    "20.3.0"),
+        OS("macOS", "Big Sur", "11.3",       "20E232",  "20.4.0"),
+        OS("macOS", "Big Sur", "11.3.1",     "20E241",  "20.4.0"),
+        OS("macOS", "Big Sur", "11.4",       "20F71",   "20.5.0"),
+        OS("macOS", "Big Sur", "11.5",       "20G71",   "20.6.0"),
+        OS("macOS", "Big Sur", "11.5.1",     "20G80",   "20.6.0"),
+        OS("macOS", "Big Sur", "11.5.2",     "20G95",   "20.6.0"),
+        OS("macOS", "Big Sur", "11.6",       "20G165",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.6.1",     "20G224",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.6.2",     "20G314",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.6.3",     "20G415",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.6.4",     "20G417",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.6.5",     "20G527",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.6.6",     "20G624",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.6.7",     "20G630",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.6.8",     "20G730",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.7",       "20G817",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.1 RC3", "20G916",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.1",     "20G918",  "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.2",     "20G1020", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.3",     "20G1116", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.4",     "20G1120", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.5 RC",  "20G1205", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.5 RC3", "20G1215", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.5 RC4", "20G1220", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.5",     "20G1225", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.6 RC",  "20G1329", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.6",     "20G1331", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.7 RC3", "20G1338", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.7 RC4", "20G1342", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.7",     "20G1345", "20.6.0"),  # RC5 has same versions
+        OS("macOS", "Big Sur", "11.7.8 RC2", "20G1407", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.8",     "20G1351", "20.6.0"),  # check version
+        OS("macOS", "Big Sur", "11.7.9 RC3", "20G1413", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.9 RC4", "20G1416", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.9 RC5", "20G1424", "20.6.0"),
+        OS("macOS", "Big Sur", "11.7.9",     "20G1426", "20.6.0", "xnu-7195.141.49.702.12~1", "Thu Jul  6 22:12:47 PDT 2023"),
+        OS("macOS", "Big Sur", "11.7.10",    "20G1427", "20.6.0", "xnu-7195.141.49.702.12~1", "Thu Jul  6 22:12:47 PDT 2023"),
+
+        # Monterey
+        OS("macOS", "Monterey", "12.0", "21A344", "21.0.1"),
+        OS("macOS", "Monterey", "12.0.1", "21A559", "21.1.0"),
+        OS("macOS", "Monterey", "12.1", "21C52", "21.2.0"),
+        OS("macOS", "Monterey", "12.2", "21D49", "21.3.0"),
+        OS("macOS", "Monterey", "12.2.1", "21D62", "21.3.0"),
+        OS("macOS", "Monterey", "12.3", "21E230", "21.4.0"),
+        OS("macOS", "Monterey", "12.3.1", "21E258", "21.4.0"),
+        OS("macOS", "Monterey", "12.4", "21F79", "21.5.0"),
+        OS("macOS", "Monterey", "12.4", "21F2081", "21.5.0"),
+        OS("macOS", "Monterey", "12.4", "21F2092", "21.5.0"),
+        OS("macOS", "Monterey", "12.5", "21G72", "21.6.0"),
+        OS("macOS", "Monterey", "12.5.1", "21G83", "21.6.0"),
+        OS("macOS", "Monterey", "12.6", "21G115", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.1", "21G217", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.2", "21G320", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.3", "21G419", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.4 RC", "21G506", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.4 RC3", "21G516", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.4 RC4", "21G521", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.4", "21G526", "21.6.0"),  # also RC5
+        OS("macOS", "Monterey", "12.6.5 RC", "21G630", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.5", "21G531", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.6 RC2", "21G633", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.6 RC3", "21G639", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.6 RC4", "21G644", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.6", "21G646", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.7 RC2", "21G708", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.8 RC3", "21G713", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.7", "21G651", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.8 RC4", "21G716", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.8 RC5", "21G724", "21.6.0"),
+        OS("macOS", "Monterey", "12.6.8", "21G725", "21.6.0"), # also RC6
+        OS("macOS", "Monterey", "12.6.9", "21G726", "21.6.0"),
+        OS("macOS", "Monterey", "12.7 RC", "21G808", "21.6.0"),
+        OS("macOS", "Monterey", "12.7 RC2", "21G813", "21.6.0"),
+        OS("macOS", "Monterey", "12.7 RC3", "21G814", "21.6.0"),
+        OS("macOS", "Monterey", "12.7",       "21G816",  "21.6.0"),
+        OS("macOS", "Monterey", "12.7.1 RC",  "21G913",  "21.6.0"),
+        OS("macOS", "Monterey", "12.7.1 RC2", "21G918",  "21.6.0"),
+        OS("macOS", "Monterey", "12.7.1",     "21G920",  "21.6.0"),
+        OS("macOS", "Monterey", "12.7.2 RC",  "21G1925", "21.6.0"),
+        OS("macOS", "Monterey", "12.7.2 RC2", "21G1965", "21.6.0"),
+        OS("macOS", "Monterey", "12.7.2 RC3", "21G1967", "21.6.0"),
+        OS("macOS", "Monterey", "12.7.2 RC4", "21G1971", "21.6.0"),
+        OS("macOS", "Monterey", "12.7.2",     "21G1974", "21.6.0"), # also RC5
+        OS("macOS", "Monterey", "12.7.3 RC",  "21H1006", "21.6.0"),
+        OS("macOS", "Monterey", "12.7.3 RC2", "21H1009", "21.6.0"),
+        OS("macOS", "Monterey", "12.7.3 RC3", "21H1013", "21.6.0"),
+        OS("macOS", "Monterey", "12.7.3",     "21H1015", "21.6.0"), # also RC4
+        OS("macOS", "Monterey", "12.7.4 RC",  "21H1105", "21.6.0"),
+        OS("macOS", "Monterey", "12.7.4 RC2", "21H1111", "21.6.0"),
+
+        # Ventura
+        OS("macOS", "Ventura", "13.0",       "22A380",     "22.1.0", "xnu-8792.41.9~2", "Sun Oct 9 20:15:52 PDT 2022"),
+        OS("macOS", "Ventura", "13.0",       "22A8380",    "22.1.0", "xnu-8792.41.9~2", "Sun Oct 9 20:15:52 PDT 2022"),
+        OS("macOS", "Ventura", "13.0.1",     "22A400",     "22.1.0", "xnu-8792.41.9~2", "Sun Oct 9 20:15:52 PDT 2022"),
+        OS("macOS", "Ventura", "13.1",       "22C65",      "22.2.0", "xnu-8792.61.2~4", "Fri Nov 11 02:06:26 PST 2022"),
+        OS("macOS", "Ventura", "13.2",       "22D49",      "22.3.0", "xnu-8792.81.2~2", "Thu Jan 5 20:53:49 PST 2023"),
+        OS("macOS", "Ventura", "13.2.1",     "22D68",      "22.3.0", "xnu-8792.81.3~2", "Mon Jan 30 20:38:43 PST 2023"),
+        OS("macOS", "Ventura", "13.3",       "22E252",     "22.4.0", "xnu-8796.101.5~3", "Mon Mar 6 20:59:28 PST 2023"),
+        OS("macOS", "Ventura", "13.3.1",     "22E261",     "22.4.0", "xnu-8796.101.5~3", "Mon Mar 6 20:59:28 PST 2023"),
+        OS("macOS", "Ventura", "13.3.1 (a)", "22E772610a", "22.4.0", "xnu-8796.101.5~3", "Mon Mar 6 20:59:28 PST 2023"),
+        OS("macOS", "Ventura", "13.4",       "22F66",      "22.5.0", "xnu-8796.121.2~5", "Mon Apr 24 20:52:43 PDT 2023"),
+        OS("macOS", "Ventura", "13.4.1",     "22F82",      "22.5.0", "xnu-8796.121.3~7", "Thu Jun 8 22:22:22 PDT 2023"),
+        OS("macOS", "Ventura", "13.4.1 (a)", "22F770820b", "22.5.0", "xnu-8796.121.3~7", "Thu Jun 8 22:22:22 PDT 2023"),
+        OS("macOS", "Ventura", "13.4.1 (c)", "22F770820d", "22.5.0", "xnu-8796.121.3~7", "Thu Jun 8 22:22:22 PDT 2023"),
+        OS("macOS", "Ventura", "13.5",       "22G74",      "22.6.0", "xnu-8796.141.3~6", "Wed Jul 5 22:21:56 PDT 2023"),
+        OS("macOS", "Ventura", "13.5.1",     "22G90",      "22.6.0", "xnu-8796.141.3~6", "Wed Jul 5 22:21:56 PDT 2023"),
+        OS("macOS", "Ventura", "13.5.2",     "22G91",      "22.6.0", "xnu-8796.141.3~6", "Wed Jul 5 22:21:56 PDT 2023"),
+        OS("macOS", "Ventura", "13.6",       "22G120",     "22.6.0", "xnu-8796.141.3.700.8~1", "Fri Sep 15 13:39:52 PDT 2023"),
+        OS("macOS", "Ventura", "13.6.1",     "22G313",     "22.6.0", "xnu-8796.141.3.701.17~4", "Wed Oct 4 21:25:26 PDT 2023"),
+        OS("macOS", "Ventura", "13.6.2",     "22G320",     "22.6.0", "xnu-8796.141.3.701.17~6", "Thu Nov 2 07:43:57 PDT 2023"),
+        OS("macOS", "Ventura", "13.6.3",     "22G436",     "22.6.0", "xnu-8796.141.3.702.9~2", "Tue Nov 7 21:48:06 PST 2023"),
+        OS("macOS", "Ventura", "13.6.4",     "22G513",     "22.6.0", "xnu-8796.141.3.703.2~2", "Sun Dec 17 22:18:09 PST 2023"),
+
+        # Sonoma
+        OS("macOS", "Sonoma", "14.0 B1",  "23A5257q", "23.0.0"),
+        OS("macOS", "Sonoma", "14.0 B2",  "23A5276g", "23.0.0"),
+        OS("macOS", "Sonoma", "14.0 B3",  "23A5286g", "23.0.0"),
+        OS("macOS", "Sonoma", "14.0 B3",  "23A5286i", "23.0.0"),
+        OS("macOS", "Sonoma", "14.0 B4",  "23A5301g", "23.0.0"),
+        OS("macOS", "Sonoma", "14.0 B4",  "23A5301h", "23.0.0"),
+        OS("macOS", "Sonoma", "14.0 B5",  "23A5312d", "23.0.0"),
+        OS("macOS", "Sonoma", "14.0 B6",  "23A5328b", "23.0.0"),
+        OS("macOS", "Sonoma", "14.0 B7",  "23A5337a", "23.0.0"),
+        OS("macOS", "Sonoma", "14.0 RC",  "23A339",   "23.0.0"),
+        OS("macOS", "Sonoma", "14.0 RC2", "23A344",   "23.0.0"),
+        OS("macOS", "Sonoma", "14.0",     "23A344",   "23.0.0", "xnu-10002.1.13~1", "Fri Sep 15 14:41:34 PDT 2023"),
+        OS("macOS", "Sonoma", "14.1",     "23B74",    "23.1.0", "xnu-10002.41.9~6", "Mon Oct 9 21:27:27 PDT 2023"),
+        OS("macOS", "Sonoma", "14.1.1",   "23B81",    "23.1.0", "xnu-10002.41.9~6", "Mon Oct 9 21:26:29 PDT 2023"),
+        OS("macOS", "Sonoma", "14.1.1",   "23B2082",  "23.1.0", "xnu-10002.41.9~6", "Mon Oct 9 21:26:29 PDT 2023"),
+        OS("macOS", "Sonoma", "14.1.2",   "23B92",    "23.1.0", "xnu-10002.41.9~6", "Mon Oct 9 21:27:27 PDT 2023"),
+        OS("macOS", "Sonoma", "14.1.2",   "23B2091",  "23.1.0", "xnu-10002.41.9~6", "Mon Oct 9 21:27:27 PDT 2023"),
+        OS("macOS", "Sonoma", "14.2",     "23C64",    "23.2.0", "xnu-10002.61.3~2", "Wed Nov 15 21:54:10 PST 2023"),
+        OS("macOS", "Sonoma", "14.2.1",   "23C71",    "23.2.0", "xnu-10002.61.3~2", "Wed Nov 15 21:54:10 PST 2023"),
+        OS("macOS", "Sonoma", "14.3",     "23D56",    "23.3.0", "xnu-10002.81.5~7", "Wed Dec 20 21:30:27 PST 2023"),
+        OS("macOS", "Sonoma", "14.3.1",   "23D60",    "23.3.0", "xnu-10002.81.5~7", "Wed Dec 20 21:28:58 PST 2023"),
+    ]
+
+
+class _Snapshot:
+    """(Internal) A release table, and the structures derived from it.
+
+    Snapshots are immutable: the table is a tuple, and each derived
+    structure is built once, on first use, and never changed.  Replacing
+    the table publishes a new snapshot, so an operation that takes one
+    snapshot sees a consistent table and indexes throughout."""
+
+    __slots__ = ("builds", "_derived")
+
+    def __init__(self, builds: Tuple[OS, ...], derived: dict = None):
+        """Constructor.
+
+        :param builds: tuple of OS instances
+        :param derived: optional map of derived structures already built, by key"""
+        self.builds = builds
+        self._derived = derived or {}
+
+    def derived(self, key, build, *args):
+        """(Internal) Return a derived structure, calling build(*args) to construct it on first use."""
+        value = self._derived.get(key)
+        return _derived(self._derived, key, build, *args) if value is None else value
+
+    @property
+    def indexes(self) -> dict:
+        """(Internal) The per-attribute indexes; see _build_indexes()."""
+        value = self._derived.get("indexes")
+        return _derived(self._derived, "indexes", _build_indexes, self.builds) if value is None else value
+
+
+def _snapshot() -> _Snapshot:
+    """(Internal) Return the current release table snapshot, loading it on first use.
+
+    The table and its indexes are loaded from the compiled artifact if
+    there is an up-to-date one, and otherwise constructed from source."""
+    global _SNAPSHOT, _BASE_SNAPSHOT
+
+    snapshot = _SNAPSHOT
+    if snapshot is None:
+        with _LOAD_LOCK:
+            if _SNAPSHOT is None:
+                table = _load_artifact(ARTIFACT_PATH)
+                if table is None:
+                    _BASE_SNAPSHOT = _Snapshot(tuple(_load_builds()))
+                else:
+                    _BASE_SNAPSHOT = _Snapshot(table[0], {"indexes": table[1]})
+                _SNAPSHOT = _BASE_SNAPSHOT
+            snapshot = _SNAPSHOT
+
+    return snapshot
+
+
+def _builds() -> Tuple[OS, ...]:
+    """(Internal) Return the current release table, loading it on first use."""
+    return _snapshot().builds
+
+
+def __getattr__(name):
+    """(Internal) Return the current release table on access as a module attribute."""
+    if name == "_BUILDS":
+        return _builds()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def validate_table(builds: Sequence[OS]) -> List[str]:
+    """Check a release table for errors.
+
+    Reports builds listed twice for the same version or under different
+    Darwin versions, Darwin versions that go backwards as the product
+    version increases, and unparsable kernel dates.
+
+    :param builds: sequence of OS instances
+    :returns: a list of problem descriptions, empty if there are none"""
+
+    problems = []
+
+    seen = {}
+    for release in builds:
+        if release.build == "???":
+            continue
+        other = seen.setdefault(release.build, release)
+        if other is not release and (other.version == release.version or other.darwin != release.darwin):
+            problems.append(f"Duplicate build {release.build}: {other.version} (Darwin {other.darwin}) "
+                            f"and {release.version} (Darwin {release.darwin})")
+
+    ordered = sorted((r for r in builds if r.darwin), key=lambda r: (version_key(r.version), version_key(r.darwin)))
+    for previous, release in zip(ordered, ordered[1:]):
+        if version_key(release.darwin) < version_key(previous.darwin):
+            problems.append(f"Darwin version goes backwards: {previous.version} (Darwin {previous.darwin}) "
+                            f"then {release.version} (Darwin {release.darwin})")
+
+    for release in builds:
+        if release.date is not None and release.timestamp is None:
+            problems.append(f"Unparsable date for build {release.build}: [{release.date}]")
+
+    return problems
+
+
+def compile_table(path: str = None):
+    """Validate the release table, and write it with its indexes to a binary artifact.
+
+    This is run as part of building the package; the artifact is then
+    used in place of constructing the table from source.
+
+    :param path: optional output path, by default ARTIFACT_PATH
+    :raises ValueError: if the table fails validation"""
+
+    builds = _load_builds()
+    problems = validate_table(builds)
+    if problems:
+        raise ValueError("Invalid release table:\n  " + "\n  ".join(problems))
+
+    path = path or ARTIFACT_PATH
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(_pack_table(builds, _build_indexes(builds), _source_digest()))
+    os.replace(temp_path, path)
+
+
+def _source_digest() -> int:
+    """(Internal) Return a checksum of this module's source, identifying the table version."""
+    import zlib
+
+    with open(__file__, "rb") as f:
+        return zlib.crc32(f.read())
+
+
+def _pack_table(builds: Sequence[OS], indexes: dict, digest: int) -> bytes:
+    """(Internal) Serialize release table and indexes.
+
+    The layout is a header, then native-endian unsigned 32-bit arrays of
+    string offsets, the UTF-8 string data (padded to four bytes), records
+    as seven string ids each, and then for each attribute its number of
+    values followed by value string id, posting count and positions.
+    String id 0 stands for None."""
+    from array import array
+
+    strings = {None: 0}
+
+    def intern(value):
+        return strings.setdefault(value, len(strings))
+
+    records = array("I", (intern(getattr(r, key)) for r in builds for key in _ATTRIBUTES))
+
+    postings = array("I")
+    for key in _ATTRIBUTES:
+        postings.append(len(indexes[key]))
+        for value, positions in indexes[key].items():
+            postings.extend((intern(value), len(positions)))
+            postings.extend(positions)
+
+    encoded = [s.encode() for s in strings if s is not None]
+    offsets = array("I", [0])
+    for e in encoded:
+        offsets.append(offsets[-1] + len(e))
+    data = b"".join(encoded)
+    data += bytes(-len(data) % 4)
+
+    header = _ARTIFACT_HEADER.pack(_ARTIFACT_MAGIC, _ARTIFACT_VERSION, _BYTE_ORDER_MARK, digest,
+                                   len(builds), len(strings), len(data), len(postings))
+    return header + offsets.tobytes() + data + records.tobytes() + postings.tobytes()
+
+
+def _unpack_table(buffer, digest: Optional[int]) -> (Tuple[OS, ...], dict):
+    """(Internal) Deserialize release table and indexes, as written by _pack_table().
+
+    :param buffer: bytes-like object holding the artifact
+    :param digest: expected source checksum, or None to accept any
+    :raises ValueError: if the artifact is malformed, or for another table version"""
+
+    # Copy the integer arrays out, releasing every view of the buffer so
+    # that it can be closed afterwards.
+    views = [memoryview(buffer)]
+    try:
+        view = views[0]
+        if len(view) < _ARTIFACT_HEADER.size:
+            raise ValueError("Truncated release table artifact")
+        magic, version, mark, table_digest, count, string_count, data_size, postings_size = \
+            _ARTIFACT_HEADER.unpack_from(view)
+        if magic != _ARTIFACT_MAGIC or version != _ARTIFACT_VERSION or mark != _BYTE_ORDER_MARK:
+            raise ValueError("Unrecognized release table artifact")
+        if digest is not None and table_digest != digest:
+            raise ValueError("Release table artifact is out of date")
+
+        start = _ARTIFACT_HEADER.size
+        sizes = (4 * string_count, data_size, 4 * count * len(_ATTRIBUTES), 4 * postings_size)
+        if start + sum(sizes) > len(view):
+            raise ValueError("Truncated release table artifact")
+        sections = []
+        for size, format in zip(sizes, "IBII"):
+            views.append(view[start:start + size])
+            views.append(views[-1].cast(format))
+            sections.append(views[-1].tolist() if format == "I" else views[-1].tobytes())
+            start += size
+    finally:
+        for view in reversed(views):
+            view.release()
+
+    offsets, data, records, postings = sections
+    postings = tuple(postings)
+    strings = [None] + [data[offsets[i - 1]:offsets[i]].decode() for i in range(1, string_count)]
+
+    width = len(_ATTRIBUTES)
+    values = list(map(strings.__getitem__, records))
+    builds = tuple(OS(*values[i:i + width]) for i in range(0, len(values), width))
+
+    indexes = {}
+    i = 0
+    for key in _ATTRIBUTES:
+        index = indexes[key] = {}
+        for _ in range(postings[i]):
+            value, n = postings[i + 1], postings[i + 2]
+            index[strings[value]] = postings[i + 3:i + 3 + n]
+            i += 2 + n
+        i += 1
+
+    return builds, indexes
+
+
+def _load_artifact(path: str) -> Optional[Tuple[Tuple[OS, ...], dict]]:
+    """(Internal) Return release table and indexes from a compiled artifact, or None if unusable."""
+    import mmap
+
+    try:
+        digest = _source_digest()
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return _unpack_table(buffer, digest)
+    except (OSError, ValueError):
+        return None
+
+
+def share_table(name: str = None):
+    """Publish the release table and its indexes in a shared memory block.
+
+    Worker processes pass the block's name to attach_table(), typically
+    from a multiprocessing pool initializer, to load the table from the
+    block instead of constructing and indexing it themselves, so that all
+    workers use the same table, including supplementary releases.  Each
+    worker still unpacks its own copy, so this saves no memory, and as
+    the table is small, attaching is no faster than loading it (see
+    bench_macos_releases.py shared_table).  The caller owns the block,
+    and should close() and unlink() it once the workers are finished.
+
+    :param name: optional name for the block, by default chosen by the system
+    :returns: a multiprocessing.shared_memory.SharedMemory instance"""
+    from multiprocessing import shared_memory
+
+    snapshot = _snapshot()
+    data = _pack_table(snapshot.builds, snapshot.indexes, _source_digest())
+    block = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+    block.buf[:len(data)] = data
+    return block
+
+
+def attach_table(name: str):
+    """Use the release table published by share_table() in another process.
+
+    This replaces any table already loaded in this process, including
+    supplementary releases.
+
+    Before Python 3.13, the block is registered with this process's
+    resource tracker, which unlinks it when the process exits.  Processes
+    started by multiprocessing share their parent's tracker, so attach
+    from those, eg. in a pool initializer, rather than from unrelated
+    processes.
+
+    :param name: name of the shared memory block
+    :raises ValueError: if the block holds another version of the table"""
+    global _SNAPSHOT, _BASE_SNAPSHOT
+
+    from multiprocessing import shared_memory
+
+    digest = _source_digest()
+    # Untracked where possible, so that the block outlives this process.
+    options = {"track": False} if sys.version_info >= (3, 13) else {}
+    block = shared_memory.SharedMemory(name=name, **options)
+    try:
+        builds, indexes = _unpack_table(block.buf, digest)
+    finally:
+        block.close()
+
+    with _LOAD_LOCK:
+        _BASE_SNAPSHOT = _SNAPSHOT = _Snapshot(builds, {"indexes": indexes})
+
+
+def load_supplement(path: Optional[str]) -> int:
+    """Add releases to the table, or correct them, from a JSON or TOML file.
+
+    The file holds a list of releases, each an object of OS attributes,
+    either at the top level or (as it must be for TOML) under "releases".
+    A release with the same version and build as a built-in one replaces
+    it, and others are added to the end of the table.  Loading a file
+    replaces any releases loaded from another, and None removes them.
+
+    The new table is checked with validate_table(), and then published
+    atomically: lookups already under way finish with the old table.
+    Indexes are updated for the releases that changed, not rebuilt.
+
+    :param path: JSON file, or TOML file (Python 3.11 or later) if the name ends in ".toml", or None
+    :raises ValueError: if the file is malformed or cannot be read, or the resulting table invalid
+    :returns: the number of releases read"""
+    global _SNAPSHOT
+
+    releases = _read_supplement(path) if path else []
+    with _LOAD_LOCK:
+        current = _snapshot()
+        base = _BASE_SNAPSHOT
+        if not releases:
+            _SNAPSHOT = base
+            return 0
+
+        builds = _supplemented(base.builds, releases)
+        problems = validate_table(builds)
+        if problems:
+            raise ValueError(f"Invalid supplementary releases in {path}:\n" + "\n".join(problems))
+        _SNAPSHOT = _updated_snapshot(current, builds)
+
+    return len(releases)
+
+
+def _read_supplement(path: str) -> List[OS]:
+    """(Internal) Read supplementary releases from a JSON or TOML file."""
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError(f"Reading TOML requires Python 3.11 or later: {path}") from None
+
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        import json
+
+        with open(path, "rb") as f:
+            data = json.load(f)
+
+    entries = data.get("releases") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        raise ValueError(f"Expected a list of releases in {path}")
+
+    releases = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError(f"Expected release attributes in {path}: [{entry!r}]")
+        unknown = sorted(set(entry) - set(_ATTRIBUTES))
+        if unknown:
+            raise ValueError(f"Unsupported release attributes in {path}: {unknown}")
+        if not all(isinstance(entry.get(key), str) for key in ("product", "name", "version", "build")) or \
+                not all(value is None or isinstance(value, str) for value in entry.values()):
+            raise ValueError(f"Expected string product, name, version and build, and string or null others, in {path}: {entry}")
+        releases.append(OS(**entry))
+
+    return releases
+
+
+def _supplemented(builds: Sequence[OS], releases: Sequence[OS]) -> Tuple[OS, ...]:
+    """(Internal) Return a table with releases replacing those of the same version and build, or added to the end."""
+    positions = {(r.version, r.build): position for position, r in enumerate(builds)}
+    table = list(builds)
+    for release in releases:
+        key = (release.version, release.build)
+        position = positions.get(key)
+        if position is None:
+            positions[key] = len(table)
+            table.append(release)
+        else:
+            table[position] = release
+    return tuple(table)
+
+
+def _updated_snapshot(old: _Snapshot, builds: Tuple[OS, ...]) -> _Snapshot:
+    """(Internal) Return a snapshot of a new table, updating the old snapshot's derived structures.
+
+    The indexes, and the sorted, prefix, date and earliest release
+    structures, are patched for the positions whose release changed.
+    Anything else, eg. columnar_table(), is built afresh on first use."""
+    old_builds = old.builds
+    changes = []
+    for position in range(max(len(old_builds), len(builds))):
+        before = old_builds[position] if position < len(old_builds) else None
+        after = builds[position] if position < len(builds) else None
+        if before is not after and before != after:
+            changes.append((position, before, after))
+    if not changes:
+        return old
+
+    cached = old._derived
+    derived = {}
+    indexes = cached.get("indexes")
+    if indexes is not None:
+        derived["indexes"], appeared, vanished = _patch_indexes(indexes, changes)
+
+    for key, value in cached.items():
+        if key == "date":
+            def entries(releases):
+                return [(r.timestamp, position) for position, r in releases if r is not None and r.timestamp is not None]
+
+            derived[key] = _patch_sorted(value, entries((p, b) for p, b, _ in changes), entries((p, a) for p, _, a in changes),
+                                         lambda t, position: (t, version_key(builds[position].version), position))
+        elif key == "earliest":
+            derived[key] = _patch_earliest(value, builds, changes)
+        elif isinstance(key, tuple) and key[0] == "sorted":
+            attribute, sort_key = key[1], _KEYS[key[1]]
+
+            def entries(releases):
+                return [(sort_key(getattr(r, attribute)), position) for position, r in releases
+                        if r is not None and getattr(r, attribute) is not None]
+
+            derived[key] = _patch_sorted(value, entries((p, b) for p, b, _ in changes), entries((p, a) for p, _, a in changes),
+                                         lambda k, position: (k, position))
+        elif isinstance(key, tuple) and key[0] == "prefix" and indexes is not None:
+            derived[key] = _patch_values(value, appeared[key[1]], vanished[key[1]])
+
+    return _Snapshot(builds, derived)
+
+
+def _patch_indexes(indexes: dict, changes: List[Tuple[int, Optional[OS], Optional[OS]]]) -> (dict, dict, dict):
+    """(Internal) Return updated copies of per-attribute indexes, with each attribute's values that appeared and vanished.
+
+    Only the posting lists of values in changed releases are copied."""
+    patched, appeared, vanished = {}, {}, {}
+    for key in _ATTRIBUTES:
+        index = indexes[key]
+        edits = {}
+        for position, before, after in changes:
+            if before is not None:
+                value = getattr(before, key)
+                if value not in edits:
+                    edits[value] = list(index[value])
+                edits[value].remove(position)
+            if after is not None:
+                value = getattr(after, key)
+                if value not in edits:
+                    edits[value] = list(index.get(value, ()))
+                bisect.insort(edits[value], position)
+
+        index = patched[key] = dict(index)
+        appeared[key], vanished[key] = set(), set()
+        for value, positions in edits.items():
+            if positions:
+                if value not in index:
+                    appeared[key].add(value)
+                index[value] = tuple(positions)
+            elif value in index:
+                del index[value]
+                vanished[key].add(value)
+
+    return patched, appeared, vanished
+
+
+def _patch_sorted(index: (tuple, tuple), removals: list, additions: list, entry_key) -> (tuple, tuple):
+    """(Internal) Return a copy of a sorted (keys, positions) index, with (key, position) entries removed and added.
+
+    entry_key(key, position) gives an entry's full sort key, ordering entries with equal keys."""
+    keys, positions = list(index[0]), list(index[1])
+    for key, position in removals:
+        i = bisect.bisect_left(keys, key)
+        while positions[i] != position:
+            i += 1
+        del keys[i], positions[i]
+
+    for key, position in additions:
+        target = entry_key(key, position)
+        i = bisect.bisect_left(keys, key)
+        hi = bisect.bisect_right(keys, key, i)
+        while i < hi and entry_key(keys[i], positions[i]) < target:
+            i += 1
+        keys.insert(i, key)
+        positions.insert(i, position)
+
+    return tuple(keys), tuple(positions)
+
+
+def _patch_values(values: Tuple[str, ...], appeared: set, vanished: set) -> Tuple[str, ...]:
+    """(Internal) Return a copy of a sorted tuple of distinct values, with values added and removed."""
+    values = list(values)
+    for value in vanished:
+        if value is not None:
+            del values[bisect.bisect_left(values, value)]
+    for value in appeared:
+        if value is not None:
+            bisect.insort(values, value)
+    return tuple(values)
+
+
+def _patch_earliest(earliest: dict, builds: Sequence[OS], changes: List[Tuple[int, Optional[OS], Optional[OS]]]) -> dict:
+    """(Internal) Return a copy of the earliest release map, recomputed for the Darwin versions of changed releases."""
+    affected = {version_key(r.darwin) for _, before, after in changes for r in (before, after) if r is not None and r.darwin}
+    best = {}
+    for release in builds:
+        darwin = version_key(release.darwin) if release.darwin else None
+        if darwin in affected:
+            current = best.get(darwin)
+            if current is None or _release_order(release) < _release_order(current):
+                best[darwin] = release
+
+    earliest = dict(earliest)
+    for darwin in affected:
+        if darwin in best:
+            earliest[darwin] = best[darwin]
+        else:
+            earliest.pop(darwin, None)
+    return earliest
+
+
+class SupplementWatcher:
+    """Reload supplementary releases whenever a file changes.
+
+    The file is polled for changes to its modification time, size or
+    inode, so replacing it by renaming works as well as rewriting it.  A
+    missing file means no supplementary releases.  If a changed file
+    cannot be loaded, the releases already loaded stay in use, and the
+    error is kept in the error attribute.
+
+    Use watch_supplement() to create and start one."""
+
+    def __init__(self, path: str, interval: float = 2.0):
+        """Constructor.
+
+        :param path: JSON or TOML file, as for load_supplement()
+        :param interval: seconds between checks"""
+        self.path = path
+        self.interval = interval
+        self.error = None
+        self._signature = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self) -> bool:
+        """Load the file if it has changed since it was last checked.
+
+        :returns: True if the release table was updated"""
+        try:
+            st = os.stat(self.path)
+            signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except FileNotFoundError:
+            signature = None
+        if signature == self._signature:
+            return False
+
+        self._signature = signature
+        try:
+            load_supplement(self.path if signature else None)
+        except (OSError, ValueError) as e:
+            self.error = e
+            return False
+        self.error = None
+        return True
+
+    def start(self):
+        """Start checking the file in a background thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="SupplementWatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop checking the file, leaving the loaded releases in use."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """(Internal) Check the file every interval until stopped."""
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def watch_supplement(path: str, interval: float = 2.0) -> SupplementWatcher:
+    """Load supplementary releases from a file, and reload them whenever it changes.
+
+    :param path: JSON or TOML file, as for load_supplement()
+    :param interval: seconds between checks
+    :returns: the started SupplementWatcher"""
+    watcher = SupplementWatcher(path, interval)
+    watcher.check()
+    watcher.start()
+    return watcher
+
+
+class ExportCounts(NamedTuple):
+    """Rows changed by export_sqlite()."""
+
+    inserted: int
+    moved: int
+    deleted: int
+
+
+# Version of the export_sqlite() schema, recorded in its metadata table.
+_SQLITE_SCHEMA_VERSION = 1
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS releases (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    product TEXT, name TEXT, version TEXT, build TEXT, darwin TEXT, kernel TEXT, date TEXT,
+    timestamp REAL,
+    version_key TEXT, darwin_key TEXT, build_key TEXT, kernel_key TEXT
+);
+CREATE INDEX IF NOT EXISTS releases_position ON releases (position);
+CREATE INDEX IF NOT EXISTS releases_build ON releases (build);
+CREATE INDEX IF NOT EXISTS releases_darwin ON releases (darwin);
+CREATE INDEX IF NOT EXISTS releases_kernel ON releases (kernel);
+CREATE INDEX IF NOT EXISTS releases_version ON releases (version);
+CREATE INDEX IF NOT EXISTS releases_timestamp ON releases (timestamp);
+CREATE INDEX IF NOT EXISTS releases_version_key ON releases (version_key);
+CREATE INDEX IF NOT EXISTS releases_darwin_key ON releases (darwin_key);
+CREATE INDEX IF NOT EXISTS releases_build_key ON releases (build_key);
+CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def sortable_key(key) -> str:
+    """Return a string which sorts, as plain text, as a sort key tuple does.
+
+    This is how export_sqlite() stores version_key(), build_key() and
+    kernel keys, so that other tools can ORDER BY them.  Integers are
+    zero-padded, each component starts with "." and each tuple ends with
+    "!", so shorter tuples sort first.
+
+    :param key: a tuple of non-negative integers, strings (of characters after space) and such tuples
+    :returns: a string"""
+    if isinstance(key, tuple):
+        return "".join("." + sortable_key(k) for k in key) + "!"
+    if isinstance(key, int):
+        return f"{key:010d}"
+    return key + " "
+
+
+def _export_row(release: OS) -> tuple:
+    """(Internal) Return an export_sqlite() row for a release, less its id and position."""
+    keys = [None if getattr(release, attribute) is None else sortable_key(key(getattr(release, attribute)))
+            for attribute, key in _KEYS.items()]
+    return (*release._fields(), release.timestamp, *keys)
+
+
+def export_sqlite(path: str, builds: Sequence[OS] = None) -> ExportCounts:
+    """Write the release table to an SQLite database.
+
+    The "releases" table has a column per attribute, "timestamp" (kernel
+    build time in seconds since the epoch), "position" (table order),
+    and "version_key", "darwin_key", "build_key" and "kernel_key" text
+    columns from sortable_key().  Rows are keyed by a hash of their
+    content, so exporting again to the same file only inserts new rows,
+    deletes removed ones, and updates the position of any that moved.
+
+    :param path: database file, created if necessary
+    :param builds: optional sequence of OS instances, by default the release table
+    :returns: counts of rows inserted, moved and deleted"""
+    import hashlib
+    import sqlite3
+
+    builds = _builds() if builds is None else builds
+    rows = {}
+    for position, release in enumerate(builds):
+        id = hashlib.blake2b(repr(release._fields()).encode(), digest_size=16).hexdigest()
+        if id in rows:
+            raise ValueError(f"Duplicate release: {release!r}")
+        rows[id] = position
+
+    digest = hashlib.blake2b(",".join(rows).encode(), digest_size=16).hexdigest()
+
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            connection.executescript(_SQLITE_SCHEMA)
+            existing = dict(connection.execute("SELECT id, position FROM releases"))
+
+            removed = [(id,) for id in existing if id not in rows]
+            connection.executemany("DELETE FROM releases WHERE id = ?", removed)
+            moved = [(position, id) for id, position in rows.items() if existing.get(id, position) != position]
+            connection.executemany("UPDATE releases SET position = ? WHERE id = ?", moved)
+            added = [(id, position, *_export_row(builds[position])) for id, position in rows.items() if id not in existing]
+            connection.executemany(f"INSERT INTO releases VALUES ({', '.join('?' * 14)})", added)
+
+            connection.executemany("INSERT OR REPLACE INTO metadata VALUES (?, ?)",
+                                   [("schema_version", str(_SQLITE_SCHEMA_VERSION)), ("digest", digest)])
+    finally:
+        connection.close()
+
+    return ExportCounts(len(added), len(moved), len(removed))
+
+
+class SQLiteBackend:
+    """Look up releases in a database written by export_sqlite().
+
+    Use this instead of the built-in table for very large or extended
+    datasets.  The database is opened read-only, with a connection per
+    thread."""
+
+    def __init__(self, path: str):
+        """Constructor.
+
+        :param path: database file written by export_sqlite()
+        :raises ValueError: if the file has another schema version"""
+        self.path = path
+        self._local = threading.local()
+        version = self._connection().execute("SELECT value FROM metadata WHERE key = 'schema_version'").fetchone()
+        if version is None or version[0] != str(_SQLITE_SCHEMA_VERSION):
+            raise ValueError(f"Unsupported release database schema in {path}")
+
+    def _connection(self):
+        """(Internal) Return this thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            import pathlib
+            import sqlite3
+
+            uri = pathlib.Path(self.path).absolute().as_uri() + "?mode=ro"
+            connection = self._local.connection = sqlite3.connect(uri, uri=True)
+        return connection
+
+    @property
+    def digest(self) -> str:
+        """A hash identifying the database's content."""
+        return self._connection().execute("SELECT value FROM metadata WHERE key = 'digest'").fetchone()[0]
+
+    def lookup(self, *groups: dict, **args) -> List[OS]:
+        """Look up releases, as lookup() does.
+
+        :returns: a list of matching OS instances, in table order"""
+
+        def conjunction(args):
+            clauses, parameters = [], []
+            for key, value in args.items():
+                if key not in _ATTRIBUTES:
+                    raise KeyError(f"Unsupported release attribute: [{key}]")
+                clause, values = _predicate(value)._sql(key)
+                clauses.append(clause)
+                parameters.extend(values)
+            return " AND ".join(clauses) or "1", parameters
+
+        where, parameters = conjunction(args)
+        if groups:
+            alternatives = []
+            for group in groups:
+                if not isinstance(group, dict):
+                    raise TypeError(f"Unsupported lookup alternative: [{group!r}]")
+                clause, values = conjunction(group)
+                alternatives.append(f"({clause})")
+                parameters.extend(values)
+            where = f"({where}) AND ({' OR '.join(alternatives)})"
+
+        cursor = self._connection().execute(
+            f"SELECT {', '.join(_ATTRIBUTES)} FROM releases WHERE {where} ORDER BY position", parameters)
+        return [OS(*row) for row in cursor]
+
+    def close(self):
+        """Close this thread's connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
 
 
 def _read_sw_vers():
     """(Internal) Read software version information from sw_vers command."""
-    info = {}
+    with os.popen("sw_vers") as p:
+        lines = p.readlines()
+
+    return _parse_sw_vers(lines)
 
-    p = os.popen("sw_vers")
-    lines = p.readlines()
-    p.close()
 
+def _parse_sw_vers(lines: Iterable[str]) -> dict:
+    """(Internal) Parse the "Key: value" lines printed by sw_vers."""
+    info = {}
     for line in lines:
         bits = line.strip().split()
+        if len(bits) < 2:
+            continue
         info[bits[0][:-1]] = bits[1]
 
     return info
 
 
-def get_host_os():
-    """Get OS instance describing the current host environment.
+async def _read_sw_vers_async(executable: str, timeout: float) -> dict:
+    """(Internal) Run sw_vers as a subprocess without blocking the event loop."""
+    import asyncio
 
-    :returns: an OS class instance"""
+    import signal
 
-    # Read output from sw_vers utility
-    sw_vers = {}
-    with os.popen("sw_vers") as p:
-        lines = p.readlines()
+    # In its own session, so that on timeout its descendants can be killed
+    # too; otherwise any holding stdout open would delay process.wait().
+    process = await asyncio.create_subprocess_exec(executable, stdout=asyncio.subprocess.PIPE,
+                                                   stderr=asyncio.subprocess.DEVNULL, start_new_session=True)
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except BaseException:
+        if process.returncode is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await process.wait()
+        raise
 
-        for line in lines:
-            bits = line.strip().split()
-            sw_vers[bits[0][:-1]] = bits[1]
+    if process.returncode != 0:
+        raise OSError(f"{executable} exited with status {process.returncode}")
+    return _parse_sw_vers(stdout.decode().splitlines())
 
-    build = sw_vers.get("BuildVersion")
 
-    # Get uname(3) info.
-    posix_attrs = os.uname()
+def _read_system_version(plist_path: str = None) -> dict:
+    """(Internal) Read software version information from the SystemVersion property list.
 
-    darwin_version = posix_attrs.release
+    :param plist_path: optional path of property list, by default SYSTEM_VERSION_PLIST
+    :returns: dict with the same keys as sw_vers output"""
+
+    import plistlib
+
+    with open(plist_path or SYSTEM_VERSION_PLIST, "rb") as f:
+        plist = plistlib.load(f)
+
+    info = {}
+    for key, plist_key in (("ProductName", "ProductName"),
+                           ("ProductVersion", "ProductVersion"),
+                           ("BuildVersion", "ProductBuildVersion")):
+        if plist_key in plist:
+            info[key] = plist[plist_key]
+
+    return info
+
+
+def _read_host_version(plist_path: str = None) -> dict:
+    """(Internal) Read software version information, running sw_vers only if the property list is missing."""
+    try:
+        return _read_system_version(plist_path)
+    except FileNotFoundError:
+        return _read_sw_vers()
+
+
+class UnameVersion(NamedTuple):
+    """Fields of a uname(3) version string, as from `uname -v`."""
 
-    bits = posix_attrs.version.split(': ', 1)
-    if len(bits) != 2:
-        raise ValueError(f"Unrecognized uname version: [{posix_attrs.version}]")
+    darwin: str            # Darwin version, eg. "22.6.0"
+    date: str              # kernel build date, eg. "Sun Dec 17 22:18:09 PST 2023"
+    kernel: str            # kernel build string, eg. "xnu-8796.141.3.703.2~2"
+    arch: Optional[str]    # kernel architecture, eg. "ARM64" or "X86_64", if known
 
-    bits = bits[1].split('; ', 1)
-    if len(bits) != 2:
-        raise ValueError(f"Unrecognized uname version: [{posix_attrs.version}]")
 
-    kernel_date = bits[0]
+class UnameResolution(NamedTuple):
+    """Result of resolving one uname(3) version string."""
 
-    bits = bits[1].split(':', 1)
-    if len(bits) != 2:
-        raise ValueError(f"Unrecognized uname version: [{posix_attrs.version}]")
+    uname: str                      # the uname version string
+    parsed: Optional[UnameVersion]  # its fields, or None if malformed
+    releases: Tuple[OS, ...]        # matching releases, in table order
+    error: Optional[str]            # why it was malformed, or None
 
-    bits = bits[1].split('/', 1)
-    if len(bits) != 2:
-        raise ValueError(f"Unrecognized uname version: [{posix_attrs.version}]")
 
-    kernel_version = bits[0]
+def parse_uname_version(version: str) -> UnameVersion:
+    """Parse a uname(3) version string, as from `uname -v`.
+
+    For example, "Darwin Kernel Version 22.6.0: Sun Dec 17 22:18:09 PST 2023;
+    root:xnu-8796.141.3.703.2~2/RELEASE_X86_64".
+
+    :param version: the uname version string
+    :returns: a UnameVersion
+    :raises ValueError: if the string is malformed"""
+
+    match = _UNAME_VERSION.match(version) if isinstance(version, str) else None
+    if not match:
+        raise ValueError(f"Unrecognized uname version: [{version}]")
+
+    prefix, date, kernel, config = match.groups()
+    if not prefix.split():
+        raise ValueError(f"Missing Darwin version in uname version: [{version}]")
+
+    _, _, platform = config.partition("_")
+    if platform.startswith("X86_64"):
+        arch = "X86_64"
+    else:
+        arch = platform.split("_", 1)[0] or None
+
+    return UnameVersion(prefix.rsplit(None, 1)[-1], date, kernel, arch)
+
+
+def resolve_uname_versions(versions: Iterable[str], cache_size: int = 4096) -> Iterator[UnameResolution]:
+    """Parse and resolve uname(3) version strings in bulk.
+
+    Malformed strings are reported in the result rather than raising.
+    Releases are matched on Darwin version and kernel, and then on the
+    kernel date where that narrows them down, ignoring whitespace
+    differences.  Repeated strings are remembered, up to cache_size
+    distinct ones, so are usually only parsed and matched once.
+
+    :param versions: iterable of uname version strings
+    :param cache_size: maximum number of distinct strings to remember
+    :returns: iterator of UnameResolution, one per string"""
+
+    seen = {}
+    for version in versions:
+        result = seen.get(version) if isinstance(version, str) else None
+        if result is None:
+            try:
+                parsed = parse_uname_version(version)
+            except ValueError as e:
+                result = UnameResolution(version, None, (), str(e))
+            else:
+                result = UnameResolution(version, parsed, _match_uname(parsed), None)
+            if isinstance(version, str):
+                if len(seen) >= cache_size:
+                    seen.clear()
+                seen[version] = result
+        yield result
+
+
+def _match_uname(parsed: UnameVersion) -> Tuple[OS, ...]:
+    """(Internal) Return releases matching parsed uname version fields."""
+    releases = lookup(darwin=parsed.darwin, kernel=parsed.kernel)
+    if len(releases) > 1:
+        date = " ".join(parsed.date.split())
+        dated = [r for r in releases if r.date and " ".join(r.date.split()) == date]
+        if dated:
+            releases = dated
+    return tuple(releases)
+
+
+def _boot_id() -> Optional[str]:
+    """(Internal) Return a string identifying the current boot, or None if unknown."""
+
+    # Linux
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        pass
+
+    # macOS and the BSDs: the boot time, as a raw struct timeval.
+    try:
+        import ctypes
+
+        libc = ctypes.CDLL(None)
+        buf = ctypes.create_string_buffer(16)
+        size = ctypes.c_size_t(len(buf))
+        if libc.sysctlbyname(b"kern.boottime", buf, ctypes.byref(size), None, 0) == 0:
+            return buf.raw[:size.value].hex()
+    except (ImportError, OSError, AttributeError):
+        pass
+
+    return None
+
+
+def _read_cached_sw_vers(cache_path: str, boot_id: str, uname_version: str) -> Optional[dict]:
+    """(Internal) Return sw_vers information from cache file, if valid for this boot and kernel."""
+    import json
+
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("boot") != boot_id or cached.get("uname") != uname_version:
+        return None
+    sw_vers = cached.get("sw_vers")
+    if not isinstance(sw_vers, dict) or not all(isinstance(value, str) for value in sw_vers.values()):
+        return None
+    return sw_vers
+
+
+def _write_cached_sw_vers(cache_path: str, boot_id: str, uname_version: str, sw_vers: dict):
+    """(Internal) Save sw_vers information to cache file, replacing it atomically."""
+    import json
+
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w") as f:
+            json.dump({"boot": boot_id, "uname": uname_version, "sw_vers": sw_vers}, f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # The cache is only an optimisation.
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def get_host_os(uname=None, sw_vers=None, cache_path: str = None, plist_path: str = None) -> OS:
+    """Get OS instance describing the current host environment.
+
+    The result is memoized for the life of the process, unless the
+    uname, sw_vers or property list sources are overridden.
+
+    :param uname: optional function returning an os.uname() result, by default os.uname
+    :param sw_vers: optional function returning a dict of sw_vers fields, by default reading the SystemVersion property list, or running sw_vers if that is missing
+    :param cache_path: optional file used to cache sw_vers output between processes, keyed on the current boot and kernel
+    :param plist_path: optional path of the SystemVersion property list, by default SYSTEM_VERSION_PLIST
+    :returns: an OS class instance"""
+    global _HOST_OS
+
+    memoize = uname is None and sw_vers is None and plist_path is None
+    if memoize:
+        release = _HOST_OS
+        if release is None:
+            with _HOST_OS_LOCK:
+                if _HOST_OS is None:
+                    _HOST_OS = _detect_host_os(None, None, cache_path, None)
+                release = _HOST_OS
+        return release
+
+    return _detect_host_os(uname, sw_vers, cache_path, plist_path)
+
+
+def _detect_host_os(uname, sw_vers, cache_path: Optional[str], plist_path: Optional[str]) -> OS:
+    """(Internal) Detect the host release for get_host_os()."""
+
+    # Get uname(3) info.
+    posix_attrs = (uname or os.uname)()
+
+    # Read software version information, unless cached for this boot.
+    info = None
+    boot_id = _boot_id() if cache_path else None
+    if boot_id:
+        info = _read_cached_sw_vers(cache_path, boot_id, posix_attrs.version)
+    if info is None:
+        info = sw_vers() if sw_vers else _read_host_version(plist_path)
+        if boot_id:
+            _write_cached_sw_vers(cache_path, boot_id, posix_attrs.version, info)
+
+    return _match_host(posix_attrs, info)
+
+
+def _match_host(posix_attrs, info: dict) -> OS:
+    """(Internal) Find the single release matching uname(3) and sw_vers information."""
+    darwin_version = posix_attrs.release
+    parsed = parse_uname_version(posix_attrs.version)
+    kernel_date, kernel_version = parsed.date, parsed.kernel
+    build = info.get("BuildVersion")
 
     # Lookup based on host properties.
     l = lookup(build=build, darwin=darwin_version, kernel=kernel_version, date=kernel_date)
     if (len(l)) != 1:
         raise ValueError(f"Unable to match version: Build {build} Darwin {darwin_version}, Kernel {kernel_version}, Date {kernel_date}")
-
     return l[0]
 
 
-def lookup(**args) -> Sequence[OS]:
+# In-flight asynchronous detections, keyed on event loop and sources.
+_HOST_OS_PENDING = {}
+
+
+async def get_host_os_async(uname=None, plist_path: str = None, executable: str = "sw_vers",
+                            timeout: float = 10.0) -> OS:
+    """Get OS instance describing the current host environment, without blocking the event loop.
+
+    Software version information is read from the SystemVersion property
+    list, or by running sw_vers with asyncio.create_subprocess_exec() if
+    that is missing; no shell is involved.  Concurrent callers on the same
+    event loop share a single detection, and the result is memoized
+    alongside get_host_os() unless the sources are overridden.
+
+    :param uname: optional function returning an os.uname() result, by default os.uname
+    :param plist_path: optional path of the SystemVersion property list, by default SYSTEM_VERSION_PLIST
+    :param executable: program run if the property list is missing, by default sw_vers
+    :param timeout: seconds to wait for the program before killing it and raising asyncio.TimeoutError
+    :returns: an OS class instance"""
+    import asyncio
+
+    memoize = uname is None and plist_path is None and executable == "sw_vers"
+    if memoize and _HOST_OS is not None:
+        return _HOST_OS
+
+    key = (asyncio.get_running_loop(), uname, plist_path, executable, timeout)
+    task = _HOST_OS_PENDING.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_detect_host_os_async(uname, plist_path, executable, timeout, memoize))
+        _HOST_OS_PENDING[key] = task
+        task.add_done_callback(lambda _: _HOST_OS_PENDING.pop(key, None))
+
+    # Shield the shared detection so one cancelled caller doesn't cancel the others.
+    return await asyncio.shield(task)
+
+
+async def _detect_host_os_async(uname, plist_path, executable, timeout, memoize) -> OS:
+    """(Internal) Detect the host release for get_host_os_async()."""
+    global _HOST_OS
+
+    posix_attrs = (uname or os.uname)()
+    try:
+        info = _read_system_version(plist_path)
+    except FileNotFoundError:
+        info = await _read_sw_vers_async(executable, timeout)
+
+    release = _match_host(posix_attrs, info)
+    if memoize and _HOST_OS is None:
+        _HOST_OS = release
+    return release
+
+
+def clear_host_os_cache(cache_path: str = None):
+    """Discard the memoized get_host_os() result.
+
+    :param cache_path: optional cache file, as passed to get_host_os(), to remove as well"""
+    global _HOST_OS
+
+    _HOST_OS = None
+    if cache_path:
+        try:
+            os.remove(cache_path)
+        except FileNotFoundError:
+            pass
+
+
+class _Predicate:
+    """(Internal) Base class for lookup() predicates over one attribute's values."""
+
+    __slots__ = ()
+
+    def matches(self, value) -> bool:
+        """Return True if an attribute value satisfies the predicate."""
+        raise NotImplementedError
+
+    def _estimate(self, snapshot: _Snapshot, attribute: str) -> int:
+        """(Internal) Return the number of releases in a snapshot this predicate selects."""
+        raise NotImplementedError
+
+    def _positions(self, snapshot: _Snapshot, attribute: str) -> List[int]:
+        """(Internal) Return the table positions in a snapshot this predicate selects, in table order."""
+        raise NotImplementedError
+
+    def _mask(self, columns: "ColumnarTable", attribute: str):
+        """(Internal) Return a NumPy boolean array of the table rows this predicate selects."""
+        raise NotImplementedError
+
+    def _sql(self, column: str) -> Tuple[str, list]:
+        """(Internal) Return an SQL condition on a column selecting the rows this predicate does, and its parameters."""
+        raise NotImplementedError
+
+    def _key(self) -> tuple:
+        """(Internal) Return a tuple identifying this predicate."""
+        raise NotImplementedError
+
+    def __eq__(self, other):
+        if not isinstance(other, _Predicate):
+            return NotImplemented
+        return self.__class__ is other.__class__ and self._key() == other._key()
+
+    def __hash__(self):
+        return hash((self.__class__, self._key()))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(" + ", ".join(repr(v) for v in self._key()) + ")"
+
+
+class _Equal(_Predicate):
+    """(Internal) Predicate matching one value; plain lookup() arguments become these."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def matches(self, value) -> bool:
+        return value == self.value
+
+    def _estimate(self, snapshot: _Snapshot, attribute: str) -> int:
+        return len(snapshot.indexes[attribute].get(self.value, ()))
+
+    def _positions(self, snapshot: _Snapshot, attribute: str) -> List[int]:
+        return snapshot.indexes[attribute].get(self.value, [])
+
+    def _mask(self, columns: "ColumnarTable", attribute: str):
+        return columns.codes[attribute] == columns.encode(attribute, [self.value])[0]
+
+    def _sql(self, column: str) -> Tuple[str, list]:
+        return f"{column} IS ?", [self.value]
+
+    def _key(self) -> tuple:
+        return (self.value,)
+
+
+class In(_Predicate):
+    """Predicate matching any of several values, eg. lookup(name=In("Ventura", "Sonoma")).
+
+    Passing a list, tuple or set of values to lookup() is equivalent."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, *values):
+        self.values = frozenset(values)
+
+    def matches(self, value) -> bool:
+        return value in self.values
+
+    def _estimate(self, snapshot: _Snapshot, attribute: str) -> int:
+        index = snapshot.indexes[attribute]
+        return sum(len(index.get(value, ())) for value in self.values)
+
+    def _positions(self, snapshot: _Snapshot, attribute: str) -> List[int]:
+        index = snapshot.indexes[attribute]
+        return sorted(itertools.chain.from_iterable(index.get(value, ()) for value in self.values))
+
+    def _mask(self, columns: "ColumnarTable", attribute: str):
+        import numpy
+
+        return numpy.isin(columns.codes[attribute], columns.encode(attribute, list(self.values)))
+
+    def _sql(self, column: str) -> Tuple[str, list]:
+        values = [value for value in self.values if value is not None]
+        clause = f"{column} IN ({', '.join('?' * len(values))})"
+        if None in self.values:
+            clause = f"({clause} OR {column} IS NULL)"
+        return clause, values
+
+    def _key(self) -> tuple:
+        return tuple(sorted(self.values, key=repr))
+
+
+class Prefix(_Predicate):
+    """Predicate matching string values that start with a prefix, eg. lookup(build=Prefix("22G"))."""
+
+    __slots__ = ("prefix",)
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def matches(self, value) -> bool:
+        return value is not None and value.startswith(self.prefix)
+
+    def _values(self, snapshot: _Snapshot, attribute: str) -> List[str]:
+        """(Internal) Return the attribute's distinct values having the prefix, in string order."""
+        values = _prefix_index(snapshot, attribute)
+        lo = bisect.bisect_left(values, self.prefix)
+        hi = bisect.bisect_left(values, self.prefix + "\U0010ffff", lo)
+        return values[lo:hi]
+
+    def _estimate(self, snapshot: _Snapshot, attribute: str) -> int:
+        index = snapshot.indexes[attribute]
+        return sum(len(index[value]) for value in self._values(snapshot, attribute))
+
+    def _positions(self, snapshot: _Snapshot, attribute: str) -> List[int]:
+        index = snapshot.indexes[attribute]
+        return sorted(itertools.chain.from_iterable(index[value] for value in self._values(snapshot, attribute)))
+
+    def _mask(self, columns: "ColumnarTable", attribute: str):
+        # Codes are assigned in string order, so values with the prefix have consecutive codes.
+        categories = columns.categories[attribute]
+        lo = bisect.bisect_left(categories, self.prefix)
+        hi = bisect.bisect_left(categories, self.prefix + "\U0010ffff", lo)
+        codes = columns.codes[attribute]
+        return (codes >= lo) & (codes < hi)
+
+    def _sql(self, column: str) -> Tuple[str, list]:
+        # A range rather than LIKE, so that the column's index is used.
+        return f"({column} >= ? AND {column} < ?)", [self.prefix, self.prefix + "\U0010ffff"]
+
+    def _key(self) -> tuple:
+        return (self.prefix,)
+
+
+class Not(_Predicate):
+    """Predicate matching values that do not satisfy another, eg. lookup(product=Not("Mac OS X")).
+
+    The argument can be a predicate, or anything else accepted by lookup()."""
+
+    __slots__ = ("predicate",)
+
+    def __init__(self, predicate):
+        self.predicate = _predicate(predicate)
+
+    def matches(self, value) -> bool:
+        return not self.predicate.matches(value)
+
+    def _estimate(self, snapshot: _Snapshot, attribute: str) -> int:
+        return len(snapshot.builds) - self.predicate._estimate(snapshot, attribute)
+
+    def _positions(self, snapshot: _Snapshot, attribute: str) -> List[int]:
+        excluded = set(self.predicate._positions(snapshot, attribute))
+        return [p for p in range(len(snapshot.builds)) if p not in excluded]
+
+    def _mask(self, columns: "ColumnarTable", attribute: str):
+        return ~self.predicate._mask(columns, attribute)
+
+    def _sql(self, column: str) -> Tuple[str, list]:
+        # Comparisons with NULL are NULL, which must count as not matching before negation.
+        clause, parameters = self.predicate._sql(column)
+        return f"NOT COALESCE({clause}, 0)", parameters
+
+    def _key(self) -> tuple:
+        return (self.predicate,)
+
+
+# Argument types that lookup() treats as more than a plain value.
+_COMPOUND = (_Predicate, list, tuple, set, frozenset)
+
+
+def _predicate(value) -> _Predicate:
+    """(Internal) Return a predicate for a lookup() argument value."""
+    if isinstance(value, _Predicate):
+        return value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return In(*value)
+    return _Equal(value)
+
+
+def lookup(*groups: dict, **args) -> Sequence[OS]:
     """Look up a release by its attributes.
 
     Possible attribute names are:
@@ -661,36 +2041,906 @@ def lookup(**args) -> Sequence[OS]:
 
     You can supply zero or more attributes, and the result must match all of them.
 
-    :returns: a list of matching OS instances"""
+    Each attribute's value can be a plain value to match exactly, a list,
+    tuple or set of values to match any of (or In(...)), Prefix(...) to
+    match the start of a string, or Not(...) to negate any of these.
+
+    Dicts of attributes passed as positional arguments are alternatives:
+    the result must match at least one of them, as well as all keyword
+    attributes.  For example, lookup({"name": "Ventura"}, {"darwin":
+    Prefix("23.")}, product="macOS").
+
+    The most selective attribute, by the number of releases with each
+    value, is evaluated first, and the others checked against its results.
 
+    :returns: a list of matching OS instances, in table order"""
+
+    compound = False
+    for key, value in args.items():
+        if key not in _ATTRIBUTES:
+            raise KeyError(f"Unsupported release attribute: [{key}]")
+        compound = compound or isinstance(value, _COMPOUND)
+
+    for group in groups:
+        if not isinstance(group, dict):
+            raise TypeError(f"Unsupported lookup alternative: [{group!r}]")
+        for key in group:
+            if key not in _ATTRIBUTES:
+                raise KeyError(f"Unsupported release attribute: [{key}]")
+
+    # Use one snapshot throughout, in case the table is replaced meanwhile.
+    snapshot = _snapshot()
+    if not groups and not compound:
+        return _lookup_equal(snapshot, args) if args else list(snapshot.builds)
+
+    conjunction = [(key, _predicate(value)) for key, value in args.items()]
+    if not groups:
+        positions = _plan(snapshot, conjunction)
+    else:
+        alternatives = (_plan(snapshot, conjunction + [(key, _predicate(value)) for key, value in group.items()])
+                        for group in groups)
+        positions = sorted(set(itertools.chain.from_iterable(alternatives)))
+
+    builds = snapshot.builds
+    return [builds[position] for position in positions]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a LookupCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LookupCache:
+    """A bounded, thread-safe, least-recently-used cache of lookup() results.
+
+    Call an instance as you would lookup().  Queries are normalised, so
+    argument order and equivalent predicates share an entry, and results
+    are returned as tuples so they can be shared between callers.  The
+    cache empties itself if the release table is replaced.
+
+    The module provides a default instance, cached_lookup."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Constructor.
+
+        :param maxsize: maximum number of queries to keep"""
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be positive: [{maxsize}]")
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._table = None
+        self._hits = self._misses = self._evictions = 0
+
+    def __call__(self, *groups: dict, **args) -> Tuple[OS, ...]:
+        """Look up releases, as lookup() does.
+
+        :returns: a tuple of matching OS instances, in table order"""
+        key = (_normalise(args), frozenset(_normalise(group) for group in groups))
+        table = _builds()
+
+        with self._lock:
+            if self._table is not table:
+                self._entries.clear()
+                self._table = table
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return result
+            self._misses += 1
+
+        result = tuple(lookup(*groups, **args))
+
+        with self._lock:
+            if self._table is table and key not in self._entries:
+                self._entries[key] = result
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit, miss and eviction counts, and the maximum and current sizes."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._entries))
+
+    def cache_clear(self):
+        """Discard all cached results, and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+def _normalise(args: dict) -> tuple:
+    """(Internal) Return a hashable key for a dict of lookup() arguments."""
+    if not isinstance(args, dict):
+        raise TypeError(f"Unsupported lookup alternative: [{args!r}]")
     for key in args:
-        if key not in ("product", "name", "version", "build", "darwin", "kernel", "date"):
+        if key not in _ATTRIBUTES:
             raise KeyError(f"Unsupported release attribute: [{key}]")
+    return tuple(sorted((key, _predicate(value)) for key, value in args.items()))
 
-    l = _BUILDS
 
-    if "product" in args:
-        l = [release for release in l if release.product == args["product"]]
+cached_lookup = LookupCache()
 
-    if "name" in args:
-        l = [release for release in l if release.name == args["name"]]
 
-    if "version" in args:
-        l = [release for release in l if release.version == args["version"]]
+def _lookup_equal(snapshot: _Snapshot, args: dict) -> List[OS]:
+    """(Internal) Return releases in a snapshot whose attributes equal all the given values, in table order."""
 
-    if "build" in args:
-        l = [release for release in l if release.build == args["build"]]
+    # Start from the shortest posting list, and check the remaining
+    # attributes directly: postings are in table order, so the result is too.
+    indexes = snapshot.indexes
+    postings = []
+    for key, value in args.items():
+        positions = indexes[key].get(value)
+        if not positions:
+            return []
+        postings.append((len(positions), key, positions))
+    postings.sort(key=lambda p: p[0])
 
-    if "darwin" in args:
-        l = [release for release in l if release.darwin == args["darwin"]]
+    rest = [(key, args[key]) for _, key, _ in postings[1:]]
+    builds = snapshot.builds
+    l = []
+    for position in postings[0][2]:
+        release = builds[position]
+        if all(getattr(release, key) == value for key, value in rest):
+            l.append(release)
 
-    if "kernel" in args:
-        l = [release for release in l if release.kernel == args["kernel"]]
+    return l
 
-    if "date" in args:
-        l = [release for release in l if release.date == args["date"]]
 
-    return l
+def _plan(snapshot: _Snapshot, conjunction: List[Tuple[str, _Predicate]]) -> List[int]:
+    """(Internal) Return snapshot table positions matching all (attribute, predicate) pairs, in table order.
+
+    The predicate selecting the fewest releases produces the candidates,
+    and the rest filter them, most selective first."""
+
+    if not conjunction:
+        return list(range(len(snapshot.builds)))
+
+    ordered = sorted(((predicate._estimate(snapshot, key), key, predicate) for key, predicate in conjunction),
+                     key=lambda p: p[0])
+    if ordered[0][0] == 0:
+        return []
+
+    builds = snapshot.builds
+    positions = ordered[0][2]._positions(snapshot, ordered[0][1])
+    for _, key, predicate in ordered[1:]:
+        matches = predicate.matches
+        positions = [p for p in positions if matches(getattr(builds[p], key))]
+        if not positions:
+            break
+
+    return positions
+
+
+def lookup_many(queries: Iterable, fields: Sequence[str] = ("build", "darwin", "kernel")) -> List[Tuple[OS, ...]]:
+    """Look up a batch of releases.
+
+    Each query is either a dict of attributes, as for lookup(), or a
+    tuple of values for the attributes named by fields, where None
+    leaves that attribute unconstrained.  Identical queries are only
+    looked up once.
+
+    :param queries: iterable of query dicts, or tuples (or lists) of values
+    :param fields: attribute names for tuple queries
+    :returns: a list of tuples of matching OS instances, aligned with queries"""
+
+    results = []
+    seen = {}
+    for query in queries:
+        key = _query_key(query)
+        result = seen.get(key)
+        if result is None:
+            result = seen[key] = _query_releases(query, key, fields)
+        results.append(result)
+
+    return results
+
+
+def _query_key(query) -> tuple:
+    """(Internal) Return a hashable key for a lookup_many() query.
+
+    Dicts are normalised as for LookupCache, and tuples of values are their
+    own key."""
+    if isinstance(query, tuple):
+        return query
+    if isinstance(query, dict):
+        return _normalise(query)
+    return tuple(query)
+
+
+def _query_releases(query, key: tuple, fields: Sequence[str]) -> Tuple[OS, ...]:
+    """(Internal) Look up the releases matching a lookup_many() query, given its _query_key()."""
+    if isinstance(query, dict):
+        return tuple(lookup(**dict(key)))
+    return tuple(lookup(**{field: value for field, value in zip(fields, key) if value is not None}))
+
+
+class ReleaseHistogram:
+    """Counts of hosts by release, built from a stream of host queries.
+
+    Queries take the same forms as for lookup_many(), and are resolved
+    with a cache of distinct queries, so each is only looked up once.
+    Hosts are tallied by the releases they match, so memory is bounded
+    by the number of distinct releases rather than hosts.  Histograms
+    from parallel workers can be pickled and merged.
+
+    For example, ReleaseHistogram(inventory).counts("name", "version")."""
+
+    def __init__(self, queries: Iterable = (), fields: Sequence[str] = ("build", "darwin", "kernel"),
+                 cache_size: int = 4096):
+        """Constructor.
+
+        :param queries: optional iterable of queries to count
+        :param fields: attribute names for tuple queries
+        :param cache_size: maximum number of distinct queries to remember"""
+        for field in fields:
+            if field not in _ATTRIBUTES:
+                raise KeyError(f"Unsupported release attribute: [{field}]")
+        self.fields = tuple(fields)
+        self._cache_size = cache_size
+        self._cache = {}
+        self._slots = {}
+        self._tallies = []
+        self.update(queries)
+
+    def update(self, queries: Iterable):
+        """Count more hosts.
+
+        :param queries: iterable of query dicts, or tuples (or lists) of values"""
+        cache = self._cache
+        tallies = self._tallies
+        fields = self.fields
+
+        # Map each distinct query straight to its tally slot, so that
+        # repeated hosts cost a dict lookup and an increment.
+        for query in queries:
+            key = _query_key(query)
+            slot = cache.get(key)
+            if slot is None:
+                slot = self._slot(_query_releases(query, key, fields))
+                if len(cache) >= self._cache_size:
+                    cache.clear()
+                cache[key] = slot
+            tallies[slot] += 1
+
+    def _slot(self, releases: Tuple[OS, ...]) -> int:
+        """(Internal) Return the tally slot for a tuple of matching releases, adding it if new."""
+        slot = self._slots.get(releases)
+        if slot is None:
+            slot = self._slots[releases] = len(self._tallies)
+            self._tallies.append(0)
+        return slot
+
+    def merge(self, other: "ReleaseHistogram") -> "ReleaseHistogram":
+        """Add the counts from another histogram to this one.
+
+        :param other: a ReleaseHistogram, eg. from another worker
+        :returns: this histogram"""
+        for releases, slot in other._slots.items():
+            self._tallies[self._slot(releases)] += other._tallies[slot]
+        return self
+
+    def __add__(self, other: "ReleaseHistogram") -> "ReleaseHistogram":
+        if not isinstance(other, ReleaseHistogram):
+            return NotImplemented
+        return ReleaseHistogram(fields=self.fields, cache_size=self._cache_size).merge(self).merge(other)
+
+    def counts(self, *attributes: str) -> collections.Counter:
+        """Return host counts grouped by release attributes.
+
+        Hosts matching no release are counted under None, as are hosts
+        matching several releases that differ in the grouped attributes.
+
+        :param attributes: one or more OS attribute names, or "full_name", by default "name" and "version"
+        :returns: a Counter keyed by attribute value, or by a tuple of values if several attributes are given"""
+        attributes = attributes or ("name", "version")
+        for attribute in attributes:
+            if attribute not in _ATTRIBUTES and attribute != "full_name":
+                raise KeyError(f"Unsupported release attribute: [{attribute}]")
+
+        if len(attributes) == 1:
+            def group(release):
+                return getattr(release, attributes[0])
+        else:
+            def group(release):
+                return tuple(getattr(release, attribute) for attribute in attributes)
+
+        counts = collections.Counter()
+        for releases, slot in self._slots.items():
+            groups = {group(release) for release in releases}
+            counts[groups.pop() if len(groups) == 1 else None] += self._tallies[slot]
+        return counts
+
+    @property
+    def total(self) -> int:
+        """The number of hosts counted."""
+        return sum(self._tallies)
+
+    @property
+    def unmatched(self) -> int:
+        """The number of hosts matching no release."""
+        slot = self._slots.get(())
+        return 0 if slot is None else self._tallies[slot]
+
+    def __getstate__(self):
+        # The query cache is only an accelerator; don't ship it between processes.
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
+
+    def __eq__(self, other):
+        if not isinstance(other, ReleaseHistogram):
+            return NotImplemented
+        return self._totals() == other._totals()
+
+    __hash__ = None
+
+    def _totals(self) -> dict:
+        """(Internal) Return a map of matching releases to host counts."""
+        return {releases: self._tallies[slot] for releases, slot in self._slots.items() if self._tallies[slot]}
+
+    def __repr__(self):
+        return f"ReleaseHistogram(<{self.total} hosts, {len(self._slots)} releases>)"
+
+
+class ColumnarTable:
+    """A column-oriented view of the release table, in NumPy arrays.
+
+    Each attribute's distinct values are numbered in string order, and
+    the table stored as arrays of those codes, with -1 for a missing
+    value.  Kernel dates are seconds since the epoch (NaN if unknown),
+    and versions, Darwin versions, builds and kernels also have ranks in
+    sort key order, so they can be compared numerically.
+
+    Get the shared instance with columnar_table(); NumPy is required."""
+
+    def __init__(self, builds: Sequence[OS]):
+        """Constructor.
+
+        :param builds: sequence of OS instances, in table order"""
+        import numpy
+
+        self._builds = builds
+        self.categories = {}
+        self.codes = {}
+        self.ranks = {}
+        self._values = {}
+        for attribute in _ATTRIBUTES:
+            values = [getattr(r, attribute) for r in builds]
+            categories = tuple(sorted({v for v in values if v is not None}))
+            code = {value: i for i, value in enumerate(categories)}
+            code[None] = -1
+            self.categories[attribute] = categories
+            self._values[attribute] = numpy.array(categories, dtype=str)
+            self.codes[attribute] = numpy.array([code[v] for v in values], dtype=numpy.int32)
+
+        for attribute in _KEYS:
+            rank = numpy.array(_ranks(attribute, self.categories[attribute]) + [-1], dtype=numpy.int32)
+            self.ranks[attribute] = rank[self.codes[attribute]]
+
+        self.timestamps = numpy.array([numpy.nan if r.timestamp is None else r.timestamp for r in builds])
+        self._row_keys = {}
+
+    def __len__(self):
+        return len(self._builds)
+
+    def encode(self, attribute: str, values):
+        """Return the codes for an array of attribute values.
+
+        None encodes as -1, like a missing value in the table, and values
+        not in the table as -2, which matches nothing.
+
+        :param attribute: OS attribute name
+        :param values: array-like of strings, or None
+        :returns: a NumPy int32 array of codes"""
+        import numpy
+
+        categories = self._values[attribute]
+        values = numpy.asarray(values)
+        missing = None
+        if values.dtype.kind == "O":
+            missing = numpy.equal(values, None)
+            values = numpy.where(missing, "", values).astype(str)
+        elif values.dtype.kind != "U":
+            values = values.astype(str)
+
+        if not len(categories):
+            codes = numpy.full(values.shape, -2, dtype=numpy.int32)
+        else:
+            found = numpy.minimum(numpy.searchsorted(categories, values), len(categories) - 1)
+            codes = numpy.where(categories[found] == values, found, -2).astype(numpy.int32)
+        if missing is not None:
+            codes[missing] = -1
+        return codes
+
+    def decode(self, attribute: str, codes):
+        """Return the attribute values for an array of codes.
+
+        :param attribute: OS attribute name
+        :param codes: array-like of codes, as from encode() or the codes arrays
+        :returns: a NumPy object array of strings, with None for missing or unknown values"""
+        import numpy
+
+        codes = numpy.asarray(codes)
+        categories = numpy.array(self.categories[attribute] + (None,), dtype=object)
+        return categories[numpy.where(codes >= 0, codes, len(categories) - 1)]
+
+    def mask(self, **args):
+        """Select table rows, as lookup() does.
+
+        Arguments are as for lookup(), including predicates, but not
+        alternatives.
+
+        :returns: a NumPy boolean array with an element per table row"""
+        import numpy
+
+        selected = numpy.ones(len(self._builds), dtype=bool)
+        for key, value in args.items():
+            if key not in _ATTRIBUTES:
+                raise KeyError(f"Unsupported release attribute: [{key}]")
+            selected &= _predicate(value)._mask(self, key)
+        return selected
+
+    def positions(self, **args):
+        """Return the positions of the table rows selected by mask().
+
+        :returns: a NumPy array of row positions, in table order"""
+        import numpy
+
+        return numpy.flatnonzero(self.mask(**args))
+
+    def lookup(self, **args) -> List[OS]:
+        """Look up releases, as lookup() does, using the columns.
+
+        :returns: a list of matching OS instances, in table order"""
+        builds = self._builds
+        return [builds[p] for p in self.positions(**args).tolist()]
+
+    def match_rows(self, **columns):
+        """Map arrays of attribute values to table rows.
+
+        For example, match_rows(darwin=darwins, build=builds) finds the
+        row for each (darwin, build) pair.  Each argument is an array of
+        values, or of codes from encode(), and all must be the same
+        length.  Where several releases match, the first in table order is
+        used, as for lookup(...)[0].
+
+        :returns: a NumPy int64 array of row positions, with -1 where nothing matches"""
+        import numpy
+
+        attributes = tuple(sorted(columns))
+        if not attributes:
+            raise TypeError("No attributes to match")
+
+        codes = []
+        for attribute in attributes:
+            if attribute not in _ATTRIBUTES:
+                raise KeyError(f"Unsupported release attribute: [{attribute}]")
+            values = numpy.asarray(columns[attribute])
+            if values.dtype.kind not in "iu":
+                values = self.encode(attribute, values)
+            codes.append(values)
+        codes = numpy.broadcast_arrays(*codes)
+
+        keys, rows = self._row_key_index(attributes)
+        query = self._combine(attributes, codes)
+        found = numpy.minimum(numpy.searchsorted(keys, query), len(keys) - 1)
+        matched = keys[found] == query
+        for c in codes:
+            matched &= c >= -1
+        return numpy.where(matched, rows[found], -1)
+
+    def _combine(self, attributes: Tuple[str, ...], codes):
+        """(Internal) Return one int64 key per row from several arrays of codes."""
+        import numpy
+
+        key = numpy.zeros(codes[0].shape, dtype=numpy.int64)
+        for attribute, c in zip(attributes, codes):
+            # Shift codes so that missing (-1) is zero; unknown values are masked by the caller.
+            key = key * (len(self.categories[attribute]) + 1) + (c.astype(numpy.int64) + 1)
+        return key
+
+    def _row_key_index(self, attributes: Tuple[str, ...]):
+        """(Internal) Return sorted distinct combined keys of the table, and each one's first row, building them on first use."""
+        import numpy
+
+        def build():
+            radix = 1
+            for attribute in attributes:
+                radix *= len(self.categories[attribute]) + 1
+            if radix >= 2 ** 63:
+                raise ValueError(f"Too many distinct values to match on {attributes}")
+            keys = self._combine(attributes, [self.codes[attribute] for attribute in attributes])
+            keys, rows = numpy.unique(keys, return_index=True)
+            return keys, rows
+
+        return _derived(self._row_keys, attributes, build)
+
+
+def _ranks(attribute: str, values: Sequence[str]) -> List[int]:
+    """(Internal) Return the dense rank of each value's sort key among the values' keys.
+
+    Equal keys, eg. for "10.16" and "10.16.0", rank equally."""
+    key = _KEYS[attribute]
+    keys = [key(value) for value in values]
+    distinct = sorted(set(keys))
+    return [bisect.bisect_left(distinct, k) for k in keys]
+
+
+def columnar_table() -> ColumnarTable:
+    """Return a NumPy columnar view of the release table, building it on first use.
+
+    :raises ImportError: if NumPy is not installed
+    :returns: a ColumnarTable"""
+    snapshot = _snapshot()
+    return snapshot.derived("columnar", ColumnarTable, snapshot.builds)
+
+
+def to_arrow():
+    """Return the release table as an Apache Arrow table, building it on first use.
+
+    The attribute columns are dictionary-encoded strings.  There is also
+    a "timestamp" column of UTC kernel build times, and "version_rank",
+    "build_rank", "darwin_rank" and "kernel_rank" integer columns which
+    order as version_key(), build_key() and so on do.  Missing values are
+    null.
+
+    :raises ImportError: if pyarrow is not installed
+    :returns: a pyarrow.Table, in table order"""
+    return _arrow_table(_snapshot())
+
+
+def _arrow_table(snapshot: _Snapshot):
+    """(Internal) Return the Arrow table for a snapshot, building it on first use."""
+    return snapshot.derived("arrow", _build_arrow, snapshot.builds)
+
+
+def _build_arrow(builds: Sequence[OS]):
+    """(Internal) Construct the Arrow release table for to_arrow()."""
+    import pyarrow
+
+    columns = {}
+    ranks = {}
+    for attribute in _ATTRIBUTES:
+        values = [getattr(r, attribute) for r in builds]
+        categories = sorted({v for v in values if v is not None})
+        code = {value: i for i, value in enumerate(categories)}
+        indices = pyarrow.array([code.get(v) for v in values], pyarrow.int32())
+        columns[attribute] = pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array(categories, pyarrow.string()))
+        if attribute in _KEYS:
+            rank = _ranks(attribute, categories)
+            ranks[attribute + "_rank"] = pyarrow.array([None if v is None else rank[code[v]] for v in values],
+                                                       pyarrow.int32())
+
+    columns["timestamp"] = pyarrow.array([None if r.timestamp is None else int(r.timestamp * 1e6) for r in builds],
+                                         pyarrow.timestamp("us", tz="UTC"))
+    columns.update(ranks)
+    return pyarrow.table(columns)
+
+
+def to_pandas():
+    """Return the release table as a pandas DataFrame, by way of to_arrow().
+
+    Dictionary-encoded columns become categoricals.
+
+    :raises ImportError: if pyarrow or pandas is not installed
+    :returns: a pandas.DataFrame, in table order"""
+    return to_arrow().to_pandas()
+
+
+def resolve_column(values, attribute: str = "darwin", fields: Sequence[str] = ("product", "name", "version")):
+    """Resolve a column of Darwin versions or builds to release columns.
+
+    This is vectorised with Arrow compute functions, rather than looking
+    up each row.  A Darwin version resolves to its earliest release, as
+    for getMacOSRelease(), and a build to the first release with that
+    build, as for lookup(build=...)[0].
+
+    :param values: a pyarrow Array or ChunkedArray, or a pandas Series
+    :param attribute: "darwin" (the default) or "build"
+    :param fields: names of to_arrow() columns to return
+    :returns: a pyarrow.Table, or a pandas.DataFrame with the Series' index, with null where nothing matches"""
+    import pyarrow
+    import pyarrow.compute
+
+    if attribute not in ("darwin", "build"):
+        raise KeyError(f"Unsupported resolve attribute: [{attribute}]")
+
+    index = None
+    if not isinstance(values, (pyarrow.Array, pyarrow.ChunkedArray)):
+        index = values.index
+        values = pyarrow.array(values, from_pandas=True)
+    if pyarrow.types.is_dictionary(values.type):
+        values = values.cast(pyarrow.string())
+
+    snapshot = _snapshot()
+    keys, positions = snapshot.derived(("arrow_keys", attribute), _arrow_keys, snapshot, attribute)
+    rows = pyarrow.compute.take(positions, pyarrow.compute.index_in(values, value_set=keys))
+    table = _arrow_table(snapshot).select(list(fields)).take(rows)
+
+    if index is not None:
+        frame = table.to_pandas()
+        frame.index = index
+        return frame
+    return table
+
+
+def _arrow_keys(snapshot: _Snapshot, attribute: str):
+    """(Internal) Return Arrow arrays of an attribute's values and the table positions they resolve to."""
+    import pyarrow
+
+    if attribute == "darwin":
+        # Each Darwin version is matched as written, and with trailing ".0"s
+        # added or removed, eg. "13.4" and "13.4.0", as getMacOSRelease() does.
+        matches = {}
+        for key, release in _earliest_by_darwin(snapshot).items():
+            position = snapshot.builds.index(release)
+            numbers = [str(n) for n in key[0]]
+            for spelling in [release.darwin] + [".".join(numbers + ["0"] * n) for n in range(3)]:
+                matches.setdefault(spelling, position)
+        matches = list(matches.items())
+    else:
+        matches = [(value, positions[0]) for value, positions in snapshot.indexes[attribute].items() if value is not None]
+    return (pyarrow.array([value for value, _ in matches], pyarrow.string()),
+            pyarrow.array([position for _, position in matches], pyarrow.int64()))
+
+
+def lookup_range(attribute: str, start: str = None, stop: str = None) -> List[OS]:
+    """Look up releases whose attribute lies in a half-open range.
+
+    Versions, Darwin versions and builds are compared as structured
+    values, not as strings, using version_key() and build_key().  A
+    version bound without a pre-release suffix stands for the release
+    and its pre-releases.  For example, lookup_range("version", "10.15",
+    "13.6") finds releases from 10.15 (and its pre-releases) up to but
+    excluding 13.6 and its pre-releases, and lookup_range("darwin", "19",
+    "20") finds all Darwin 19.x releases.
+
+    :param attribute: one of "version", "darwin" or "build"
+    :param start: optional inclusive lower bound
+    :param stop: optional exclusive upper bound
+    :returns: a list of matching OS instances, in attribute order"""
+
+    if attribute not in ("version", "darwin", "build"):
+        raise KeyError(f"Unsupported range attribute: [{attribute}]")
+
+    key = _KEYS[attribute]
+    if key is version_key:
+        def key(bound):
+            # Just the numbers of a release, so that it sorts before its pre-releases.
+            k = version_key(bound)
+            return (k[0],) if k[1:] == (_RELEASE, 0, "") else k
+
+    snapshot = _snapshot()
+    keys, positions = _sorted_index(snapshot, attribute)
+    lo = 0 if start is None else bisect.bisect_left(keys, key(start))
+    hi = len(keys) if stop is None else bisect.bisect_left(keys, key(stop), lo)
+    builds = snapshot.builds
+    return [builds[position] for position in positions[lo:hi]]
+
+
+class NearestRelease(NamedTuple):
+    """Result of resolve_nearest()."""
+
+    release: OS       # the nearest known release
+    confidence: str   # "exact", "high", "medium" or "low"
+
+
+def resolve_nearest(build: str = None, darwin: str = None, kernel: str = None) -> Optional[NearestRelease]:
+    """Find the known release nearest to a possibly unknown one.
+
+    If some release matches all the given attributes, the first one
+    (or for a Darwin version alone, the earliest) is returned with
+    "exact" confidence.  Otherwise the nearest preceding known release
+    is found by build, failing that by kernel, and failing that by
+    Darwin version.  Confidence is then "high" for a build in a known
+    build train (same major version and letter), "medium" for the same
+    Darwin major version or xnu version, and "low" otherwise.  It is also
+    "low" if the release contradicts the other attributes given, eg. it
+    has the given build but another Darwin version, or a later kernel.
+
+    :param build: optional build number, eg. "22G630"
+    :param darwin: optional Darwin version, eg. "22.6.0"
+    :param kernel: optional kernel build string, eg. "xnu-8796.141.3.703.2~2"
+    :returns: a NearestRelease, or None if no known release precedes the one given"""
+
+    args = {key: value for key, value in (("build", build), ("darwin", darwin), ("kernel", kernel)) if value}
+    if not args:
+        raise ValueError("At least one of build, darwin or kernel is required")
+
+    snapshot = _snapshot()
+    if list(args) == ["darwin"]:
+        release = _earliest_by_darwin(snapshot).get(version_key(darwin))
+        if release is not None:
+            return NearestRelease(release, "exact")
+    else:
+        releases = lookup(**args)
+        if releases:
+            return NearestRelease(releases[0], "exact")
+
+    def rated(release, confidence):
+        return NearestRelease(release, "low" if _contradicts(release, build, darwin, kernel) else confidence)
+
+    if build and build_key(build)[0]:
+        key = build_key(build)
+        release = _preceding(snapshot, "build", key)
+        if release is not None:
+            other = build_key(release.build)
+            if other[:2] == key[:2]:
+                return rated(release, "high")
+            return rated(release, "medium" if other[0] == key[0] else "low")
+
+    if kernel:
+        key = _kernel_key(kernel)
+        release = _preceding(snapshot, "kernel", key)
+        if release is not None:
+            return rated(release, "medium" if _kernel_key(release.kernel)[0][:1] == key[0][:1] else "low")
+
+    if darwin:
+        key = version_key(darwin)
+        release = _preceding(snapshot, "darwin", key)
+        if release is not None:
+            return rated(release, "medium" if version_key(release.darwin)[0][:1] == key[0][:1] else "low")
+
+    return None
+
+
+def _contradicts(release: OS, build: Optional[str], darwin: Optional[str], kernel: Optional[str]) -> bool:
+    """(Internal) Return whether a release found by resolve_nearest() is inconsistent with the attributes given.
+
+    Only called once no release matches them all, so a release with the
+    given build must differ in something else.  A preceding release can
+    have an earlier Darwin version or kernel, but not a later one, nor
+    another Darwin major version."""
+    if build and release.build == build:
+        return True
+    if darwin and release.darwin:
+        key, other = version_key(darwin), version_key(release.darwin)
+        if other > key or other[0][:1] != key[0][:1]:
+            return True
+    if kernel and release.kernel and _kernel_key(release.kernel) > _kernel_key(kernel):
+        return True
+    return False
+
+
+def _preceding(snapshot: _Snapshot, attribute: str, key: tuple) -> Optional[OS]:
+    """(Internal) Return the last release in a snapshot, in attribute order, at or before a sort key."""
+    keys, positions = _sorted_index(snapshot, attribute)
+    i = bisect.bisect_right(keys, key)
+    return snapshot.builds[positions[i - 1]] if i else None
+
+
+def search_prefix(prefix: str, attribute: str = "build") -> List[OS]:
+    """Look up releases whose build (or kernel) starts with a prefix.
+
+    This is meant for truncated values, eg. "22G5" from a crash log.
+
+    :param prefix: the leading part of the value
+    :param attribute: "build" (the default) or "kernel"
+    :returns: a list of matching OS instances, in build order"""
+
+    if attribute not in ("build", "kernel"):
+        raise KeyError(f"Unsupported prefix attribute: [{attribute}]")
+
+    snapshot = _snapshot()
+    builds = snapshot.builds
+    positions = Prefix(prefix)._positions(snapshot, attribute)
+    positions.sort(key=lambda p: build_key(builds[p].build))
+    return [builds[p] for p in positions]
+
+
+def _sorted_index(snapshot: _Snapshot, attribute: str) -> (tuple, tuple):
+    """(Internal) Return sorted keys and matching table positions for an attribute, building them on first use.
+
+    Releases without a value for the attribute are omitted."""
+    return snapshot.derived(("sorted", attribute), _build_sorted_index, snapshot.builds, attribute)
+
+
+def _build_sorted_index(builds: Sequence[OS], attribute: str) -> (tuple, tuple):
+    """(Internal) Construct the sorted index of an attribute for _sorted_index()."""
+    key = _KEYS[attribute]
+    entries = sorted((key(value), position)
+                     for position, value in enumerate(getattr(r, attribute) for r in builds)
+                     if value is not None)
+    return tuple(k for k, _ in entries), tuple(p for _, p in entries)
+
+
+def latest_release(when) -> Optional[OS]:
+    """Return the newest release available at a point in time.
+
+    Releases are dated by their kernel build date, so only releases with
+    a known date are considered.  Of releases with the same kernel date,
+    the one with the highest version is returned.
+
+    :param when: a datetime (naive values are local time), or seconds since the epoch
+    :returns: an OS instance, or None if no dated release is that old"""
+
+    snapshot = _snapshot()
+    timestamps, positions = _date_index(snapshot)
+    i = bisect.bisect_right(timestamps, _epoch(when))
+    return snapshot.builds[positions[i - 1]] if i else None
+
+
+def lookup_dates(start=None, stop=None) -> List[OS]:
+    """Look up releases whose kernel was built in a half-open time range.
+
+    :param start: optional inclusive lower bound, as for latest_release()
+    :param stop: optional exclusive upper bound, as for latest_release()
+    :returns: a list of matching OS instances, in date order"""
+
+    snapshot = _snapshot()
+    timestamps, positions = _date_index(snapshot)
+    lo = 0 if start is None else bisect.bisect_left(timestamps, _epoch(start))
+    hi = len(timestamps) if stop is None else bisect.bisect_left(timestamps, _epoch(stop), lo)
+    builds = snapshot.builds
+    return [builds[position] for position in positions[lo:hi]]
+
+
+def _epoch(when) -> float:
+    """(Internal) Return seconds since the epoch for a datetime or number."""
+    return when.timestamp() if hasattr(when, "timestamp") else float(when)
+
+
+def _date_index(snapshot: _Snapshot) -> (tuple, tuple):
+    """(Internal) Return sorted kernel build timestamps and matching table positions, building them on first use.
+
+    Of releases with the same timestamp, lower versions come first."""
+    return snapshot.derived("date", _build_date_index, snapshot.builds)
+
+
+def _build_date_index(builds: Sequence[OS]) -> (tuple, tuple):
+    """(Internal) Construct the date index for _date_index()."""
+    entries = sorted((r.timestamp, version_key(r.version), position)
+                     for position, r in enumerate(builds)
+                     if r.timestamp is not None)
+    return tuple(t for t, _, _ in entries), tuple(p for _, _, p in entries)
+
+
+def _prefix_index(snapshot: _Snapshot, attribute: str) -> Tuple[str, ...]:
+    """(Internal) Return an attribute's distinct string values in string order, building them on first use."""
+    return snapshot.derived(("prefix", attribute), _build_prefix_index, snapshot, attribute)
+
+
+def _build_prefix_index(snapshot: _Snapshot, attribute: str) -> Tuple[str, ...]:
+    """(Internal) Construct the prefix index of an attribute for _prefix_index()."""
+    return tuple(sorted(v for v in snapshot.indexes[attribute] if v is not None))
+
+
+def _derived(cache: dict, key, build, *args):
+    """(Internal) Return cache[key], calling build(*args) to construct it exactly once on first use."""
+    value = cache.get(key)
+    if value is None:
+        with _LOAD_LOCK:
+            value = cache.get(key)
+            if value is None:
+                value = cache[key] = build(*args)
+    return value
+
+
+def _indexes() -> dict:
+    """(Internal) Return the current per-attribute indexes, building them on first use."""
+    return _snapshot().indexes
+
+
+def _build_indexes(builds: Sequence[OS]) -> dict:
+    """(Internal) Return per-attribute indexes for a release table.
+
+    Each index maps an attribute value to the tuple of positions in the
+    table having that value, in table order."""
+    indexes = {key: {} for key in _ATTRIBUTES}
+    for position, release in enumerate(builds):
+        for key in _ATTRIBUTES:
+            indexes[key].setdefault(getattr(release, key), []).append(position)
+    return {key: {value: tuple(positions) for value, positions in index.items()}
+            for key, index in indexes.items()}
 
 
 def getMacOSRelease(darwin_version: str = None) -> (str, str):
@@ -704,15 +2954,487 @@ def getMacOSRelease(darwin_version: str = None) -> (str, str):
         return (release.name, release.version)
 
     # Return earliest release matching Darwin version.
-    releases = sorted(lookup(darwin=darwin_version), key=lambda r: r.date or " ")
-    if len(releases) < 1:
+    release = _earliest_by_darwin().get(version_key(darwin_version))
+    if release is None:
         raise KeyError(f"Unable to match Darwin version {darwin_version} to a release.")
-    return (releases[0].name, releases[0].version)
+    return (release.name, release.version)
+
+
+def _earliest_by_darwin(snapshot: _Snapshot = None) -> dict:
+    """(Internal) Return map of Darwin version to its earliest release, building it on first use.
+
+    The map is keyed by version_key() of the Darwin version, so that
+    "13.4" in the table matches "13.4.0" as reported by uname."""
+    snapshot = snapshot or _snapshot()
+    return snapshot.derived("earliest", _build_earliest_by_darwin, snapshot.builds)
+
+
+def _build_earliest_by_darwin(builds: Sequence[OS]) -> dict:
+    """(Internal) Construct the map for _earliest_by_darwin()."""
+    earliest = {}
+    for release in sorted(builds, key=_release_order):
+        if release.darwin:
+            earliest.setdefault(version_key(release.darwin), release)
+    return earliest
+
+
+def _release_order(release: OS) -> tuple:
+    """(Internal) Return a key ordering releases by product version, then kernel build date.
+
+    Most releases have no date, and point releases can have kernels built
+    before their predecessor's (eg. 14.1.1), so the date only breaks ties."""
+    when = release.timestamp
+    return version_key(release.version), math.inf if when is None else when
+
+
+def version_key(version: str) -> tuple:
+    """Return a sort key for a product or Darwin version string.
+
+    Numeric components compare as numbers, ignoring trailing zeros.
+    Pre-releases (DP, Beta, RC) sort before the release, in that order,
+    and Rapid Security Responses, eg. "13.3.1 (a)", sort after it."""
+
+    number, _, suffix = version.partition(" ")
+    numbers = [int(n) for n in re.findall(r"\d+", number)]
+    while len(numbers) > 1 and numbers[-1] == 0:
+        numbers.pop()
+
+    suffix = suffix.strip()
+    if not suffix:
+        return tuple(numbers), _RELEASE, 0, ""
+
+    match = _PRERELEASE.match(suffix)
+    if match:
+        return tuple(numbers), _STAGES[match.group(1).lower()], int(match.group(2) or 0), ""
+
+    return tuple(numbers), _RELEASE + 1, 0, suffix.strip("()")
+
+
+def build_key(build: str) -> tuple:
+    """Return a sort key for a build number string.
+
+    Build numbers, eg. "22G513" or "8J2135a", order by major version,
+    train letter, build number, and then suffix letter.  Unstructured
+    builds, eg. "Beaker1N5", sort before all others.
+
+    :param build: build number string
+    :returns: a tuple of comparable values"""
+
+    match = _BUILD.match(build)
+    if not match:
+        return 0, "", 0, build
+    major, train, number, suffix = match.groups()
+    return int(major), train, int(number), suffix
+
+
+def _kernel_key(kernel: str) -> tuple:
+    """(Internal) Return a sort key for a kernel build string, eg. "xnu-8796.141.3.703.2~2"."""
+    version, _, build = kernel.partition("~")
+    return tuple(int(n) for n in re.findall(r"\d+", version)), int(build) if build.isdigit() else 0
+
+
+# Sort key function for each attribute with a sorted index; see _sorted_index().
+_KEYS = {"version": version_key, "darwin": version_key, "build": build_key, "kernel": _kernel_key}
+
+
+_RESOLVED_FIELDS = ("product", "name", "version")
+
+
+def _record_query(record: dict) -> tuple:
+    """(Internal) Return (build, darwin, kernel) query tuple for an input record.
+
+    Fields that are missing, empty or not strings are ignored."""
+    build, darwin = (value if isinstance(value, str) and value else None
+                     for value in (record.get("build"), record.get("darwin")))
+    kernel = None
+
+    uname = record.get("uname")
+    if uname:
+        try:
+            parsed = parse_uname_version(uname)
+        except ValueError:
+            pass
+        else:
+            darwin = darwin or parsed.darwin
+            kernel = parsed.kernel
+
+    return build, darwin, kernel
+
+
+def _resolve_records(records: Iterable[dict], batch_size: int) -> Iterator[dict]:
+    """(Internal) Add resolved release fields to each record, in batches.
+
+    Records are resolved to the first matching release in table order;
+    unmatched records get None for each field."""
+
+    records = iter(records)
+    while True:
+        batch = list(itertools.islice(records, batch_size))
+        if not batch:
+            return
+
+        queries = [_record_query(record) for record in batch]
+        for record, query, releases in zip(batch, queries, lookup_many(queries)):
+            release = releases[0] if releases and any(query) else None
+            for field in _RESOLVED_FIELDS:
+                record[field] = getattr(release, field) if release else None
+            yield record
+
+
+def _resolve_csv(infile, outfile, batch_size: int):
+    """(Internal) Resolve CSV records from infile to outfile."""
+    import csv
+
+    reader = csv.DictReader(infile)
+    if reader.fieldnames is None:
+        return
+
+    fieldnames = list(reader.fieldnames) + [f for f in _RESOLVED_FIELDS if f not in reader.fieldnames]
+    writer = csv.DictWriter(outfile, fieldnames)
+    writer.writeheader()
+    for record in _resolve_records(reader, batch_size):
+        writer.writerow(record)
+
+
+def _resolve_ndjson(infile, outfile, batch_size: int) -> Tuple[int, Optional[int]]:
+    """(Internal) Resolve newline-delimited JSON records from infile to outfile.
+
+    Lines that are not JSON objects are skipped.
+
+    :returns: the number of lines skipped, and the line number of the first, if any"""
+    import json
+
+    skipped = [0, None]
+
+    def records():
+        for number, line in enumerate(infile, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if isinstance(record, dict):
+                yield record
+            else:
+                skipped[0] += 1
+                if skipped[1] is None:
+                    skipped[1] = number
+
+    for record in _resolve_records(records(), batch_size):
+        outfile.write(json.dumps(record) + "\n")
+    return skipped[0], skipped[1]
+
+
+def dataset_version() -> str:
+    """Return a string identifying the content of the release table.
+
+    :returns: a hexadecimal hash, which changes whenever any release does"""
+    return _dataset_version(_snapshot())
+
+
+def _dataset_version(snapshot: _Snapshot) -> str:
+    """(Internal) Return the dataset_version() of a snapshot, computing it on first use."""
+    return snapshot.derived("version", _build_dataset_version, snapshot.builds)
+
+
+def _build_dataset_version(builds: Sequence[OS]) -> str:
+    """(Internal) Compute a content hash for dataset_version()."""
+    import hashlib
+
+    return hashlib.blake2b(repr([r._fields() for r in builds]).encode(), digest_size=8).hexdigest()
+
+
+class ReleaseServer:
+    """An asyncio HTTP/1.1 service answering release queries.
+
+    GET /lookup?build=22G513 returns the releases matching the query
+    parameters (repeat a parameter to match any of several values).
+    POST /lookup with a JSON array of queries, in the forms accepted by
+    lookup_many() (arrays use the fields parameter, by default build,
+    darwin and kernel), returns an array of results, one per query.
+    GET /darwin/22.6.0 returns the earliest release with that Darwin
+    version, as getMacOSRelease() does, and GET /version the
+    dataset_version().  Releases are JSON objects of their attributes.
+
+    Connections are kept alive, GET responses are cached in memory, and
+    successful ones carry the dataset version as their ETag, so
+    If-None-Match requests get 304 Not Modified until the release table
+    changes.  POST responses are not cached, since their bodies can be
+    large and are rarely repeated."""
+
+    def __init__(self, cache_size: int = 4096, max_body: int = 1 << 20, idle_timeout: float = 60.0):
+        """Constructor.
+
+        :param cache_size: maximum number of GET responses to keep
+        :param max_body: largest accepted request body, in bytes
+        :param idle_timeout: seconds to keep an idle connection open"""
+        self.max_body = max_body
+        self.idle_timeout = idle_timeout
+        self._cache_size = cache_size
+        self._cache = collections.OrderedDict()
+        self._table = None
+        self._version = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080, path: str = None):
+        """Start listening.
+
+        :param host: address to listen on
+        :param port: TCP port, or 0 to choose a free one
+        :param path: optional Unix socket path, used instead of host and port
+        :returns: an asyncio.Server"""
+        import asyncio
+
+        if path:
+            return await asyncio.start_unix_server(self._connection, path)
+        return await asyncio.start_server(self._connection, host, port)
+
+    async def _connection(self, reader, writer):
+        """(Internal) Serve requests on a connection until it is closed."""
+        import asyncio
+
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.idle_timeout)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, protocol = lines[0].split()
+                except ValueError:
+                    writer.write(self._format(400, {}, b"", False))
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if protocol == "HTTP/1.1" else connection == "keep-alive"
+
+                length = headers.get("content-length") or "0"
+                if not (length.isascii() and length.isdigit()):
+                    writer.write(self._format(400, {}, b"", False))
+                    break
+                length = int(length)
+                if length > self.max_body:
+                    writer.write(self._format(413, {}, b"", False))
+                    break
+                try:
+                    body = await asyncio.wait_for(reader.readexactly(length), self.idle_timeout) if length else b""
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break
+
+                status, extra, content = self.respond(method, target, body, headers.get("if-none-match"))
+                writer.write(self._format(status, extra, content, keep_alive, method != "HEAD"))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _format(status: int, headers: dict, content: bytes, keep_alive: bool, send_content: bool = True) -> bytes:
+        """(Internal) Return an HTTP/1.1 response message, leaving out the content itself for HEAD requests."""
+        import http
+
+        lines = [f"HTTP/1.1 {status} {http.HTTPStatus(status).phrase}",
+                 f"Content-Length: {len(content)}",
+                 "Connection: " + ("keep-alive" if keep_alive else "close")]
+        if content:
+            lines.append("Content-Type: application/json")
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (content if send_content else b"")
+
+    def respond(self, method: str, target: str, body: bytes = b"", if_none_match: str = None) -> Tuple[int, dict, bytes]:
+        """Answer a request, from the response cache if possible.
+
+        :param method: HTTP method
+        :param target: request target, ie. the path and query string
+        :param body: request body
+        :param if_none_match: optional If-None-Match header value
+        :returns: status code, extra response headers, and response body"""
+        snapshot = _snapshot()
+        if self._table is not snapshot.builds:
+            self._cache.clear()
+            self._table = snapshot.builds
+            self._version = _dataset_version(snapshot)
+
+        method = "GET" if method == "HEAD" else method
+        if method != "GET":
+            status, content = self._respond(method, target, body)
+            return status, {}, content
+
+        response = self._cache.get(target)
+        if response is None:
+            response = self._respond(method, target, body)
+            self._cache[target] = response
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(target)
+
+        status, content = response
+        if status != 200:
+            return status, {}, content
+        etag = f'"{self._version}"'
+        if if_none_match and (if_none_match.strip() == "*" or etag in (t.strip() for t in if_none_match.split(","))):
+            return 304, {"ETag": etag}, b""
+        return status, {"ETag": etag}, content
+
+    def _respond(self, method: str, target: str, body: bytes) -> Tuple[int, bytes]:
+        """(Internal) Compute the status and body for a request."""
+        import json
+        import urllib.parse
+
+        url = urllib.parse.urlsplit(target)
+        path = urllib.parse.unquote(url.path)
+
+        def release(r):
+            return {attribute: getattr(r, attribute) for attribute in _ATTRIBUTES}
+
+        def error(status, message):
+            return status, json.dumps({"error": message}).encode()
+
+        try:
+            if path == "/lookup" and method == "GET":
+                args = {key: values[0] if len(values) == 1 else tuple(values)
+                        for key, values in urllib.parse.parse_qs(url.query).items()}
+                result = [release(r) for r in lookup(**args)]
+            elif path == "/lookup" and method == "POST":
+                fields = urllib.parse.parse_qs(url.query).get("fields")
+                fields = fields[0].split(",") if fields else ("build", "darwin", "kernel")
+                queries = json.loads(body)
+                if not isinstance(queries, list):
+                    return error(400, "Expected a JSON array of queries")
+                result = [[release(r) for r in releases] for releases in lookup_many(queries, fields)]
+            elif path.startswith("/darwin/") and method == "GET":
+                r = _earliest_by_darwin().get(version_key(path[len("/darwin/"):]))
+                if r is None:
+                    return error(404, f"Unable to match Darwin version {path[len('/darwin/'):]} to a release.")
+                result = release(r)
+            elif path == "/version" and method == "GET":
+                result = {"version": self._version}
+            elif path in ("/lookup", "/version") or path.startswith("/darwin/"):
+                return error(405, f"Method {method} not allowed")
+            else:
+                return error(404, f"No such resource: {path}")
+        except KeyError as e:
+            return error(400, str(e.args[0]))
+        except (TypeError, ValueError) as e:
+            return error(400, str(e))
+
+        return 200, json.dumps(result).encode()
+
+
+def serve(host: str = "127.0.0.1", port: int = 8080, path: str = None, supplement: str = None, **options):
+    """Run a ReleaseServer until interrupted.
+
+    :param host: address to listen on
+    :param port: TCP port
+    :param path: optional Unix socket path, used instead of host and port
+    :param supplement: optional file of supplementary releases, reloaded whenever it changes; see watch_supplement()
+    :param options: ReleaseServer constructor arguments"""
+    import asyncio
+
+    async def run():
+        server = await ReleaseServer(**options).start(host, port, path)
+        async with server:
+            await server.serve_forever()
+
+    watcher = watch_supplement(supplement) if supplement else None
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if watcher is not None:
+            watcher.stop()
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """Command line entry point.
+
+    With no command, print the host release.  The resolve command reads
+    CSV or NDJSON records with any of "darwin", "build" or "uname"
+    (a uname -v string) fields, and writes them out again with the
+    matching release's product, name and version added.  Records are
+    streamed in batches, so input size is unbounded.  The compile command
+    validates the release table and writes the compiled artifact, and the
+    sqlite command exports it to an SQLite database, updating it in place.
+    The serve command runs a ReleaseServer.
+
+    :param argv: optional command line arguments, by default sys.argv[1:]
+    :returns: exit status"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="macos-releases", description="Identify macOS releases.")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("host", help="print the host release (default)")
+    resolve = commands.add_parser("resolve", help="resolve a stream of records")
+    resolve.add_argument("--format", choices=("csv", "ndjson"), default="csv", help="record format (default: csv)")
+    resolve.add_argument("--batch-size", type=int, default=1000, help="records resolved at once (default: 1000)")
+    resolve.add_argument("--input", default="-", help="input file (default: stdin)")
+    resolve.add_argument("--output", default="-", help="output file (default: stdout)")
+    compile_ = commands.add_parser("compile", help="validate and compile the release table")
+    compile_.add_argument("--output", default=ARTIFACT_PATH, help=f"artifact file (default: {ARTIFACT_PATH})")
+    sqlite = commands.add_parser("sqlite", help="export the release table to an SQLite database")
+    sqlite.add_argument("--output", required=True, help="database file, updated if it exists")
+    serve_ = commands.add_parser("serve", help="answer queries over HTTP")
+    serve_.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    serve_.add_argument("--port", type=int, default=8080, help="TCP port (default: 8080)")
+    serve_.add_argument("--unix", help="Unix socket path, instead of host and port")
+    serve_.add_argument("--cache-size", type=int, default=4096, help="responses cached (default: 4096)")
+    serve_.add_argument("--supplement", help="JSON or TOML file of extra releases, reloaded when it changes")
+    args = parser.parse_args(argv)
+
+    if args.command in (None, "host"):
+        print(get_host_os().full_name)
+        return 0
+
+    if args.command == "compile":
+        try:
+            compile_table(args.output)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        return 0
+
+    if args.command == "serve":
+        serve(args.host, args.port, args.unix, args.supplement, cache_size=args.cache_size)
+        return 0
+
+    if args.command == "sqlite":
+        counts = export_sqlite(args.output)
+        print(f"{counts.inserted} inserted, {counts.moved} moved, {counts.deleted} deleted", file=sys.stderr)
+        return 0
+
+    if args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+
+    newline = "" if args.format == "csv" else None
+    infile = sys.stdin if args.input == "-" else open(args.input, newline=newline)
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w", newline=newline)
+    try:
+        if args.format == "csv":
+            _resolve_csv(infile, outfile, args.batch_size)
+        else:
+            skipped, first = _resolve_ndjson(infile, outfile, args.batch_size)
+            if skipped:
+                print(f"Skipped {skipped} malformed line(s), first at line {first}", file=sys.stderr)
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+
+    return 0
 
 
 if __name__ == "__main__":
-    print(get_host_os().full_name)
-    print(getMacOSRelease())
-    print(getMacOSRelease("21.6.0"))
-    print(getMacOSRelease("20.6.0"))
-    print(getMacOSRelease("20.0.0"))
+    sys.exit(main())
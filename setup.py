@@ -1,7 +1,22 @@
+import os
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
 
 VERSION = '2.0'
 
+
+class build_py_with_table(build_py):
+    """Also validate and compile the release table into the build."""
+
+    def run(self):
+        super().run()
+
+        import macos_releases
+        self.mkpath(self.build_lib)
+        macos_releases.compile_table(os.path.join(self.build_lib, os.path.basename(macos_releases.ARTIFACT_PATH)))
+
+
 setup(
     name = 'macos-releases',
     version = VERSION,
@@ -27,4 +42,13 @@ setup(
         'Programming Language :: Python :: 3.12',
     ],
     py_modules = ["macos_releases"],
+    cmdclass = {'build_py': build_py_with_table},
+    extras_require = {
+        'numpy': ['numpy'],
+        'arrow': ['pyarrow'],
+        'pandas': ['pyarrow', 'pandas'],
+    },
+    entry_points = {
+        'console_scripts': ['macos-releases = macos_releases:main'],
+    },
 )
@@ -0,0 +1,780 @@
+import asyncio
+import concurrent.futures
+import datetime
+import io
+import multiprocessing
+import json
+import os
+import pickle
+import plistlib
+import sqlite3
+import subprocess
+import sys
+import time
+import types
+
+import pytest
+
+import macos_releases
+from macos_releases import In, Not, OS, Prefix, lookup
+
+
+def _scan(**args):
+    return [r for r in macos_releases._BUILDS if all(getattr(r, k) == v for k, v in args.items())]
+
+
+def test_lookup_build():
+    assert [r.version for r in lookup(build="22G513")] == ["13.6.4"]
+
+def test_lookup_matches_scan():
+    for release in macos_releases._BUILDS:
+        for args in ({"darwin": release.darwin},
+                     {"name": release.name, "version": release.version},
+                     {"product": release.product, "darwin": release.darwin, "kernel": release.kernel}):
+            assert lookup(**args) == _scan(**args)
+
+def test_lookup_no_match():
+    assert lookup(build="22G513", name="Sonoma") == []
+
+def test_lookup_all():
+    assert lookup() == list(macos_releases._BUILDS)
+
+def test_lookup_bad_attribute():
+    with pytest.raises(KeyError):
+        lookup(colour="blue")
+
+
+def test_os_value_semantics():
+    a = OS("macOS", "Sonoma", "14.3", "23D56", "23.3.0")
+    b = OS("macOS", "Sonoma", "14.3", "23D56", "23.3.0")
+    assert a == b and hash(a) == hash(b)
+    assert len({a, b, lookup(build="23D60")[0]}) == 2
+    assert a != OS("macOS", "Sonoma", "14.3", "23D56", "23.3.1")
+
+def test_os_immutable():
+    release = lookup(build="22G513")[0]
+    with pytest.raises(AttributeError):
+        release.version = "13.6.5"
+    with pytest.raises(AttributeError):
+        release.extra = 1
+    assert not hasattr(release, "__dict__")
+
+def test_os_accessors():
+    release = lookup(build="22G513")[0]
+    assert release.full_name == "macOS Ventura 13.6.4"
+    assert release.datetime.year == 2023
+    assert pickle.loads(pickle.dumps(release)) == release
+
+
+def test_version_key_order():
+    versions = ["10.0 DP1", "10.0 DP4", "10.0 Beta", "10.0", "10.0.4", "10.10",
+                "14.0 B1", "14.0 B7", "14.0 RC", "14.0 RC2", "14.0", "14.0.1"]
+    assert sorted(reversed(versions), key=macos_releases.version_key) == versions
+    assert macos_releases.version_key("13.3.1 (a)") > macos_releases.version_key("13.3.1")
+
+def test_getMacOSRelease_earliest():
+    assert macos_releases.getMacOSRelease("1.0") == ("Beaker", "10.0 DP1")
+    assert macos_releases.getMacOSRelease("20.6.0") == ("Big Sur", "11.5")
+    assert macos_releases.getMacOSRelease("23.1.0") == ("Sonoma", "14.1")
+    assert macos_releases.getMacOSRelease("13.4.0") == ("Mavericks", "10.9.5")
+    assert macos_releases.getMacOSRelease("15.0") == ("El Capitan", "10.11")
+    with pytest.raises(KeyError):
+        macos_releases.getMacOSRelease("99.0.0")
+
+
+_UNAME = types.SimpleNamespace(
+    release="22.6.0",
+    version="Darwin Kernel Version 22.6.0: Sun Dec 17 22:18:09 PST 2023; root:xnu-8796.141.3.703.2~2/RELEASE_X86_64")
+
+
+def _sw_vers(calls):
+    def read():
+        calls.append(1)
+        return {"ProductName": "macOS", "ProductVersion": "13.6.4", "BuildVersion": "22G513"}
+    return read
+
+def test_get_host_os_injected():
+    calls = []
+    assert macos_releases.get_host_os(uname=lambda: _UNAME, sw_vers=_sw_vers(calls)).build == "22G513"
+    assert calls == [1]
+
+def test_get_host_os_memoized(monkeypatch):
+    calls = []
+    monkeypatch.setattr(macos_releases.os, "uname", lambda: _UNAME)
+    monkeypatch.setattr(macos_releases, "_read_host_version", lambda plist_path: _sw_vers(calls)())
+    macos_releases.clear_host_os_cache()
+    try:
+        first = macos_releases.get_host_os()
+        assert macos_releases.get_host_os() is first
+        assert calls == [1]
+    finally:
+        macos_releases.clear_host_os_cache()
+
+def test_get_host_os_cache_file(tmp_path, monkeypatch):
+    if macos_releases._boot_id() is None:
+        pytest.skip("boot identity unavailable")
+
+    calls = []
+    path = str(tmp_path / "host.json")
+    for _ in range(2):
+        release = macos_releases.get_host_os(uname=lambda: _UNAME, sw_vers=_sw_vers(calls), cache_path=path)
+        assert release.version == "13.6.4"
+    assert calls == [1]
+
+    # A different kernel, or explicit invalidation, misses the cache.
+    other = types.SimpleNamespace(release="22.6.0", version=_UNAME.version.replace("~2/", "~3/"))
+    with pytest.raises(ValueError):
+        macos_releases.get_host_os(uname=lambda: other, sw_vers=_sw_vers(calls), cache_path=path)
+    assert calls == [1, 1]
+
+    macos_releases.clear_host_os_cache(path)
+    macos_releases.get_host_os(uname=lambda: _UNAME, sw_vers=_sw_vers(calls), cache_path=path)
+    assert calls == [1, 1, 1]
+
+    # A malformed cache entry is a miss, too.
+    with open(path) as f:
+        cached = json.load(f)
+    for sw_vers in (["x"], {"BuildVersion": 22}):
+        with open(path, "w") as f:
+            json.dump(dict(cached, sw_vers=sw_vers), f)
+        assert macos_releases.get_host_os(uname=lambda: _UNAME, sw_vers=_sw_vers(calls), cache_path=path).build == "22G513"
+    assert calls == [1, 1, 1, 1, 1]
+
+def _stub_sw_vers(tmp_path, delay=0):
+    """Write an executable standing in for sw_vers, which counts its runs."""
+    script = tmp_path / "sw_vers"
+    script.write_text(f"""#!/bin/sh
+echo run >> "{tmp_path / 'runs'}"
+echo "ProductName:\tmacOS"
+echo "ProductVersion:\t13.6.4"
+echo "BuildVersion:\t22G513"
+exec sleep {delay}
+""")
+    script.chmod(0o755)
+    return str(script)
+
+def test_get_host_os_async(tmp_path):
+    executable = _stub_sw_vers(tmp_path, delay=0.2)
+    missing = str(tmp_path / "missing.plist")
+    uname = lambda: _UNAME
+
+    async def detect():
+        return await macos_releases.get_host_os_async(uname=uname, plist_path=missing, executable=executable)
+
+    async def main():
+        return await asyncio.gather(*(detect() for _ in range(5)))
+
+    releases = asyncio.run(main())
+    assert {r.build for r in releases} == {"22G513"}
+    # Concurrent callers share one subprocess.
+    assert (tmp_path / "runs").read_text().splitlines() == ["run"]
+    assert not macos_releases._HOST_OS_PENDING
+
+def test_get_host_os_async_timeout(tmp_path):
+    executable = _stub_sw_vers(tmp_path, delay=5)
+    # A descendant holding stdout open mustn't delay the timeout either.
+    orphaning = tmp_path / "orphaning"
+    orphaning.write_text("#!/bin/sh\nsleep 5 &\nexec sleep 5\n")
+    orphaning.chmod(0o755)
+    missing = str(tmp_path / "missing.plist")
+    for program in (executable, str(orphaning)):
+        start = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(macos_releases.get_host_os_async(uname=lambda: _UNAME, plist_path=missing,
+                                                         executable=program, timeout=0.2))
+        assert time.monotonic() - start < 1
+
+
+def test_read_system_version(tmp_path):
+    path = tmp_path / "SystemVersion.plist"
+    path.write_bytes(plistlib.dumps({"ProductName": "macOS", "ProductVersion": "13.6.4",
+                                     "ProductBuildVersion": "22G513", "ProductCopyright": "1983-2023 Apple Inc."}))
+    info = macos_releases._read_system_version(str(path))
+    assert info == {"ProductName": "macOS", "ProductVersion": "13.6.4", "BuildVersion": "22G513"}
+    assert macos_releases.get_host_os(uname=lambda: _UNAME, plist_path=str(path)).build == "22G513"
+
+def test_read_host_version_fallback(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(macos_releases, "_read_sw_vers", _sw_vers(calls))
+    info = macos_releases._read_host_version(str(tmp_path / "missing.plist"))
+    assert info["BuildVersion"] == "22G513" and calls == [1]
+
+
+def test_lookup_many():
+    queries = [("22G513", "22.6.0", None), {"build": "22G513"}, ("22G513", "22.6.0"),
+               (None, "5.1", None), ("nonesuch", None, None), {"darwin": "5.1"}]
+    results = macos_releases.lookup_many(queries)
+    assert len(results) == len(queries)
+    assert results[0] == results[1] == results[2] == tuple(lookup(build="22G513"))
+    assert results[3] == results[5] == tuple(lookup(darwin="5.1"))
+    assert results[4] == ()
+
+    # Lists and sets of values, as lookup() accepts, are keyed as predicates.
+    results = macos_releases.lookup_many([{"name": ["Puma", "Cheetah"]}, {"name": {"Cheetah", "Puma"}}, {"name": "Puma"}])
+    assert results[0] == results[1] == tuple(lookup(name=In("Puma", "Cheetah")))
+    assert results[2] == tuple(lookup(name="Puma"))
+
+def test_lookup_many_fields():
+    results = macos_releases.lookup_many([("Sonoma", "14.3")], fields=("name", "version"))
+    assert results == [tuple(lookup(name="Sonoma", version="14.3"))]
+
+def test_release_histogram():
+    hosts = [("22G513", "22.6.0", None)] * 3 + [{"build": "23D60"}, ("nonesuch", None, None), (None, "22.6.0", None)]
+    histogram = macos_releases.ReleaseHistogram(hosts, cache_size=2)
+    assert histogram.total == 6 and histogram.unmatched == 1
+    assert histogram.counts() == {("Ventura", "13.6.4"): 3, ("Sonoma", "14.3.1"): 1, None: 2}
+    # Darwin 22.6.0 alone doesn't determine the version, but does the name.
+    assert histogram.counts("name") == {"Ventura": 4, "Sonoma": 1, None: 1}
+
+    # Partial histograms from workers merge to the whole.
+    parts = [pickle.loads(pickle.dumps(macos_releases.ReleaseHistogram(hosts[i::2]))) for i in range(2)]
+    assert parts[0] + parts[1] == histogram
+    assert parts[0].merge(parts[1]).counts("build") == histogram.counts("build")
+    assert histogram.counts("full_name")["macOS Ventura 13.6.4"] == 3
+    for attribute in ("colour", "_fields", "__class__"):
+        with pytest.raises(KeyError):
+            histogram.counts(attribute)
+    assert macos_releases.ReleaseHistogram([{"name": ["Puma"]}] * 2).counts("name") == {"Puma": 2}
+
+
+def test_main_resolve_csv(tmp_path):
+    infile = tmp_path / "in.csv"
+    outfile = tmp_path / "out.csv"
+    infile.write_text("host,darwin,build,uname\n"
+                      "a,,22G513,\n"
+                      "b,5.1,,\n"
+                      "c,,,\"%s\"\n"
+                      "d,,,garbage\n" % _UNAME.version)
+    assert macos_releases.main(["resolve", "--batch-size", "2", "--input", str(infile), "--output", str(outfile)]) == 0
+    assert outfile.read_text().splitlines() == [
+        "host,darwin,build,uname,product,name,version",
+        "a,,22G513,,macOS,Ventura,13.6.4",
+        "b,5.1,,,Mac OS X,Puma,10.1.1",
+        "c,,,%s,macOS,Ventura,13.6.4" % _UNAME.version,
+        "d,,,garbage,,,"]
+
+def test_main_resolve_ndjson(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"build": "22G513"}\n\n{"darwin": "99.0.0"}\n'))
+    assert macos_releases.main(["resolve", "--format", "ndjson"]) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines == [{"build": "22G513", "product": "macOS", "name": "Ventura", "version": "13.6.4"},
+                     {"darwin": "99.0.0", "product": None, "name": None, "version": None}]
+
+
+def test_main_resolve_ndjson_malformed(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"build": "22G513"}\nnot json\n[1, 2]\n{"build": ["22G513"]}\n'))
+    assert macos_releases.main(["resolve", "--format", "ndjson", "--batch-size", "1"]) == 0
+    out, err = capsys.readouterr()
+    assert [json.loads(line)["version"] for line in out.splitlines()] == ["13.6.4", None]
+    assert "Skipped 2 malformed line(s), first at line 2" in err
+
+
+def test_parse_uname_version():
+    parsed = macos_releases.parse_uname_version(
+        "Darwin Kernel Version 23.3.0: Wed Dec 20 21:30:27 PST 2023; root:xnu-10002.81.5~7/RELEASE_ARM64_T6000")
+    assert parsed == ("23.3.0", "Wed Dec 20 21:30:27 PST 2023", "xnu-10002.81.5~7", "ARM64")
+    assert macos_releases.parse_uname_version(_UNAME.version).arch == "X86_64"
+    for malformed in ("Linux 6.1.0", ": x; root:xnu/REL", None, 23):
+        with pytest.raises(ValueError):
+            macos_releases.parse_uname_version(malformed)
+
+def test_resolve_uname_versions():
+    versions = [
+        "Darwin Kernel Version 23.1.0: Mon Oct  9 21:26:29 PDT 2023; root:xnu-10002.41.9~6/RELEASE_X86_64",
+        "not a uname",
+        ": x; root:xnu/REL",
+        None,
+        "Darwin Kernel Version 22.6.0: Wed Jul  5 22:21:56 PDT 2023; root:xnu-8796.141.3~6/RELEASE_ARM64_T8103",
+    ]
+    good, bad, empty, missing, ambiguous = macos_releases.resolve_uname_versions(versions)
+    assert [r.version for r in good.releases] == ["14.1.1", "14.1.1"]
+    assert bad.parsed is None and bad.releases == () and "not a uname" in bad.error
+    assert empty.error and empty.releases == () and missing.error and missing.releases == ()
+
+    # Memory stays bounded however many distinct strings there are.
+    results = macos_releases.resolve_uname_versions((f"junk {i}" for i in range(5000)), cache_size=100)
+    assert all(r.error for r in results)
+    assert [r.error is None for r in macos_releases.resolve_uname_versions(versions * 2, cache_size=1)] == \
+        [True, False, False, False, True] * 2
+    assert [r.version for r in ambiguous.releases] == ["13.5", "13.5.1", "13.5.2"]
+
+
+def test_build_key_order():
+    builds = ["Beaker1N5", "1H39", "6C115", "6C115a", "8J135", "8J1079", "22A380", "22G513", "22G513a"]
+    assert sorted(reversed(builds), key=macos_releases.build_key) == builds
+
+def test_lookup_range_version():
+    releases = macos_releases.lookup_range("version", "10.15", "13.6")
+    assert releases == sorted((r for r in macos_releases._BUILDS
+                               if (10, 15) <= macos_releases.version_key(r.version)[0] < (13, 6)),
+                              key=lambda r: macos_releases.version_key(r.version))
+    assert releases[0].version == "10.15" and releases[-1].version == "13.5.2"
+    assert "10.16 Beta" in {r.version for r in releases}
+    # Bounds include or exclude a release's pre-releases along with it.
+    assert [r.version for r in macos_releases.lookup_range("version", "11.7", "11.7.9")][-1] == "11.7.8"
+    assert macos_releases.lookup_range("version", "10.16", "11.0")[0].version == "10.16 Beta"
+    assert [r.version for r in macos_releases.lookup_range("version", "14.0 RC", "14.0.1")] == ["14.0 RC", "14.0 RC2", "14.0"]
+
+def test_lookup_range_darwin_and_build():
+    assert {r.name for r in macos_releases.lookup_range("darwin", "19", "20")} == {"Catalina"}
+    assert [r.build for r in macos_releases.lookup_range("build", "22G500", "22G600")] == ["22G513"]
+    assert macos_releases.lookup_range("build", "23D56") == lookup(build="23D56") + lookup(build="23D60")
+    with pytest.raises(KeyError):
+        macos_releases.lookup_range("kernel", "xnu-1")
+
+
+def test_latest_release():
+    pacific = datetime.timezone(datetime.timedelta(hours=-8))
+    assert macos_releases.latest_release(datetime.datetime(2023, 12, 1, tzinfo=pacific)).version == "14.2.1"
+    assert macos_releases.latest_release(datetime.datetime(2023, 7, 6, tzinfo=pacific)).version == "13.5.2"
+    assert macos_releases.latest_release(0) is None
+    release = lookup(build="22G513")[0]
+    assert macos_releases.latest_release(release.timestamp) == release
+
+def test_lookup_dates():
+    start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    stop = datetime.datetime(2023, 4, 1, tzinfo=datetime.timezone.utc)
+    assert [r.version for r in macos_releases.lookup_dates(start, stop)] == \
+        ["13.2", "13.2.1", "13.3", "13.3.1", "13.3.1 (a)"]
+    assert len(macos_releases.lookup_dates()) == len([r for r in macos_releases._BUILDS if r.date])
+    assert lookup(build="1H39")[0].timestamp is None
+
+
+def test_import_time():
+    # Import in a fresh interpreter, as with `python -X importtime`.
+    code = ("import sys; import macos_releases; "
+            "print(' '.join(sorted(sys.modules))); print(macos_releases._SNAPSHOT is not None)")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    modules, table_loaded = result.stdout.splitlines()
+    assert table_loaded == "False"
+    for module in ("datetime", "email.utils", "plistlib", "json", "argparse", "csv"):
+        assert module not in modules.split()
+
+    # Cumulative microseconds for the module itself, including compilation
+    # when no bytecode is cached; generous, to catch gross regressions.
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "macos_releases":
+            assert int(cumulative) < 100000
+
+
+_CONCURRENT_FIRST_USE = """
+import sys, threading, time
+import macos_releases
+
+macos_releases.ARTIFACT_PATH = sys.argv[1]
+calls = []
+for name in ("_load_builds", "_build_indexes"):
+    def counted(*args, _name=name, _function=getattr(macos_releases, name)):
+        calls.append(_name)
+        time.sleep(0.05)
+        return _function(*args)
+    setattr(macos_releases, name, counted)
+
+barrier = threading.Barrier(16)
+def use():
+    barrier.wait()
+    macos_releases.lookup(build="22G513")
+    macos_releases.lookup(build=macos_releases.Prefix("22G"))
+    macos_releases.lookup_range("version", "13.0", "14.0")
+    macos_releases.latest_release(1.7e9)
+    macos_releases.getMacOSRelease("22.6.0")
+
+threads = [threading.Thread(target=use) for _ in range(16)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(" ".join(sorted(calls)))
+"""
+
+def test_concurrent_first_use(tmp_path):
+    # Sixteen threads racing to first use build everything exactly once.
+    result = subprocess.run([sys.executable, "-c", _CONCURRENT_FIRST_USE, str(tmp_path / "missing.dat")],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["_build_indexes", "_load_builds"]
+
+def test_table_immutable():
+    builds = macos_releases._builds()
+    assert isinstance(builds, tuple)
+    for index in macos_releases._indexes().values():
+        assert all(isinstance(positions, tuple) for positions in index.values())
+    assert isinstance(macos_releases._sorted_index(macos_releases._snapshot(), "version")[1], tuple)
+    assert isinstance(macos_releases._date_index(macos_releases._snapshot())[1], tuple)
+
+
+def test_sortable_key():
+    for attribute in ("version", "build", "kernel"):
+        values = {getattr(r, attribute) for r in macos_releases._BUILDS} - {None}
+        key = macos_releases._KEYS[attribute]
+        assert sorted(values, key=lambda v: macos_releases.sortable_key(key(v))) == sorted(values, key=key)
+
+def test_export_sqlite(tmp_path):
+    path = str(tmp_path / "releases.db")
+    builds = list(macos_releases._BUILDS)
+    assert macos_releases.export_sqlite(path) == (len(builds), 0, 0)
+    assert macos_releases.export_sqlite(path) == (0, 0, 0)
+
+    # Only rows that changed are touched.
+    extra = OS("macOS", "Sonoma", "14.4", "23E214", "23.4.0")
+    assert macos_releases.export_sqlite(path, builds[1:] + [extra]) == (1, len(builds) - 1, 1)
+
+    with sqlite3.connect(path) as connection:
+        versions = [v for v, in connection.execute("SELECT version FROM releases ORDER BY version_key")]
+        plan = " ".join(str(row) for row in connection.execute("EXPLAIN QUERY PLAN SELECT * FROM releases WHERE build = '22G513'"))
+    assert versions == [r.version for r in sorted(builds[1:] + [extra], key=lambda r: macos_releases.version_key(r.version))]
+    assert "releases_build" in plan
+
+def test_sqlite_backend(tmp_path):
+    path = str(tmp_path / "releases.db")
+    assert macos_releases.main(["sqlite", "--output", path]) == 0
+    backend = macos_releases.SQLiteBackend(path)
+    for args in ({"build": "22G513"}, {"name": ["Ventura", "Sonoma"]}, {"build": Prefix("22G5")},
+                 {"kernel": Not(Prefix("xnu-8"))}, {"kernel": In(None, "xnu-10002.41.9~6")}, {}):
+        assert backend.lookup(**args) == lookup(**args)
+    assert backend.lookup({"name": "Ventura"}, {"darwin": Prefix("23.")}, product="macOS") == \
+        lookup({"name": "Ventura"}, {"darwin": Prefix("23.")}, product="macOS")
+    with pytest.raises(KeyError):
+        backend.lookup(colour="blue")
+    backend.close()
+
+
+async def _request(reader, writer, method, target, body=b"", headers=()):
+    """Send a request on a kept-alive connection, returning status, headers and body."""
+    lines = [f"{method} {target} HTTP/1.1", "Host: localhost", f"Content-Length: {len(body)}", *headers]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+    head = (await reader.readuntil(b"\r\n\r\n")).decode().split("\r\n")
+    fields = dict(line.split(": ", 1) for line in head[1:] if line)
+    return int(head[0].split()[1]), fields, await reader.readexactly(int(fields["Content-Length"]))
+
+def test_release_server():
+    async def main():
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        service = macos_releases.ReleaseServer(idle_timeout=0.5)
+        server = await service.start(port=0)
+        async with server:
+            address = server.sockets[0].getsockname()[:2]
+            reader, writer = await asyncio.open_connection(*address)
+            status, headers, body = await _request(reader, writer, "GET", "/lookup?build=22G513")
+            assert status == 200 and headers["Connection"] == "keep-alive"
+            assert [r["version"] for r in json.loads(body)] == ["13.6.4"]
+            assert headers["ETag"] == f'"{macos_releases.dataset_version()}"'
+
+            # Same connection: conditional requests, batches and errors.
+            status, _, body = await _request(reader, writer, "GET", "/lookup?build=23D60",
+                                             headers=[f"If-None-Match: {headers['ETag']}"])
+            assert status == 304 and body == b""
+            queries = json.dumps([["22G513", "22.6.0", None], {"name": ["Puma", "Cheetah"]}, {"build": "nonesuch"}])
+            status, _, body = await _request(reader, writer, "POST", "/lookup", queries.encode())
+            results = json.loads(body)
+            assert status == 200 and [len(r) for r in results] == [1, len(lookup(name=In("Puma", "Cheetah"))), 0]
+            assert "/lookup" not in service._cache  # POST responses aren't cached
+            status, _, body = await _request(reader, writer, "GET", "/darwin/22.6.0")
+            assert json.loads(body)["version"] == macos_releases.getMacOSRelease("22.6.0")[1]
+            assert (await _request(reader, writer, "GET", "/darwin/99.0.0"))[0] == 404
+            assert (await _request(reader, writer, "GET", "/nope", headers=["If-None-Match: *"]))[0] == 404
+            assert (await _request(reader, writer, "GET", "/lookup?colour=blue"))[0] == 400
+            assert (await _request(reader, writer, "POST", "/lookup", b"{"))[0] == 400
+            assert (await _request(reader, writer, "DELETE", "/version"))[0] == 405
+
+            status, headers, _ = await _request(reader, writer, "GET", "/version", headers=["Connection: close"])
+            assert status == 200 and headers["Connection"] == "close"
+            assert await reader.read() == b""
+            writer.close()
+
+            for length in ("abc", "-5"):
+                reader, writer = await asyncio.open_connection(*address)
+                writer.write(f"POST /lookup HTTP/1.1\r\nContent-Length: {length}\r\n\r\n[]".encode())
+                assert (await reader.read()).startswith(b"HTTP/1.1 400 ")
+                writer.close()
+
+            # HEAD gives GET's length without the content.
+            length = (await _request(*await asyncio.open_connection(*address), "GET", "/version"))[1]["Content-Length"]
+            reader, writer = await asyncio.open_connection(*address)
+            writer.write(b"HEAD /version HTTP/1.1\r\nConnection: close\r\n\r\n")
+            response = await reader.read()
+            assert f"Content-Length: {length}\r\n".encode() in response and response.endswith(b"\r\n\r\n")
+            writer.close()
+
+            # Truncated and stalled bodies close the connection.
+            for close in (True, False):
+                reader, writer = await asyncio.open_connection(*address)
+                writer.write(b"POST /lookup HTTP/1.1\r\nContent-Length: 100\r\n\r\n[]")
+                if close:
+                    writer.write_eof()
+                assert await asyncio.wait_for(reader.read(), 5) == b""
+                writer.close()
+            assert errors == []
+
+    asyncio.run(main())
+
+
+def test_validate_table():
+    assert macos_releases.validate_table(macos_releases._load_builds()) == []
+    problems = macos_releases.validate_table([
+        OS("macOS", "Sonoma", "14.1", "23B74", "23.1.0", date="Mon Oct 9 21:27:27 PDT 2023"),
+        OS("macOS", "Sonoma", "14.1", "23B74", "23.1.0"),
+        OS("macOS", "Sonoma", "14.2", "23C64", "22.1.0"),
+        OS("macOS", "Sonoma", "14.3", "23D56", "23.3.0", date="Someday"),
+    ])
+    assert len(problems) == 3
+    assert "Duplicate build 23B74" in problems[0]
+    assert "Darwin version goes backwards" in problems[1]
+    assert "Unparsable date" in problems[2]
+
+def test_compile_table(tmp_path):
+    path = str(tmp_path / "table.dat")
+    macos_releases.compile_table(path)
+    builds, indexes = macos_releases._load_artifact(path)
+    assert builds == tuple(macos_releases._load_builds())
+    assert indexes == macos_releases._build_indexes(builds)
+
+    # Artifacts for other sources, or damaged ones, are ignored.
+    with open(path, "rb") as f:
+        data = f.read()
+    with pytest.raises(ValueError):
+        macos_releases._unpack_table(data, macos_releases._source_digest() + 1)
+    with open(path, "wb") as f:
+        f.write(data[:len(data) // 2])
+    assert macos_releases._load_artifact(path) is None
+
+def test_compile_table_invalid(tmp_path, monkeypatch):
+    monkeypatch.setattr(macos_releases, "_load_builds", lambda: [OS("macOS", "Sonoma", "14.3", "23D56", "23.3.0", date="x")])
+    with pytest.raises(ValueError):
+        macos_releases.compile_table(str(tmp_path / "table.dat"))
+
+
+def _worker_lookup(build):
+    return [r.version for r in macos_releases.lookup(build=build)], macos_releases._SNAPSHOT is not None
+
+def test_share_table():
+    block = macos_releases.share_table()
+    try:
+        with concurrent.futures.ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn"),
+                                                    initializer=macos_releases.attach_table,
+                                                    initargs=(block.name,)) as pool:
+            assert pool.submit(_worker_lookup, "22G513").result() == (["13.6.4"], True)
+    finally:
+        block.close()
+        block.unlink()
+
+
+_SUPPLEMENT = [
+    {"product": "macOS", "name": "Sonoma", "version": "14.4", "build": "23E214", "darwin": "23.4.0",
+     "kernel": "xnu-10063.101.15~2", "date": "Tue Feb 20 21:28:20 PST 2024"},
+    {"product": "macOS", "name": "Ventura", "version": "13.6.4", "build": "22G513", "darwin": "22.6.0",
+     "kernel": "xnu-8796.141.3.703.2~3", "date": "Sun Dec 17 22:18:09 PST 2023"},
+]
+
+def test_load_supplement(tmp_path, monkeypatch):
+    path = tmp_path / "extra.json"
+    path.write_text(json.dumps({"releases": _SUPPLEMENT}))
+
+    # Warm the derived structures, which are then updated rather than rebuilt.
+    lookup(build=Prefix("23")), macos_releases.lookup_range("version", "14"), macos_releases.getMacOSRelease("23.3.0")
+    macos_releases.latest_release(datetime.datetime(2024, 1, 1))
+    old = macos_releases._snapshot()
+    monkeypatch.setattr(macos_releases, "_build_indexes", None)
+    try:
+        assert macos_releases.load_supplement(str(path)) == 2
+        assert macos_releases._builds()[-1].build == "23E214"
+        assert len(macos_releases._builds()) == len(old.builds) + 1
+        assert lookup(build=Prefix("23E"))[0].version == "14.4"
+        assert macos_releases.lookup_range("version", "14.3.1")[-1].build == "23E214"
+        assert macos_releases.getMacOSRelease("23.4.0") == ("Sonoma", "14.4")
+        assert macos_releases.latest_release(datetime.datetime(2024, 3, 1, tzinfo=datetime.timezone.utc)).build == "23E214"
+        # The override replaced the release in place.
+        assert [r.kernel for r in lookup(build="22G513")] == ["xnu-8796.141.3.703.2~3"]
+        assert lookup(kernel="xnu-8796.141.3.703.2~2", build="22G513") == []
+        assert [r.build for r in old.builds] == [r.build for r in macos_releases._BUILDS[:-1]]
+    finally:
+        macos_releases.load_supplement(None)
+    assert macos_releases._snapshot() is old
+
+def test_load_supplement_invalid(tmp_path):
+    pytest.importorskip("tomllib")
+    path = tmp_path / "extra.toml"
+    path.write_text('[[releases]]\nproduct = "macOS"\nname = "Sonoma"\nversion = "14.4"\nbuild = "23E214"\ndarwin = "22.0.0"\n')
+    old = macos_releases._snapshot()
+    with pytest.raises(ValueError, match="Darwin version goes backwards"):
+        macos_releases.load_supplement(str(path))
+    path.write_text('[[releases]]\nproduct = "macOS"\nname = "Sonoma"\nversion = "14.4"\ncolour = "blue"\n')
+    with pytest.raises(ValueError):
+        macos_releases.load_supplement(str(path))
+    assert macos_releases._snapshot() is old
+
+def test_supplement_toml_unavailable(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    path = tmp_path / "extra.toml"
+    path.write_text("releases = []\n")
+    with pytest.raises(ValueError, match="3.11"):
+        macos_releases.load_supplement(str(path))
+    watcher = macos_releases.SupplementWatcher(str(path))
+    assert not watcher.check() and "3.11" in str(watcher.error)
+
+def test_supplement_watcher(tmp_path):
+    path = tmp_path / "extra.json"
+    with macos_releases.SupplementWatcher(str(path), interval=60) as watcher:
+        try:
+            assert not watcher.check()
+            path.write_text(json.dumps(_SUPPLEMENT[:1]))
+            assert watcher.check() and lookup(build="23E214")
+            assert not watcher.check()
+
+            # A bad file leaves the loaded releases in place.
+            path.write_text("[")
+            assert not watcher.check() and isinstance(watcher.error, ValueError)
+            assert lookup(build="23E214")
+
+            path.unlink()
+            assert watcher.check() and not lookup(build="23E214")
+        finally:
+            macos_releases.load_supplement(None)
+
+
+def test_lookup_predicates():
+    builds = macos_releases._BUILDS
+    assert lookup(name=["Ventura", "Sonoma"]) == [r for r in builds if r.name in ("Ventura", "Sonoma")]
+    assert lookup(name=In("Ventura", "Sonoma")) == lookup(name={"Ventura", "Sonoma"})
+    assert lookup(build=Prefix("22G5")) == [r for r in builds if r.build.startswith("22G5")]
+    assert lookup(product=Not("Mac OS X"), darwin=Prefix("1.")) == []
+    assert lookup(name="Sonoma", version=Not(Prefix("14.0"))) == \
+        [r for r in builds if r.name == "Sonoma" and not r.version.startswith("14.0")]
+    assert lookup(kernel=Not(None)) == [r for r in builds if r.kernel is not None]
+
+def test_columnar_table():
+    numpy = pytest.importorskip("numpy")
+    columns = macos_releases.columnar_table()
+    assert macos_releases.columnar_table() is columns
+    assert len(columns) == len(macos_releases._BUILDS)
+    for args in ({"build": "22G513"}, {"name": ["Ventura", "Sonoma"]}, {"build": Prefix("22G5")},
+                 {"product": Not("Mac OS X"), "darwin": Prefix("23.")}, {"kernel": None}, {"build": "nonesuch"}):
+        assert columns.lookup(**args) == lookup(**args)
+
+    # Ranks and timestamps follow version_key() and OS.timestamp.
+    builds = macos_releases._BUILDS
+    order = numpy.argsort(columns.ranks["version"], kind="stable")
+    assert [builds[i].version for i in order] == [r.version for r in sorted(builds, key=lambda r: macos_releases.version_key(r.version))]
+    assert columns.timestamps[-1] == builds[-1].timestamp
+
+def test_columnar_match_rows():
+    numpy = pytest.importorskip("numpy")
+    columns = macos_releases.columnar_table()
+    rows = columns.match_rows(darwin=["22.6.0", "5.1", "99.0.0", None], build=["22G513", "5M28", "22G513", "22G513"])
+    assert rows[2:].tolist() == [-1, -1]
+    assert [macos_releases._BUILDS[i] for i in rows[:2]] == lookup(build="22G513") + lookup(darwin="5.1")
+
+    codes = columns.encode("build", numpy.array(["23D60", "nonesuch"]))
+    assert codes[1] == -2
+    assert columns.decode("build", codes).tolist() == ["23D60", None]
+    assert columns.match_rows(build=codes).tolist() == [columns.positions(build="23D60")[0], -1]
+
+
+def test_to_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    table = macos_releases.to_arrow()
+    builds = macos_releases._BUILDS
+    assert table.num_rows == len(builds)
+    assert pyarrow.types.is_dictionary(table.schema.field("build").type)
+    assert table.column("build").to_pylist() == [r.build for r in builds]
+    assert table.column("kernel").null_count == sum(r.kernel is None for r in builds)
+    assert table.column("timestamp")[-1].as_py() == builds[-1].datetime
+
+    ranked = table.sort_by([("version_rank", "ascending")]).column("version").to_pylist()
+    assert [macos_releases.version_key(v) for v in ranked] == sorted(macos_releases.version_key(r.version) for r in builds)
+
+def test_resolve_column():
+    pyarrow = pytest.importorskip("pyarrow")
+    resolved = macos_releases.resolve_column(pyarrow.array(["22.6.0", None, "99.0.0", "5.1", "13.4.0"]))
+    assert resolved.column_names == ["product", "name", "version"]
+    assert resolved.column("version").to_pylist() == \
+        [macos_releases.getMacOSRelease("22.6.0")[1], None, None, macos_releases.getMacOSRelease("5.1")[1], "10.9.5"]
+    with pytest.raises(KeyError):
+        macos_releases.resolve_column(pyarrow.array(["14.3"]), "version")
+
+    pandas = pytest.importorskip("pandas")
+    series = pandas.Series(["22G513", "nonesuch"], index=[10, 11], dtype="category")
+    frame = macos_releases.resolve_column(series, "build", fields=("name", "version"))
+    assert list(frame.index) == [10, 11]
+    assert frame["version"].tolist()[0] == "13.6.4" and pandas.isna(frame["version"].tolist()[1])
+
+
+def test_lookup_alternatives():
+    builds = macos_releases._BUILDS
+    assert lookup({"name": "Ventura"}, {"darwin": Prefix("23.")}, product="macOS") == \
+        [r for r in builds if r.name == "Ventura" or r.darwin.startswith("23.")]
+    assert lookup({"build": "22G513"}, {"build": "22G513", "darwin": "22.6.0"}) == lookup(build="22G513")
+    with pytest.raises(KeyError):
+        lookup({"colour": "blue"})
+    with pytest.raises(TypeError):
+        lookup("Sonoma")
+
+def test_lookup_plan_order():
+    # The selective build predicate drives, so product is only checked once.
+    checked = []
+
+    class Spy(Not):
+        def matches(self, value):
+            checked.append(value)
+            return super().matches(value)
+
+    assert len(lookup(product=Spy("Mac OS X"), build=Prefix("22G51"))) == 1
+    assert checked == ["macOS"]
+
+
+def test_search_prefix():
+    assert [r.build for r in macos_releases.search_prefix("8J")] == ["8J135", "8J1079", "8J2135a", "8J5107"]
+    assert [r.build for r in macos_releases.search_prefix("22G5")] == ["22G513"]
+    assert macos_releases.search_prefix("99") == []
+    kernels = macos_releases.search_prefix("xnu-10002.41", "kernel")
+    assert [r.build for r in kernels] == ["23B74", "23B81", "23B92", "23B2082", "23B2091"]
+    with pytest.raises(KeyError):
+        macos_releases.search_prefix("Son", "name")
+
+
+def test_resolve_nearest():
+    nearest = macos_releases.resolve_nearest
+    assert nearest(build="22G513") == (lookup(build="22G513")[0], "exact")
+    assert nearest(darwin="22.6.0").release.version == "13.5"
+    assert nearest(build="22G630") == (lookup(build="22G513")[0], "high")
+    assert nearest(build="22H10") == (lookup(build="22G513")[0], "medium")
+    assert nearest(build="99A1").confidence == "low"
+    assert nearest(darwin="22.7.0") == (lookup(build="22G513")[0], "medium")
+    assert nearest(kernel="xnu-8796.141.3.704.1~1") == (lookup(build="22G513")[0], "medium")
+    assert nearest(build="0A1") is None
+    # A release contradicting the other attributes given is a poor match.
+    assert nearest(build="22G513", darwin="23.0.0") == (lookup(build="22G513")[0], "low")
+    assert nearest(build="22G513", kernel="xnu-1.0~1").confidence == "low"
+    assert nearest(build="22G630", darwin="22.6.0").confidence == "high"
+    assert nearest(build="22G630", darwin="22.5.0").confidence == "low"
+    with pytest.raises(ValueError):
+        nearest()
+
+
+def test_lookup_cache():
+    cache = macos_releases.LookupCache(maxsize=2)
+    assert cache(build="22G513", darwin="22.6.0") == tuple(lookup(build="22G513"))
+    assert cache(darwin="22.6.0", build="22G513") is cache(build="22G513", darwin="22.6.0")
+    assert cache(name=["Sonoma", "Ventura"]) == cache(name=In("Ventura", "Sonoma"))
+    cache(name="Sonoma")
+    assert cache.cache_info() == (3, 3, 1, 2, 2)
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 0, 2, 0)
+    with pytest.raises(KeyError):
+        cache(colour="blue")
+
+def test_lookup_cache_threads():
+    cache = macos_releases.LookupCache(maxsize=8)
+    builds = [r.build for r in macos_releases._BUILDS[:32]]
+
+    def work(i):
+        return [cache(build=b) == tuple(lookup(build=b)) for b in builds[i % 4::4] * 20]
+
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        assert all(all(results) for results in pool.map(work, range(32)))
+    info = cache.cache_info()
+    assert info.hits + info.misses == 32 * 8 * 20 and info.currsize == 8
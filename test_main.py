@@ -4,11 +4,16 @@ def test_getMacOS():
     assert getMacOSRelease("18.2.0") == ('Mojave', '10.14.1')
 
 def test_getBetaMacOS():
-    assert getMacOSRelease("20.0.0") == ('Big Sur', '11.0 beta 1')
+    assert getMacOSRelease("20.0.0") == ('Big Sur', '10.16 Beta')
 
 def test_firstRelease():
     assert getMacOSRelease("5.1") == ('Puma', '10.1.1')
 
+def test_unameRelease():
+    assert getMacOSRelease("13.4.0") == ('Mavericks', '10.9.5')
+    assert getMacOSRelease("14.0.0") == ('Yosemite', '10.10')
+    assert getMacOSRelease("6.0.1") == ('Jaguar', '10.2')
+
 
 # def test_getMyMacOS():
 #     assert getMacOSRelease("") == ('Catalina', '10.15.5')
\ No newline at end of file